@@ -2,14 +2,19 @@
 Audit log query endpoints.
 """
 import uuid
-from typing import Optional, List
-from datetime import datetime, timedelta
+from typing import Annotated, Literal, Optional, List
+from datetime import datetime
+import orjson
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc, text
-from pydantic import BaseModel
+from sqlalchemy import select, text, tuple_
+from pydantic import BaseModel, Field
 
 from core.database import get_db
+from core.pagination import decode_cursor, encode_cursor
+from core.streaming import iter_json_array
+from models.database import AuditLog
 
 router = APIRouter()
 
@@ -31,151 +36,194 @@ class AuditLogEntry(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# Plain column select: rows are streamed straight to orjson as mappings
+# with the same fields as AuditLogEntry
+_audit_columns = select(*AuditLog.__table__.c)
+
+
 class AuditLogResponse(BaseModel):
-    """Paginated audit log response."""
-    total: int
-    page: int
-    page_size: int
+    """Keyset-paginated audit log response."""
     entries: List[AuditLogEntry]
+    next_cursor: Optional[str] = None
+    approximate_total: Optional[int] = None
+
 
+class AuditLogFilter(BaseModel):
+    """Query parameters for listing audit logs."""
+    table_name: Optional[str] = Field(None, description="Filter by table name")
+    record_id: Optional[uuid.UUID] = Field(None, description="Filter by record ID")
+    action: Optional[Literal["INSERT", "UPDATE", "DELETE"]] = Field(None, description="Filter by action")
+    user_id: Optional[uuid.UUID] = Field(None, description="Filter by user ID")
+    start_date: Optional[datetime] = Field(None, description="Filter by start date (inclusive)")
+    end_date: Optional[datetime] = Field(None, description="Filter by end date (exclusive)")
+    cursor: Optional[str] = Field(None, description="Opaque cursor from a previous page's next_cursor")
+    page_size: int = Field(50, ge=1, le=1000, description="Page size")
 
-@router.get("/audit-logs", response_model=AuditLogResponse)
+
+@router.get(
+    "/audit-logs",
+    response_model=None,
+    response_class=StreamingResponse,
+    responses={200: {"model": AuditLogResponse}}
+)
 async def get_audit_logs(
-    table_name: Optional[str] = Query(None, description="Filter by table name"),
-    record_id: Optional[uuid.UUID] = Query(None, description="Filter by record ID"),
-    action: Optional[str] = Query(None, description="Filter by action (INSERT, UPDATE, DELETE)"),
-    user_id: Optional[uuid.UUID] = Query(None, description="Filter by user ID"),
-    start_date: Optional[datetime] = Query(None, description="Filter by start date"),
-    end_date: Optional[datetime] = Query(None, description="Filter by end date"),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(50, ge=1, le=1000, description="Page size"),
+    filters: Annotated[AuditLogFilter, Query()],
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Query audit logs with filtering and pagination.
+    Query audit logs with filtering and keyset pagination.
+
+    Entries are ordered newest first by (timestamp, id). Pass the returned
+    next_cursor to fetch the following page; it is null on the last page.
+    approximate_total is the planner's row estimate for the whole table and
+    is only returned when no filters are applied. The body has the shape of
+    AuditLogResponse and is streamed as rows arrive from the database.
 
     Supports filtering by:
     - table_name: Table that was modified
     - record_id: ID of the record that was modified
     - action: Type of action (INSERT, UPDATE, DELETE)
     - user_id: User who performed the action
-    - start_date: Start of date range
-    - end_date: End of date range
+    - start_date: Start of date range (inclusive)
+    - end_date: End of date range (exclusive)
     """
-    # Build filter conditions
     conditions = []
+    if filters.table_name:
+        conditions.append(AuditLog.table_name == filters.table_name)
+    if filters.record_id:
+        conditions.append(AuditLog.record_id == filters.record_id)
+    if filters.action:
+        conditions.append(AuditLog.action == filters.action)
+    if filters.user_id:
+        conditions.append(AuditLog.user_id == filters.user_id)
+    if filters.start_date:
+        conditions.append(AuditLog.timestamp >= filters.start_date)
+    if filters.end_date:
+        conditions.append(AuditLog.timestamp < filters.end_date)
+
+    filtered = bool(conditions)
+    page_size = filters.page_size
+    if filters.cursor:
+        cursor_ts, cursor_id = decode_cursor(filters.cursor)
+        conditions.append(tuple_(AuditLog.timestamp, AuditLog.id) < tuple_(cursor_ts, cursor_id))
 
-    if table_name:
-        conditions.append(text("table_name = :table_name"))
-    if record_id:
-        conditions.append(text("record_id = :record_id"))
-    if action:
-        conditions.append(text("action = :action"))
-    if user_id:
-        conditions.append(text("user_id = :user_id"))
-    if start_date:
-        conditions.append(text("timestamp >= :start_date"))
-    if end_date:
-        conditions.append(text("timestamp <= :end_date"))
-
-    # Build parameters
-    params = {}
-    if table_name:
-        params["table_name"] = table_name
-    if record_id:
-        params["record_id"] = str(record_id)
-    if action:
-        params["action"] = action
-    if user_id:
-        params["user_id"] = str(user_id)
-    if start_date:
-        params["start_date"] = start_date
-    if end_date:
-        params["end_date"] = end_date
-
-    # Build WHERE clause
-    where_clause = " AND ".join(str(c) for c in conditions) if conditions else "1=1"
-
-    # Get total count
-    count_query = text(f"SELECT COUNT(*) FROM audit_log WHERE {where_clause}")
-    count_result = await db.execute(count_query, params)
-    total = count_result.scalar() or 0
-
-    # Get paginated results
-    offset = (page - 1) * page_size
-    query = text(f"""
-        SELECT * FROM audit_log
-        WHERE {where_clause}
-        ORDER BY timestamp DESC
-        LIMIT :limit OFFSET :offset
-    """)
-    params["limit"] = page_size
-    params["offset"] = offset
-
-    result = await db.execute(query, params)
-    rows = result.mappings().all()
-
-    # Convert to Pydantic models
-    entries = [
-        AuditLogEntry(
-            id=row["id"],
-            table_name=row["table_name"],
-            record_id=row["record_id"],
-            action=row["action"],
-            user_id=row["user_id"],
-            old_values=row["old_values"],
-            new_values=row["new_values"],
-            changed_fields=row["changed_fields"],
-            timestamp=row["timestamp"],
-            ip_address=row["ip_address"],
-            user_agent=row["user_agent"]
+    approximate_total = None
+    if not filtered:
+        estimate = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'audit_log'")
         )
-        for row in rows
-    ]
-
-    return AuditLogResponse(
-        total=total,
-        page=page,
-        page_size=page_size,
-        entries=entries
+        approximate_total = max(estimate.scalar() or 0, 0)
+
+    # Fetch one extra row to know whether another page exists
+    query = (
+        _audit_columns
+        .where(*conditions)
+        .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+        .limit(page_size + 1)
     )
+    result = await db.stream(query)
+
+    page_state = {"last": None, "has_more": False}
+
+    async def page_rows():
+        count = 0
+        async for row in result.mappings():
+            if count == page_size:
+                page_state["has_more"] = True
+                break
+            page_state["last"] = row
+            count += 1
+            yield dict(row)
 
+    async def body():
+        try:
+            yield b'{"entries":'
+            async for chunk in iter_json_array(page_rows()):
+                yield chunk
+        finally:
+            await result.close()
+
+        last = page_state["last"]
+        next_cursor = None
+        if page_state["has_more"] and last is not None:
+            next_cursor = encode_cursor(last["timestamp"], last["id"])
+        yield (
+            b',"next_cursor":' + orjson.dumps(next_cursor)
+            + b',"approximate_total":' + orjson.dumps(approximate_total)
+            + b"}"
+        )
 
-@router.get("/audit-logs/record/{record_id}", response_model=List[AuditLogEntry])
+    return StreamingResponse(body(), media_type="application/json")
+
+
+@router.get(
+    "/audit-logs/record/{record_id}",
+    response_model=None,
+    response_class=StreamingResponse,
+    responses={200: {"model": List[AuditLogEntry]}}
+)
 async def get_record_audit_history(
     record_id: uuid.UUID,
+    limit: int = Query(500, ge=1, le=5000, description="Maximum number of entries to return"),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get complete audit history for a specific record.
+    Get audit history for a specific record.
 
-    Returns all audit log entries for the given record ID, ordered by timestamp.
+    Returns up to `limit` audit log entries for the given record ID, newest
+    first, streamed as a JSON array of AuditLogEntry objects.
     """
-    query = text("""
-        SELECT * FROM audit_log
-        WHERE record_id = :record_id
-        ORDER BY timestamp DESC
-    """)
-
-    result = await db.execute(query, {"record_id": str(record_id)})
-    rows = result.mappings().all()
-
-    return [
-        AuditLogEntry(
-            id=row["id"],
-            table_name=row["table_name"],
-            record_id=row["record_id"],
-            action=row["action"],
-            user_id=row["user_id"],
-            old_values=row["old_values"],
-            new_values=row["new_values"],
-            changed_fields=row["changed_fields"],
-            timestamp=row["timestamp"],
-            ip_address=row["ip_address"],
-            user_agent=row["user_agent"]
-        )
-        for row in rows
-    ]
+    query = (
+        _audit_columns
+        .where(AuditLog.record_id == record_id)
+        .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+        .limit(limit)
+    )
+    result = await db.stream(query)
+
+    async def rows():
+        try:
+            async for row in result.mappings():
+                yield dict(row)
+        finally:
+            await result.close()
+
+    return StreamingResponse(iter_json_array(rows()), media_type="application/json")
+
+
+# Stats windows at or below this many days are computed from audit_log
+# directly so they are never stale; longer windows use the daily rollup
+LIVE_STATS_MAX_DAYS = 1
+
+_LIVE_STATS_QUERY = text("""
+    SELECT
+        now() - make_interval(days => CAST(:days AS integer)) AS start_date,
+        now() AS end_date,
+        COUNT(*) AS total_entries,
+        COUNT(DISTINCT table_name) AS tables_modified,
+        COUNT(DISTINCT user_id) AS unique_users,
+        COUNT(*) FILTER (WHERE action = 'INSERT') AS inserts,
+        COUNT(*) FILTER (WHERE action = 'UPDATE') AS updates,
+        COUNT(*) FILTER (WHERE action = 'DELETE') AS deletes
+    FROM audit_log
+    WHERE timestamp >= now() - make_interval(days => CAST(:days AS integer))
+""")
+
+# COUNT(DISTINCT) here runs over per-day (action, table, user) buckets rather
+# than raw audit rows, so exact cardinalities stay cheap for long windows
+_ROLLUP_STATS_QUERY = text("""
+    SELECT
+        current_date - CAST(:days AS integer) AS start_date,
+        now() AS end_date,
+        COALESCE(SUM(entry_count), 0) AS total_entries,
+        COUNT(DISTINCT table_name) AS tables_modified,
+        COUNT(DISTINCT user_id) AS unique_users,
+        COALESCE(SUM(entry_count) FILTER (WHERE action = 'INSERT'), 0) AS inserts,
+        COALESCE(SUM(entry_count) FILTER (WHERE action = 'UPDATE'), 0) AS updates,
+        COALESCE(SUM(entry_count) FILTER (WHERE action = 'DELETE'), 0) AS deletes
+    FROM audit_log_daily
+    WHERE day >= current_date - CAST(:days AS integer)
+""")
 
 
 @router.get("/audit-logs/stats")
@@ -186,29 +234,20 @@ async def get_audit_stats(
     """
     Get audit log statistics.
 
-    Returns summary statistics for the specified number of days.
+    Windows of up to LIVE_STATS_MAX_DAYS are aggregated directly from
+    audit_log and cover the last `days` * 24 hours exactly. Longer windows
+    run from midnight `days` days ago until now and are read from the
+    audit_log_daily rollup. The rollup is refreshed in the background, so
+    its most recent entries may not be counted yet.
     """
-    start_date = datetime.utcnow() - timedelta(days=days)
-
-    query = text("""
-        SELECT
-            COUNT(*) as total_entries,
-            COUNT(DISTINCT table_name) as tables_modified,
-            COUNT(DISTINCT user_id) as unique_users,
-            SUM(CASE WHEN action = 'INSERT' THEN 1 ELSE 0 END) as inserts,
-            SUM(CASE WHEN action = 'UPDATE' THEN 1 ELSE 0 END) as updates,
-            SUM(CASE WHEN action = 'DELETE' THEN 1 ELSE 0 END) as deletes
-        FROM audit_log
-        WHERE timestamp >= :start_date
-    """)
-
-    result = await db.execute(query, {"start_date": start_date})
+    query = _LIVE_STATS_QUERY if days <= LIVE_STATS_MAX_DAYS else _ROLLUP_STATS_QUERY
+    result = await db.execute(query, {"days": days})
     row = result.mappings().one()
 
     return {
         "period_days": days,
-        "start_date": start_date.isoformat(),
-        "end_date": datetime.utcnow().isoformat(),
+        "start_date": row["start_date"].isoformat(),
+        "end_date": row["end_date"].isoformat(),
         "total_entries": row["total_entries"],
         "tables_modified": row["tables_modified"],
         "unique_users": row["unique_users"],
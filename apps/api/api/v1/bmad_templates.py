@@ -2,10 +2,14 @@
 
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
-from services.bmad_template_service import BMAdTemplateService, WorkflowTemplate
+from services.bmad_template_service import (
+    BMAdTemplateService,
+    WorkflowTemplate,
+    get_template_service,
+)
 
 
 router = APIRouter(prefix="/bmad/templates", tags=["bmad-templates"])
@@ -27,11 +31,15 @@ class TemplateImportResponse(BaseModel):
 
 
 @router.post("/import", status_code=status.HTTP_201_CREATED, response_model=TemplateImportResponse)
-async def import_template(request: TemplateImportRequest) -> TemplateImportResponse:
+async def import_template(
+    request: TemplateImportRequest,
+    service: BMAdTemplateService = Depends(get_template_service),
+) -> TemplateImportResponse:
     """Import BMAD workflow template from filesystem.
 
     Args:
         request: Template import request with file path and validation settings
+        service: BMAD template service dependency
 
     Returns:
         TemplateImportResponse with imported template or errors
@@ -40,9 +48,6 @@ async def import_template(request: TemplateImportRequest) -> TemplateImportRespo
         HTTPException: 400 for validation errors, 500 for unexpected errors
     """
     try:
-        # Initialize service
-        service = BMAdTemplateService()
-
         # Import template
         file_path = Path(request.template_path)
         workflow_template, errors = service.import_template(
@@ -2,83 +2,117 @@
 Client management API endpoints.
 """
 import uuid
-from typing import List, Optional
+from typing import Annotated, List
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import EntityCache, cache_delete_prefix
 from core.database import get_db
 from models.schemas import (
     ClientCreate,
     ClientUpdate,
     ClientResponse,
+    ClientListParams,
     SuccessResponse,
-    BusinessDomain
 )
+from api.v1.services import SERVICE_LIST_CACHE_PREFIX
 from repositories.client_repository import ClientRepository
 
 router = APIRouter()
 
 
+def get_client_repo(db: AsyncSession = Depends(get_db)) -> ClientRepository:
+    """Get client repository instance."""
+    return ClientRepository(db)
+
+
+_client_list_adapter = TypeAdapter(List[ClientResponse])
+
+# Caches single-client reads and IDs recently found not to exist
+_client_cache = EntityCache("client")
+
+
 @router.post("/clients", response_model=SuccessResponse, status_code=status.HTTP_201_CREATED)
 async def create_client(
     client_data: ClientCreate,
-    db: AsyncSession = Depends(get_db)
+    repo: ClientRepository = Depends(get_client_repo)
 ) -> SuccessResponse:
     """Create a new client."""
-    repo = ClientRepository(db)
     client = await repo.create(
         name=client_data.name,
         business_domain=client_data.business_domain.value
     )
+    await _client_cache.invalidate(client.id)
+
     return SuccessResponse(
         data=ClientResponse.model_validate(client),
         message="Client created successfully"
     )
 
 
-@router.get("/clients", response_model=SuccessResponse)
+@router.get(
+    "/clients",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": SuccessResponse}}
+)
 async def list_clients(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    business_domain: Optional[BusinessDomain] = Query(None, description="Filter by business domain"),
-    name_search: Optional[str] = Query(None, description="Search clients by name"),
-    db: AsyncSession = Depends(get_db)
-) -> SuccessResponse:
+    params: Annotated[ClientListParams, Query()],
+    repo: ClientRepository = Depends(get_client_repo)
+) -> ORJSONResponse:
     """List clients with optional filtering."""
-    repo = ClientRepository(db)
-
-    if name_search:
-        clients = await repo.search_by_name(name_search, skip, limit)
-    elif business_domain:
-        clients = await repo.get_by_business_domain(business_domain.value, skip, limit)
+    if params.name_search:
+        clients = await repo.search_by_name(params.name_search, params.skip, params.limit)
+    elif params.business_domain:
+        clients = await repo.get_by_business_domain(
+            params.business_domain.value, params.skip, params.limit
+        )
     else:
-        clients = await repo.get_all(skip=skip, limit=limit)
+        clients = await repo.get_all(skip=params.skip, limit=params.limit)
 
-    client_responses = [ClientResponse.model_validate(client) for client in clients]
-    return SuccessResponse(
-        data=client_responses,
-        message=f"Found {len(client_responses)} clients"
-    )
+    client_responses = _client_list_adapter.validate_python(clients, from_attributes=True)
+    return ORJSONResponse({
+        "data": _client_list_adapter.dump_python(client_responses),
+        "message": f"Found {len(client_responses)} clients"
+    })
 
 
 @router.get("/clients/{client_id}", response_model=SuccessResponse)
 async def get_client(
     client_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db)
+    repo: ClientRepository = Depends(get_client_repo)
 ) -> SuccessResponse:
     """Get a specific client by ID."""
-    repo = ClientRepository(db)
+    missing, cached = await _client_cache.lookup(client_id)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+    if cached is not None:
+        return SuccessResponse(
+            data=orjson.loads(cached),
+            message="Client retrieved successfully"
+        )
+
     client = await repo.get_by_id(client_id)
 
     if not client:
+        await _client_cache.mark_missing(client_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Client not found"
         )
 
+    client_response = ClientResponse.model_validate(client)
+    await _client_cache.store(client_id, orjson.dumps(client_response.model_dump(mode="json")))
+
     return SuccessResponse(
-        data=ClientResponse.model_validate(client),
+        data=client_response,
         message="Client retrieved successfully"
     )
 
@@ -86,13 +120,19 @@ async def get_client(
 @router.get("/clients/{client_id}/with-services", response_model=SuccessResponse)
 async def get_client_with_services(
     client_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db)
+    repo: ClientRepository = Depends(get_client_repo)
 ) -> SuccessResponse:
     """Get a client with all associated services."""
-    repo = ClientRepository(db)
+    if await _client_cache.is_missing(client_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+
     client = await repo.get_with_services(client_id)
 
     if not client:
+        await _client_cache.mark_missing(client_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Client not found"
@@ -108,14 +148,10 @@ async def get_client_with_services(
 async def update_client(
     client_id: uuid.UUID,
     client_data: ClientUpdate,
-    db: AsyncSession = Depends(get_db)
+    repo: ClientRepository = Depends(get_client_repo)
 ) -> SuccessResponse:
     """Update a client."""
-    repo = ClientRepository(db)
-
-    # Check if client exists
-    existing_client = await repo.get_by_id(client_id)
-    if not existing_client:
+    if await _client_cache.is_missing(client_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Client not found"
@@ -128,11 +164,19 @@ async def update_client(
     if client_data.business_domain is not None:
         update_data["business_domain"] = client_data.business_domain.value
 
-    # Update client
     updated_client = await repo.update(client_id, **update_data)
+    if not updated_client:
+        await _client_cache.mark_missing(client_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+
+    client_response = ClientResponse.model_validate(updated_client)
+    await _client_cache.store(client_id, orjson.dumps(client_response.model_dump(mode="json")))
 
     return SuccessResponse(
-        data=ClientResponse.model_validate(updated_client),
+        data=client_response,
         message="Client updated successfully"
     )
 
@@ -140,28 +184,27 @@ async def update_client(
 @router.delete("/clients/{client_id}", response_model=SuccessResponse)
 async def delete_client(
     client_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db)
+    repo: ClientRepository = Depends(get_client_repo)
 ) -> SuccessResponse:
     """Delete a client."""
-    repo = ClientRepository(db)
-
-    # Check if client exists
-    existing_client = await repo.get_by_id(client_id)
-    if not existing_client:
+    if await _client_cache.is_missing(client_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Client not found"
         )
 
-    # Delete client
     deleted = await repo.delete(client_id)
+    await _client_cache.invalidate(client_id)
     if not deleted:
+        await _client_cache.mark_missing(client_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete client"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
         )
+    # The client's services were deleted with it
+    await cache_delete_prefix(SERVICE_LIST_CACHE_PREFIX)
 
     return SuccessResponse(
-        data={"id": str(client_id)},
+        data={"id": client_id},
         message="Client deleted successfully"
     )
\ No newline at end of file
@@ -2,17 +2,22 @@
 Contact management API endpoints.
 """
 import uuid
-from typing import List, Optional
+from typing import Annotated, List
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
+from core.cache import EntityCache
 from core.database import get_db
 from models.schemas import (
     ContactCreate,
     ContactUpdate,
     ContactResponse,
+    ContactListParams,
     SuccessResponse,
 )
 from repositories.contact_repository import ContactRepository
@@ -20,22 +25,24 @@ from repositories.contact_repository import ContactRepository
 router = APIRouter()
 
 
+def get_contact_repo(db: AsyncSession = Depends(get_db)) -> ContactRepository:
+    """Get contact repository instance."""
+    return ContactRepository(db)
+
+
+_contact_list_adapter = TypeAdapter(List[ContactResponse])
+
+# Caches single-contact reads and IDs recently found not to exist
+_contact_cache = EntityCache("contact")
+
+
 @router.post("/contacts", response_model=SuccessResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact(
     contact_data: ContactCreate,
-    db: AsyncSession = Depends(get_db)
+    repo: ContactRepository = Depends(get_contact_repo)
 ) -> SuccessResponse:
     """Create a new contact."""
-    repo = ContactRepository(db)
-
-    # Check if email already exists
-    existing_contact = await repo.get_by_email(contact_data.email)
-    if existing_contact:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already exists"
-        )
-
+    # Email uniqueness is enforced by the database constraint
     try:
         contact = await repo.create(
             name=contact_data.name,
@@ -45,60 +52,77 @@ async def create_contact(
             is_active=contact_data.is_active
         )
     except IntegrityError:
-        await db.rollback()
+        await repo.db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already exists"
         )
 
+    await _contact_cache.invalidate(contact.id)
+
     return SuccessResponse(
         data=ContactResponse.model_validate(contact),
         message="Contact created successfully"
     )
 
 
-@router.get("/contacts", response_model=SuccessResponse)
+@router.get(
+    "/contacts",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": SuccessResponse}}
+)
 async def list_contacts(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    name_search: Optional[str] = Query(None, description="Search contacts by name"),
-    db: AsyncSession = Depends(get_db)
-) -> SuccessResponse:
+    params: Annotated[ContactListParams, Query()],
+    repo: ContactRepository = Depends(get_contact_repo)
+) -> ORJSONResponse:
     """List contacts with optional filtering."""
-    repo = ContactRepository(db)
-
-    if name_search:
-        contacts = await repo.search_by_name(name_search, skip, limit)
-    elif is_active is not None:
-        contacts = await repo.get_all(skip=skip, limit=limit, is_active=is_active)
+    if params.name_search:
+        contacts = await repo.search_by_name(params.name_search, params.skip, params.limit)
+    elif params.is_active is not None:
+        contacts = await repo.get_all(skip=params.skip, limit=params.limit, is_active=params.is_active)
     else:
-        contacts = await repo.get_all(skip=skip, limit=limit)
+        contacts = await repo.get_all(skip=params.skip, limit=params.limit)
 
-    contact_responses = [ContactResponse.model_validate(contact) for contact in contacts]
-    return SuccessResponse(
-        data=contact_responses,
-        message=f"Found {len(contact_responses)} contacts"
-    )
+    contact_responses = _contact_list_adapter.validate_python(contacts, from_attributes=True)
+    return ORJSONResponse({
+        "data": _contact_list_adapter.dump_python(contact_responses),
+        "message": f"Found {len(contact_responses)} contacts"
+    })
 
 
 @router.get("/contacts/{contact_id}", response_model=SuccessResponse)
 async def get_contact(
     contact_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db)
+    repo: ContactRepository = Depends(get_contact_repo)
 ) -> SuccessResponse:
     """Get a specific contact by ID."""
-    repo = ContactRepository(db)
+    missing, cached = await _contact_cache.lookup(contact_id)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Contact not found"
+        )
+    if cached is not None:
+        return SuccessResponse(
+            data=orjson.loads(cached),
+            message="Contact retrieved successfully"
+        )
+
     contact = await repo.get_by_id(contact_id)
 
     if not contact:
+        await _contact_cache.mark_missing(contact_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found"
         )
 
+    contact_response = ContactResponse.model_validate(contact)
+    await _contact_cache.store(contact_id, orjson.dumps(contact_response.model_dump(mode="json")))
+
     return SuccessResponse(
-        data=ContactResponse.model_validate(contact),
+        data=contact_response,
         message="Contact retrieved successfully"
     )
 
@@ -107,28 +131,15 @@ async def get_contact(
 async def update_contact(
     contact_id: uuid.UUID,
     contact_data: ContactUpdate,
-    db: AsyncSession = Depends(get_db)
+    repo: ContactRepository = Depends(get_contact_repo)
 ) -> SuccessResponse:
     """Update a contact."""
-    repo = ContactRepository(db)
-
-    # Check if contact exists
-    existing_contact = await repo.get_by_id(contact_id)
-    if not existing_contact:
+    if await _contact_cache.is_missing(contact_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found"
         )
 
-    # Check if new email conflicts with existing contact
-    if contact_data.email and contact_data.email != existing_contact.email:
-        email_conflict = await repo.get_by_email(contact_data.email)
-        if email_conflict:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already exists"
-            )
-
     # Prepare update data
     update_data = {}
     if contact_data.name is not None:
@@ -142,17 +153,28 @@ async def update_contact(
     if contact_data.is_active is not None:
         update_data["is_active"] = contact_data.is_active
 
+    # Email uniqueness is enforced by the database constraint
     try:
         updated_contact = await repo.update(contact_id, **update_data)
     except IntegrityError:
-        await db.rollback()
+        await repo.db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already exists"
         )
 
+    if not updated_contact:
+        await _contact_cache.mark_missing(contact_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Contact not found"
+        )
+
+    contact_response = ContactResponse.model_validate(updated_contact)
+    await _contact_cache.store(contact_id, orjson.dumps(contact_response.model_dump(mode="json")))
+
     return SuccessResponse(
-        data=ContactResponse.model_validate(updated_contact),
+        data=contact_response,
         message="Contact updated successfully"
     )
 
@@ -160,28 +182,25 @@ async def update_contact(
 @router.delete("/contacts/{contact_id}", response_model=SuccessResponse)
 async def delete_contact(
     contact_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db)
+    repo: ContactRepository = Depends(get_contact_repo)
 ) -> SuccessResponse:
     """Delete a contact."""
-    repo = ContactRepository(db)
-
-    # Check if contact exists
-    existing_contact = await repo.get_by_id(contact_id)
-    if not existing_contact:
+    if await _contact_cache.is_missing(contact_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found"
         )
 
-    # Delete contact
     deleted = await repo.delete(contact_id)
+    await _contact_cache.invalidate(contact_id)
     if not deleted:
+        await _contact_cache.mark_missing(contact_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete contact"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Contact not found"
         )
 
     return SuccessResponse(
-        data={"id": str(contact_id)},
+        data={"id": contact_id},
         message="Contact deleted successfully"
     )
@@ -2,11 +2,17 @@
 Document API endpoints.
 """
 import uuid
-from typing import List, Optional
+from typing import Any, Final, List, Optional
+
+import msgspec
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_db
+from core.responses import MsgspecJSONResponse
+from core.streaming import iter_json_array
 from models.schemas import (
     CreateDocumentRequest,
     UpdateDocumentRequest,
@@ -17,12 +23,19 @@ from models.schemas import (
     DocumentType,
     Language
 )
+from models.structs import CommentStruct, DocumentStruct, DocumentVersionStruct, to_structs
 from services.document_service import DocumentService
-from repositories.document_version_repository import DocumentVersionRepository
-from repositories.comment_repository import CommentRepository
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+# Placeholder user ID, as in the gate endpoints (in production, get from auth context)
+_PLACEHOLDER_USER: Final[uuid.UUID] = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+def _encode_documents(documents: List[Any]) -> bytes:
+    """Encode one batch of streamed documents as a JSON array."""
+    return msgspec.json.encode(to_structs(DocumentStruct, documents))
+
 
 # Dependency to get document service
 def get_document_service(db: AsyncSession = Depends(get_db)) -> DocumentService:
@@ -30,16 +43,6 @@ def get_document_service(db: AsyncSession = Depends(get_db)) -> DocumentService:
     return DocumentService(db)
 
 
-def get_version_repo(db: AsyncSession = Depends(get_db)) -> DocumentVersionRepository:
-    """Get document version repository instance."""
-    return DocumentVersionRepository(db)
-
-
-def get_comment_repo(db: AsyncSession = Depends(get_db)) -> CommentRepository:
-    """Get comment repository instance."""
-    return CommentRepository(db)
-
-
 @router.post(
     "/projects/{project_id}/documents",
     response_model=DocumentResponse,
@@ -66,8 +69,8 @@ async def create_document(
     # TODO: Verify project exists (add project repository check)
     # For now, assuming project exists
 
-    # Use a mock user ID (in production, get from auth context)
-    created_by = uuid.uuid4()
+    # Use a placeholder user ID (in production, get from auth context)
+    created_by = _PLACEHOLDER_USER
 
     try:
         document = await service.create_document_with_version(
@@ -88,7 +91,9 @@ async def create_document(
 
 @router.get(
     "/projects/{project_id}/documents",
-    response_model=List[DocumentResponse],
+    response_model=None,
+    response_class=StreamingResponse,
+    responses={200: {"model": List[DocumentResponse]}},
     summary="List project documents",
     description="Get all documents for a project with optional filters."
 )
@@ -109,11 +114,11 @@ async def list_project_documents(
     - **page**: Page number (starting from 1)
     - **limit**: Maximum results per page
 
-    Returns list of documents with pagination.
+    Returns list of documents with pagination, streamed as rows are read.
     """
     offset = (page - 1) * limit
 
-    documents = await service.get_project_documents(
+    documents = await service.iter_project_documents(
         project_id=project_id,
         document_type=type,
         language=language,
@@ -121,7 +126,10 @@ async def list_project_documents(
         offset=offset
     )
 
-    return [DocumentResponse.model_validate(doc) for doc in documents]
+    return StreamingResponse(
+        iter_json_array(documents, encode=_encode_documents),
+        media_type="application/json"
+    )
 
 
 @router.get(
@@ -173,8 +181,8 @@ async def update_document(
     If content changed, increments version and creates version record.
     If content unchanged, returns existing document without creating new version.
     """
-    # Use a mock user ID (in production, get from auth context)
-    updated_by = uuid.uuid4()
+    # Use a placeholder user ID (in production, get from auth context)
+    updated_by = _PLACEHOLDER_USER
 
     document = await service.update_document_with_versioning(
         document_id=document_id,
@@ -222,7 +230,9 @@ async def delete_document(
 
 @router.get(
     "/documents/{document_id}/versions",
-    response_model=List[DocumentVersionResponse],
+    response_model=None,
+    response_class=MsgspecJSONResponse,
+    responses={200: {"model": List[DocumentVersionResponse]}},
     summary="Get document version history",
     description="Get all versions for a document."
 )
@@ -230,7 +240,6 @@ async def get_document_versions(
     document_id: uuid.UUID,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(100, ge=1, le=1000, description="Results per page"),
-    version_repo: DocumentVersionRepository = Depends(get_version_repo),
     service: DocumentService = Depends(get_document_service)
 ):
     """
@@ -242,23 +251,22 @@ async def get_document_versions(
 
     Returns list of versions ordered by version number (descending).
     """
-    # Verify document exists
-    document = await service.get_document_by_id(document_id)
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document {document_id} not found"
-        )
-
     offset = (page - 1) * limit
 
-    versions = await version_repo.get_by_document_id(
+    versions = await service.versions.get_by_document_id(
         document_id=document_id,
         limit=limit,
         offset=offset
     )
 
-    return [DocumentVersionResponse.model_validate(v) for v in versions]
+    # An empty page is the only case that needs a separate existence check
+    if not versions and not await service.document_exists(document_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document {document_id} not found"
+        )
+
+    return MsgspecJSONResponse(to_structs(DocumentVersionStruct, versions))
 
 
 @router.post(
@@ -271,7 +279,6 @@ async def get_document_versions(
 async def create_comment(
     document_id: uuid.UUID,
     request: CreateCommentRequest,
-    comment_repo: CommentRepository = Depends(get_comment_repo),
     service: DocumentService = Depends(get_document_service)
 ):
     """
@@ -284,27 +291,29 @@ async def create_comment(
 
     Returns the created comment.
     """
-    # Verify document exists
-    document = await service.get_document_by_id(document_id)
-    if not document:
+    # The document foreign key rejects comments on missing documents
+    try:
+        comment = await service.comments.create_comment(
+            document_id=document_id,
+            user_id=request.userId,
+            content=request.content,
+            line_number=request.lineNumber
+        )
+    except IntegrityError:
+        await service.db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Document {document_id} not found"
         )
 
-    comment = await comment_repo.create_comment(
-        document_id=document_id,
-        user_id=request.userId,
-        content=request.content,
-        line_number=request.lineNumber
-    )
-
     return CommentResponse.model_validate(comment)
 
 
 @router.get(
     "/documents/{document_id}/comments",
-    response_model=List[CommentResponse],
+    response_model=None,
+    response_class=MsgspecJSONResponse,
+    responses={200: {"model": List[CommentResponse]}},
     summary="List document comments",
     description="Get all comments for a document with optional filters."
 )
@@ -313,7 +322,6 @@ async def list_document_comments(
     resolved: Optional[bool] = Query(None, description="Filter by resolved status"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(100, ge=1, le=1000, description="Results per page"),
-    comment_repo: CommentRepository = Depends(get_comment_repo),
     service: DocumentService = Depends(get_document_service)
 ):
     """
@@ -326,21 +334,20 @@ async def list_document_comments(
 
     Returns list of comments.
     """
-    # Verify document exists
-    document = await service.get_document_by_id(document_id)
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document {document_id} not found"
-        )
-
     offset = (page - 1) * limit
 
-    comments = await comment_repo.get_by_document_id(
+    comments = await service.comments.get_by_document_id(
         document_id=document_id,
         resolved=resolved,
         limit=limit,
         offset=offset
     )
 
-    return [CommentResponse.model_validate(c) for c in comments]
+    # An empty page is the only case that needs a separate existence check
+    if not comments and not await service.document_exists(document_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document {document_id} not found"
+        )
+
+    return MsgspecJSONResponse(to_structs(CommentStruct, comments))
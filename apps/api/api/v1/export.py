@@ -2,69 +2,189 @@
 Data export endpoints.
 """
 import csv
-import json
 import io
-from typing import Literal
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, List, Literal, Tuple, Union
+import orjson
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, Select, select
 
 from core.database import get_db
 from models.database import Client, Service, Project, Contact
 
 router = APIRouter()
 
+# Rows fetched per server-side cursor round trip
+EXPORT_BATCH_SIZE = 1000
+
+CLIENT_FIELDS = ["id", "name", "business_domain", "created_at", "updated_at"]
+PROJECT_FIELDS = ["id", "name", "description", "service_id", "project_type", "status", "created_at", "updated_at"]
+CONTACT_FIELDS = ["id", "name", "email", "role", "phone", "is_active", "created_at", "updated_at"]
+
+# Columns selected for each export, in JSON key order. Selecting plain
+# columns skips ORM instance construction for rows that are only read once.
+# CSV exports select the subset named in *_FIELDS, in the same order.
+CLIENT_COLUMNS = (
+    Client.id,
+    Client.name,
+    Client.business_domain,
+    Client.created_at,
+    Client.updated_at
+)
+PROJECT_COLUMNS = (
+    Project.id,
+    Project.name,
+    Project.description,
+    Project.service_id,
+    Project.project_type,
+    Project.status,
+    Project.workflow_state,
+    Project.created_at,
+    Project.updated_at
+)
+CONTACT_COLUMNS = (
+    Contact.id,
+    Contact.name,
+    Contact.email,
+    Contact.role,
+    Contact.phone,
+    Contact.is_active,
+    Contact.created_at,
+    Contact.updated_at
+)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Per-column CSV formatters, bound once and aligned with *_FIELDS.
+# UUIDs and timestamps are rendered up front; everything else is left to
+# csv.writer.
+_isoformat = datetime.isoformat
+
+PROJECT_CSV_FORMATTERS = (str, _identity, _identity, str, _identity, _identity, _isoformat, _isoformat)
+CONTACT_CSV_FORMATTERS = (str, _identity, _identity, _identity, _identity, _identity, _isoformat, _isoformat)
+
+# Clients have a fixed row shape: a UUID, an enum value and two timestamps
+# never need quoting, so only the name is escaped and always quoted. This
+# skips csv.writer's per-field dialect checks. Projects and contacts carry
+# several free-text or nullable columns and stay on csv.writer.
+_CLIENT_CSV_ROW = '{},"{}",{},{},{}\r\n'.format
+
+
+def _format_client_csv_row(row: Row) -> str:
+    client_id, name, business_domain, created_at, updated_at = row
+    return _CLIENT_CSV_ROW(
+        client_id,
+        name.replace('"', '""'),
+        business_domain,
+        created_at.isoformat(),
+        updated_at.isoformat()
+    )
 
-@router.get("/export/clients")
-async def export_clients(
-    format: Literal["csv", "json"] = Query("csv", description="Export format"),
-    db: AsyncSession = Depends(get_db)
-):
-    """
-    Export all clients.
 
-    Supports CSV and JSON formats.
+CsvFormatter = Union[Tuple[Callable[[Any], Any], ...], Callable[[Row], str]]
+
+
+async def _stream_json(db: AsyncSession, stmt: Select) -> AsyncIterator[bytes]:
+    """Yield a compact JSON array one element at a time from a server-side cursor."""
+    rows = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    separator = b""
+    yield b"["
+    async for row in rows:
+        yield separator + orjson.dumps(dict(row._mapping))
+        separator = b","
+    yield b"]"
+
+
+async def _stream_csv(
+    db: AsyncSession,
+    stmt: Select,
+    headers: List[str],
+    formatters: Tuple[Callable[[Any], Any], ...]
+) -> AsyncIterator[str]:
+    """Yield a CSV document one line at a time from a server-side cursor."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> str:
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+    writer.writerow(headers)
+    yield drain()
+
+    rows = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for row in rows:
+        writer.writerow([fmt(value) for fmt, value in zip(formatters, row)])
+        yield drain()
+
+
+async def _stream_csv_template(
+    db: AsyncSession,
+    stmt: Select,
+    headers: List[str],
+    format_row: Callable[[Row], str]
+) -> AsyncIterator[str]:
+    """Yield a CSV document one line at a time using a precompiled row template."""
+    yield ",".join(headers) + "\r\n"
+
+    rows = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for row in rows:
+        yield format_row(row)
+
+
+def _export_response(
+    db: AsyncSession,
+    format: str,
+    columns: Tuple[Any, ...],
+    headers: List[str],
+    csv_formatters: CsvFormatter,
+    filename: str
+) -> StreamingResponse:
     """
-    result = await db.execute(select(Client))
-    clients = result.scalars().all()
+    Build the streaming response for one export.
 
+    ``csv_formatters`` is either a tuple of per-column formatters for
+    csv.writer or a function rendering a whole CSV line from a row.
+    """
     if format == "json":
-        data = [
-            {
-                "id": str(client.id),
-                "name": client.name,
-                "business_domain": client.business_domain,
-                "created_at": client.created_at.isoformat(),
-                "updated_at": client.updated_at.isoformat()
-            }
-            for client in clients
-        ]
         return StreamingResponse(
-            io.StringIO(json.dumps(data, indent=2)),
+            _stream_json(db, select(*columns)),
             media_type="application/json",
-            headers={"Content-Disposition": "attachment; filename=clients.json"}
+            headers={"Content-Disposition": f"attachment; filename={filename}.json"}
         )
 
-    # CSV format
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=["id", "name", "business_domain", "created_at", "updated_at"])
-    writer.writeheader()
-
-    for client in clients:
-        writer.writerow({
-            "id": str(client.id),
-            "name": client.name,
-            "business_domain": client.business_domain,
-            "created_at": client.created_at.isoformat(),
-            "updated_at": client.updated_at.isoformat()
-        })
-
-    output.seek(0)
+    stmt = select(*(column for column in columns if column.key in headers))
+    if callable(csv_formatters):
+        body = _stream_csv_template(db, stmt, headers, csv_formatters)
+    else:
+        body = _stream_csv(db, stmt, headers, csv_formatters)
+
     return StreamingResponse(
-        iter([output.getvalue()]),
+        body,
         media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=clients.csv"}
+        headers={"Content-Disposition": f"attachment; filename={filename}.csv"}
+    )
+
+
+@router.get("/export/clients")
+async def export_clients(
+    format: Literal["csv", "json"] = Query("csv", description="Export format"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Export all clients.
+
+    Supports CSV and JSON formats. Rows are streamed as they are read.
+    """
+    return _export_response(
+        db, format, CLIENT_COLUMNS, CLIENT_FIELDS, _format_client_csv_row, "clients"
     )
 
 
@@ -76,57 +196,10 @@ async def export_projects(
     """
     Export all projects.
 
-    Supports CSV and JSON formats.
+    Supports CSV and JSON formats. Rows are streamed as they are read.
     """
-    result = await db.execute(select(Project))
-    projects = result.scalars().all()
-
-    if format == "json":
-        data = [
-            {
-                "id": str(project.id),
-                "name": project.name,
-                "description": project.description,
-                "service_id": str(project.service_id),
-                "project_type": project.project_type,
-                "status": project.status,
-                "workflow_state": project.workflow_state,
-                "created_at": project.created_at.isoformat(),
-                "updated_at": project.updated_at.isoformat()
-            }
-            for project in projects
-        ]
-        return StreamingResponse(
-            io.StringIO(json.dumps(data, indent=2)),
-            media_type="application/json",
-            headers={"Content-Disposition": "attachment; filename=projects.json"}
-        )
-
-    # CSV format
-    output = io.StringIO()
-    writer = csv.DictWriter(
-        output,
-        fieldnames=["id", "name", "description", "service_id", "project_type", "status", "created_at", "updated_at"]
-    )
-    writer.writeheader()
-
-    for project in projects:
-        writer.writerow({
-            "id": str(project.id),
-            "name": project.name,
-            "description": project.description,
-            "service_id": str(project.service_id),
-            "project_type": project.project_type,
-            "status": project.status,
-            "created_at": project.created_at.isoformat(),
-            "updated_at": project.updated_at.isoformat()
-        })
-
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=projects.csv"}
+    return _export_response(
+        db, format, PROJECT_COLUMNS, PROJECT_FIELDS, PROJECT_CSV_FORMATTERS, "projects"
     )
 
 
@@ -138,54 +211,8 @@ async def export_contacts(
     """
     Export all contacts.
 
-    Supports CSV and JSON formats.
+    Supports CSV and JSON formats. Rows are streamed as they are read.
     """
-    result = await db.execute(select(Contact))
-    contacts = result.scalars().all()
-
-    if format == "json":
-        data = [
-            {
-                "id": str(contact.id),
-                "name": contact.name,
-                "email": contact.email,
-                "role": contact.role,
-                "phone": contact.phone,
-                "is_active": contact.is_active,
-                "created_at": contact.created_at.isoformat(),
-                "updated_at": contact.updated_at.isoformat()
-            }
-            for contact in contacts
-        ]
-        return StreamingResponse(
-            io.StringIO(json.dumps(data, indent=2)),
-            media_type="application/json",
-            headers={"Content-Disposition": "attachment; filename=contacts.json"}
-        )
-
-    # CSV format
-    output = io.StringIO()
-    writer = csv.DictWriter(
-        output,
-        fieldnames=["id", "name", "email", "role", "phone", "is_active", "created_at", "updated_at"]
-    )
-    writer.writeheader()
-
-    for contact in contacts:
-        writer.writerow({
-            "id": str(contact.id),
-            "name": contact.name,
-            "email": contact.email,
-            "role": contact.role,
-            "phone": contact.phone,
-            "is_active": contact.is_active,
-            "created_at": contact.created_at.isoformat(),
-            "updated_at": contact.updated_at.isoformat()
-        })
-
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=contacts.csv"}
+    return _export_response(
+        db, format, CONTACT_COLUMNS, CONTACT_FIELDS, CONTACT_CSV_FORMATTERS, "contacts"
     )
@@ -1,37 +1,40 @@
 """Gate management API endpoints for Story 3.2."""
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import cache_delete
 from core.database import get_db
 from models.gate import (
     Gate,
+    GateDetail,
     GateApprovalRequest,
     GateRejectionRequest,
     AssignReviewerRequest,
     GateReviewer,
     GateResetRequest
 )
-from services.gate_service import GateService
+from services.gate_service import GATE_METRICS_CACHE_KEY, GateService
 from tests.mocks.workflow.progression_engine_mock import MockWorkflowProgressionEngine
 
 router = APIRouter(prefix="/projects", tags=["gates"])
 
+# Use mock progression engine until Story 3.3 is complete
+_progression_engine = MockWorkflowProgressionEngine()
+
 
 def get_gate_service(session: AsyncSession = Depends(get_db)) -> GateService:
     """Dependency to get GateService instance."""
-    # Use mock progression engine until Story 3.3 is complete
-    progression_engine = MockWorkflowProgressionEngine()
-    return GateService(session=session, progression_engine=progression_engine)
+    return GateService(session=session, progression_engine=_progression_engine)
 
 
-@router.get("/{projectId}/gates", response_model=List[Gate])
+@router.get("/{projectId}/gates", response_model=None, responses={200: {"model": List[Gate]}})
 async def get_project_gates(
     projectId: UUID,
-    status: Optional[str] = Query(None, regex="^(pending|approved|rejected|blocked)$"),
+    status: Optional[Literal["pending", "approved", "rejected", "blocked"]] = Query(None),
     service: GateService = Depends(get_gate_service)
 ) -> List[Gate]:
     """Get all gates for a project.
@@ -44,14 +47,8 @@ async def get_project_gates(
     Returns:
         List of gates
     """
-    try:
-        gates = await service.get_project_gates(projectId, status_filter=status)
-        return gates
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve gates: {str(e)}"
-        )
+    gates = await service.get_project_gates(projectId, status_filter=status)
+    return gates
 
 
 @router.get("/{projectId}/gates/{gateId}/history")
@@ -70,21 +67,48 @@ async def get_gate_history(
     Returns:
         List of workflow events
     """
-    try:
-        history = await service.get_gate_history(gateId)
-        if not history:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Gate {gateId} not found"
-            )
-        return history
-    except HTTPException:
-        raise
-    except Exception as e:
+    history = await service.get_gate_history(gateId)
+    if not history:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Gate {gateId} not found"
+        )
+    return history
+
+
+@router.get(
+    "/{projectId}/gates/{gateId}/detail",
+    response_model=None,
+    responses={200: {"model": GateDetail}}
+)
+async def get_gate_detail(
+    projectId: UUID,
+    gateId: UUID,
+    service: GateService = Depends(get_gate_service)
+) -> ORJSONResponse:
+    """Get a gate together with its history, reviewers and metrics.
+
+    Serves a gate detail page in one database round trip instead of
+    separate history, reviewers and metrics requests.
+
+    Args:
+        projectId: Project UUID
+        gateId: Gate UUID
+        service: GateService dependency
+
+    Returns:
+        Gate detail
+
+    Raises:
+        404: Gate not found
+    """
+    detail = await service.get_gate_detail(gateId)
+    if detail is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve gate history: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Gate {gateId} not found"
         )
+    return ORJSONResponse(detail)
 
 
 @router.post("/{projectId}/gates/{gateId}/approve", response_model=Gate)
@@ -121,17 +145,13 @@ async def approve_gate(
             comment=request.comment,
             metadata=request.metadata
         )
+        await cache_delete(GATE_METRICS_CACHE_KEY)
         return gate
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to approve gate: {str(e)}"
-        )
 
 
 @router.post("/{projectId}/gates/{gateId}/reject", response_model=Gate)
@@ -168,17 +188,13 @@ async def reject_gate(
             reason=request.reason,
             recommendations=request.recommendations
         )
+        await cache_delete(GATE_METRICS_CACHE_KEY)
         return gate
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to reject gate: {str(e)}"
-        )
 
 
 @router.post("/{projectId}/gates/{gateId}/reviewers", status_code=status.HTTP_201_CREATED, response_model=GateReviewer)
@@ -215,11 +231,6 @@ async def assign_reviewer(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to assign reviewer: {str(e)}"
-        )
 
 
 @router.get("/{projectId}/gates/{gateId}/reviewers", response_model=List[GateReviewer])
@@ -241,67 +252,8 @@ async def get_gate_reviewers(
     Raises:
         404: Gate not found
     """
-    try:
-        reviewers = await service.get_gate_reviewers(gateId)
-        return reviewers
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve reviewers: {str(e)}"
-        )
-
-
-@router.get("/{projectId}/workflow/history")
-async def get_workflow_history(
-    projectId: UUID,
-    event_type: Optional[str] = None,
-    gate_id: Optional[str] = None,
-    date_from: Optional[datetime] = None,
-    date_to: Optional[datetime] = None,
-    offset: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=200),
-    service: GateService = Depends(get_gate_service)
-) -> List[Dict[str, Any]]:
-    """Get workflow history for a project.
-
-    Args:
-        projectId: Project UUID
-        event_type: Optional event type filter
-        gate_id: Optional gate ID filter
-        date_from: Optional start date filter
-        date_to: Optional end date filter
-        offset: Pagination offset
-        limit: Pagination limit (max 200)
-        service: GateService dependency
-
-    Returns:
-        Paginated list of workflow events
-
-    Raises:
-        404: Project not found
-    """
-    try:
-        filters = {
-            'offset': offset,
-            'limit': limit
-        }
-
-        if event_type:
-            filters['event_type'] = event_type
-        if gate_id:
-            filters['gate_id'] = gate_id
-        if date_from:
-            filters['date_from'] = date_from
-        if date_to:
-            filters['date_to'] = date_to
-
-        history = await service.get_workflow_history(projectId, filters=filters)
-        return history
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve workflow history: {str(e)}"
-        )
+    reviewers = await service.get_gate_reviewers(gateId)
+    return reviewers
 
 
 @router.get("/{projectId}/gates/metrics")
@@ -321,14 +273,8 @@ async def get_gate_metrics(
     Raises:
         404: Project not found
     """
-    try:
-        metrics = await service.get_gate_metrics(projectId)
-        return metrics
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve gate metrics: {str(e)}"
-        )
+    metrics = await service.get_gate_metrics(projectId)
+    return metrics
 
 
 @router.post("/{projectId}/gates/{gateId}/reset", response_model=Gate)
@@ -360,14 +306,10 @@ async def reset_gate(
             gate_id=gateId,
             user_id=user_id
         )
+        await cache_delete(GATE_METRICS_CACHE_KEY)
         return gate
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to reset gate: {str(e)}"
-        )
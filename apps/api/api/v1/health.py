@@ -1,7 +1,9 @@
 """
 Health check endpoints for AgentLab API.
 """
-from typing import Dict, Any
+import asyncio
+import time
+from typing import Dict, Any, Tuple
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,20 +13,47 @@ from core.database import get_db
 
 router = APIRouter()
 
+# How long a database probe result is reused before querying again
+HEALTH_CHECK_TTL_SECONDS = 1.0
+
+# (monotonic time of last probe, database status)
+_last_check: Tuple[float, str] = (0.0, "unknown")
+_check_lock = asyncio.Lock()
+
+
+async def _probe_database(db: AsyncSession) -> str:
+    """Run SELECT 1, reusing a recent result and letting one caller probe at a time."""
+    global _last_check
+
+    checked_at, db_status = _last_check
+    if time.monotonic() - checked_at < HEALTH_CHECK_TTL_SECONDS:
+        return db_status
+
+    async with _check_lock:
+        # Another request may have refreshed the result while we waited
+        checked_at, db_status = _last_check
+        if time.monotonic() - checked_at < HEALTH_CHECK_TTL_SECONDS:
+            return db_status
+
+        try:
+            # Test database connection
+            result = await db.execute(text("SELECT 1"))
+            db_status = "healthy" if result.scalar() == 1 else "unhealthy"
+        except Exception:
+            db_status = "unhealthy"
+
+        _last_check = (time.monotonic(), db_status)
+        return db_status
+
 
 @router.get("/health")
 async def health_check(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
     """Basic health check endpoint."""
-    try:
-        # Test database connection
-        result = await db.execute(text("SELECT 1"))
-        db_status = "healthy" if result.scalar() == 1 else "unhealthy"
-    except Exception:
-        db_status = "unhealthy"
+    db_status = await _probe_database(db)
 
     return {
         "status": "healthy" if db_status == "healthy" else "unhealthy",
         "database": db_status,
         "service": "agentlab-api",
         "version": "1.0.0"
-    }
\ No newline at end of file
+    }
@@ -2,24 +2,56 @@
 Implementation Type API endpoints.
 Story 2.2 Implementation.
 """
+import hashlib
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_db
+from models.database import ImplementationType
 from models.schemas import ImplementationTypeResponse
 from repositories.implementation_type_repository import ImplementationTypeRepository
 
 router = APIRouter()
 
+# Validates the whole list in one call to pydantic-core
+_IMPL_TYPES_TA = TypeAdapter(List[ImplementationTypeResponse])
 
-@router.get("/implementation-types", response_model=List[ImplementationTypeResponse])
+# Matches the repository snapshot TTL; clients may serve a stale list
+# briefly while they revalidate
+_IMPL_TYPES_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=60"
+
+
+def _implementation_types_etag(
+    rows: Sequence[ImplementationType], is_active: Optional[bool]
+) -> str:
+    """
+    Build a weak ETag for one filtered implementation type list.
+
+    The filter, row ids and update timestamps identify the response
+    body, so the tag can be checked before anything is serialized.
+    """
+    digest = hashlib.blake2s(repr(is_active).encode())
+    for row in rows:
+        digest.update(row.id.bytes)
+        digest.update(row.updated_at.isoformat().encode())
+    return f'W/"{digest.hexdigest()[:16]}"'
+
+
+@router.get(
+    "/implementation-types",
+    response_model=None,
+    responses={200: {"model": List[ImplementationTypeResponse]}}
+)
 async def list_implementation_types(
     is_active: Optional[bool] = Query(True, description="Filter by active status"),
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db)
-) -> List[ImplementationTypeResponse]:
+) -> Response:
     """
     List all implementation types with optional filtering.
 
@@ -35,11 +67,26 @@ async def list_implementation_types(
     - CHATBOT: Conversational AI
     - ANALYTICS: AI Analytics
     - RECOMMENDATION: Recommendation Engine
+
+    Responses carry a weak ETag; a matching If-None-Match gets 304.
     """
     impl_repo = ImplementationTypeRepository(db)
     impl_types = await impl_repo.list_implementation_types(is_active=is_active)
 
-    return [ImplementationTypeResponse.model_validate(it) for it in impl_types]
+    etag = _implementation_types_etag(impl_types, is_active)
+    headers = {"ETag": etag, "Cache-Control": _IMPL_TYPES_CACHE_CONTROL}
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Validated once here; response_model=None skips FastAPI's second pass
+    items = _IMPL_TYPES_TA.validate_python(impl_types, from_attributes=True)
+    return ORJSONResponse(
+        _IMPL_TYPES_TA.dump_python(items, mode="json", by_alias=True),
+        headers=headers
+    )
 
 
 @router.get("/implementation-types/{id}", response_model=ImplementationTypeResponse)
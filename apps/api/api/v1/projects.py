@@ -3,13 +3,17 @@ Project management API endpoints with contacts and user categories.
 Story 2.2 Implementation.
 """
 import uuid
-from typing import List, Optional
-from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_db
+from core.pagination import decode_cursor, encode_cursor
+from models.database import ImplementationType, Service
 from models.schemas import (
     ProjectCreate,
     ProjectUpdate,
@@ -25,20 +29,47 @@ from models.schemas import (
     ProjectType
 )
 from repositories.project_repository import ProjectRepository
-from repositories.implementation_type_repository import ImplementationTypeRepository
 
 router = APIRouter()
 
+# List adapters validate whole result sets in one call to pydantic-core
+_PROJECTS_TA = TypeAdapter(List[ProjectResponse])
+_PROJECT_CONTACTS_TA = TypeAdapter(List[ProjectContactResponse])
+_PROJECT_USER_CATEGORIES_TA = TypeAdapter(List[ProjectUserCategoryResponse])
 
-def serialize_enums(data: dict) -> dict:
-    """Convert Enum objects to their string values for database insertion."""
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, Enum):
-            result[key] = value.value
-        else:
-            result[key] = value
-    return result
+
+def _dump(adapter: TypeAdapter, rows: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Validate ORM rows once and dump them to JSON-ready dicts.
+
+    List endpoints return these in an ORJSONResponse with response_model=None,
+    so FastAPI does not validate the same rows a second time.
+    """
+    return adapter.dump_python(
+        adapter.validate_python(rows, from_attributes=True), mode="json", by_alias=True
+    )
+
+
+async def _references_exist(
+    db: AsyncSession,
+    service_id: uuid.UUID,
+    implementation_type_id: Optional[uuid.UUID]
+) -> Tuple[bool, bool]:
+    """
+    Check that a new project's service and implementation type exist.
+
+    Both EXISTS tests run in one SELECT, so neither row is loaded and the
+    session makes a single round trip.
+
+    Returns:
+        (service exists, implementation type exists or was not given)
+    """
+    checks = [exists().where(Service.id == service_id)]
+    if implementation_type_id:
+        checks.append(exists().where(ImplementationType.id == implementation_type_id))
+
+    row = (await db.execute(select(*checks))).one()
+    return row[0], row[1] if implementation_type_id else True
 
 
 # Project CRUD Endpoints
@@ -59,45 +90,43 @@ async def create_project(
     """
     project_repo = ProjectRepository(db)
 
-    # Validate service exists
-    from repositories.service_repository import ServiceRepository
-    service_repo = ServiceRepository(db)
-    service = await service_repo.get_with_projects(project_data.service_id)
-    if not service:
+    # Validate service and implementation type in a single round trip
+    service_ok, impl_type_ok = await _references_exist(
+        db, project_data.service_id, project_data.implementation_type_id
+    )
+    if not service_ok:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid service_id"
         )
+    if not impl_type_ok:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid implementation_type_id"
+        )
 
-    # Validate implementation type if provided
-    if project_data.implementation_type_id:
-        impl_repo = ImplementationTypeRepository(db)
-        impl_type = await impl_repo.get_implementation_type_by_id(project_data.implementation_type_id)
-        if not impl_type:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid implementation_type_id"
-            )
-
-    # Create project - convert Pydantic model to dict and serialize enums
-    project_dict = serialize_enums(project_data.model_dump())
+    # Create project; ProjectCreate already holds enum values as strings
+    project_dict = project_data.model_dump()
     project = await project_repo.create_project(project_dict)
 
     return ProjectResponse.model_validate(project)
 
 
-@router.get("/projects", response_model=List[ProjectResponse])
+@router.get("/projects", response_model=None, responses={200: {"model": List[ProjectResponse]}})
 async def list_projects(
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
     service_id: Optional[uuid.UUID] = Query(None, description="Filter by service ID"),
     status: Optional[ProjectStatus] = Query(None, description="Filter by status"),
     project_type: Optional[ProjectType] = Query(None, description="Filter by project type"),
     implementation_type_id: Optional[uuid.UUID] = Query(None, description="Filter by implementation type"),
     db: AsyncSession = Depends(get_db)
-) -> List[ProjectResponse]:
+) -> ORJSONResponse:
     """
-    List projects with filtering and pagination.
+    List projects with filtering and keyset pagination.
+
+    Projects are ordered newest first. When more projects follow, the
+    X-Next-Cursor response header holds the cursor for the next page.
 
     Filters:
     - **service_id**: Filter by service
@@ -112,11 +141,18 @@ async def list_projects(
         status=status.value if status else None,
         project_type=project_type.value if project_type else None,
         implementation_type_id=implementation_type_id,
-        page=page,
-        limit=limit
+        cursor=decode_cursor(cursor) if cursor else None,
+        # Fetch one extra row to know whether another page exists
+        limit=limit + 1
     )
 
-    return [ProjectResponse.model_validate(p) for p in projects]
+    headers = {}
+    if len(projects) > limit:
+        projects = projects[:limit]
+        last = projects[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+
+    return ORJSONResponse(_dump(_PROJECTS_TA, projects), headers=headers)
 
 
 @router.get("/projects/{project_id}", response_model=ProjectDetailResponse)
@@ -143,16 +179,17 @@ async def get_project(
             detail="Project not found"
         )
 
-    # Build response with relationships
+    # Build response with relationships; contacts and user categories
+    # were loaded together with the project
     response_data = ProjectDetailResponse.model_validate(project)
-
-    # Add contacts
-    contacts = await project_repo.list_project_contacts(project_id)
-    response_data.contacts = [ProjectContactResponse.model_validate(c) for c in contacts]
-
-    # Add user categories
-    categories = await project_repo.list_project_user_categories(project_id)
-    response_data.user_categories = [cat.service_category for cat in categories if cat.service_category]
+    response_data.contacts = _PROJECT_CONTACTS_TA.validate_python(
+        project.project_contacts, from_attributes=True
+    )
+    response_data.user_categories = [
+        assignment.service_category
+        for assignment in project.user_category_assignments
+        if assignment.service_category
+    ]
 
     return response_data
 
@@ -175,21 +212,18 @@ async def update_project(
     """
     project_repo = ProjectRepository(db)
 
-    # Validate implementation type if provided
-    if project_data.implementation_type_id:
-        impl_repo = ImplementationTypeRepository(db)
-        impl_type = await impl_repo.get_implementation_type_by_id(project_data.implementation_type_id)
-        if not impl_type:
+    # Update project; ProjectUpdate already holds enum values as strings.
+    # The implementation type is validated by the UPDATE itself.
+    update_dict = project_data.model_dump(exclude_none=True)
+    updated_project = await project_repo.update_project(project_id, update_dict)
+
+    if not updated_project:
+        # Only a failed update pays for working out which check missed
+        if project_data.implementation_type_id and await project_repo.exists(project_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid implementation_type_id"
             )
-
-    # Update project - serialize enums
-    update_dict = serialize_enums({k: v for k, v in project_data.model_dump().items() if v is not None})
-    updated_project = await project_repo.update_project(project_id, update_dict)
-
-    if not updated_project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
@@ -224,28 +258,31 @@ async def delete_project(
 
 # Project Contact Endpoints
 
-@router.get("/projects/{project_id}/contacts", response_model=List[ProjectContactResponse])
+@router.get(
+    "/projects/{project_id}/contacts",
+    response_model=None,
+    responses={200: {"model": List[ProjectContactResponse]}}
+)
 async def list_project_contacts(
     project_id: uuid.UUID,
     db: AsyncSession = Depends(get_db)
-) -> List[ProjectContactResponse]:
+) -> ORJSONResponse:
     """
     List all contacts assigned to a project.
 
     Returns contact details with relationship metadata (contact_type, is_active).
     """
     project_repo = ProjectRepository(db)
+    contacts = await project_repo.list_project_contacts(project_id)
 
-    # Verify project exists
-    project = await project_repo.get_project_by_id(project_id, include_relations=False)
-    if not project:
+    # An empty list is the only case that needs a separate existence check
+    if not contacts and not await project_repo.exists(project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    contacts = await project_repo.list_project_contacts(project_id)
-    return [ProjectContactResponse.model_validate(c) for c in contacts]
+    return ORJSONResponse(_dump(_PROJECT_CONTACTS_TA, contacts))
 
 
 @router.post("/projects/{project_id}/contacts", response_model=ProjectContactResponse, status_code=status.HTTP_201_CREATED)
@@ -266,29 +303,25 @@ async def assign_contact_to_project(
     project_repo = ProjectRepository(db)
 
     # Verify project exists
-    project = await project_repo.get_project_by_id(project_id, include_relations=False)
-    if not project:
+    if not await project_repo.exists(project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    # Assign contact
-    try:
-        assignment = await project_repo.assign_contact_to_project(
-            project_id,
-            contact_data.contact_id,
-            {"contact_type": contact_data.contact_type, "is_active": contact_data.is_active}
+    # Assign contact; a duplicate is skipped by ON CONFLICT and comes back as None
+    assignment = await project_repo.assign_contact_to_project(
+        project_id,
+        contact_data.contact_id,
+        {"contact_type": contact_data.contact_type, "is_active": contact_data.is_active}
+    )
+    if assignment is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Contact already assigned to project with this type"
         )
-        return ProjectContactResponse.model_validate(assignment)
-    except Exception as e:
-        # Handle duplicate constraint violation
-        if "uq_project_contact" in str(e):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Contact already assigned to project with this type"
-            )
-        raise
+
+    return ProjectContactResponse.model_validate(assignment)
 
 
 @router.put("/projects/{project_id}/contacts/{contact_id}", response_model=ProjectContactResponse)
@@ -339,28 +372,31 @@ async def remove_contact_from_project(
 
 # Project User Category Endpoints
 
-@router.get("/projects/{project_id}/user-categories", response_model=List[ProjectUserCategoryResponse])
+@router.get(
+    "/projects/{project_id}/user-categories",
+    response_model=None,
+    responses={200: {"model": List[ProjectUserCategoryResponse]}}
+)
 async def list_project_user_categories(
     project_id: uuid.UUID,
     db: AsyncSession = Depends(get_db)
-) -> List[ProjectUserCategoryResponse]:
+) -> ORJSONResponse:
     """
     List all user categories (service categories) assigned to a project.
 
     Returns full category details (code, name, description, color).
     """
     project_repo = ProjectRepository(db)
+    categories = await project_repo.list_project_user_categories(project_id)
 
-    # Verify project exists
-    project = await project_repo.get_project_by_id(project_id, include_relations=False)
-    if not project:
+    # An empty list is the only case that needs a separate existence check
+    if not categories and not await project_repo.exists(project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    categories = await project_repo.list_project_user_categories(project_id)
-    return [ProjectUserCategoryResponse.model_validate(c) for c in categories]
+    return ORJSONResponse(_dump(_PROJECT_USER_CATEGORIES_TA, categories))
 
 
 @router.post("/projects/{project_id}/user-categories", response_model=ProjectUserCategoryResponse, status_code=status.HTTP_201_CREATED)
@@ -377,28 +413,24 @@ async def assign_user_category_to_project(
     project_repo = ProjectRepository(db)
 
     # Verify project exists
-    project = await project_repo.get_project_by_id(project_id, include_relations=False)
-    if not project:
+    if not await project_repo.exists(project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    # Assign category
-    try:
-        assignment = await project_repo.assign_user_category_to_project(
-            project_id,
-            category_data.service_category_id
+    # Assign category; a duplicate is skipped by ON CONFLICT and comes back as None
+    assignment = await project_repo.assign_user_category_to_project(
+        project_id,
+        category_data.service_category_id
+    )
+    if assignment is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Category already assigned to project"
         )
-        return ProjectUserCategoryResponse.model_validate(assignment)
-    except Exception as e:
-        # Handle duplicate constraint violation
-        if "uq_project_service_category" in str(e):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Category already assigned to project"
-            )
-        raise
+
+    return ProjectUserCategoryResponse.model_validate(assignment)
 
 
 @router.delete("/projects/{project_id}/user-categories/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
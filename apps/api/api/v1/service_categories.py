@@ -2,13 +2,18 @@
 Service Category API endpoints.
 """
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, List, NoReturn, Optional, Type
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from pydantic import TypeAdapter
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, select
 
+from core.cache import cache_aside
 from core.database import get_db
+from core.exceptions import is_foreign_key_violation
 from models.schemas import (
     ServiceCategoryResponse,
     ServiceCategoryAssignmentCreate,
@@ -22,6 +27,78 @@ from repositories.service_category_repository import ServiceCategoryRepository
 
 router = APIRouter()
 
+# Categories are seeded reference data with no write endpoints, so list
+# pages can be served from Redis for minutes
+SERVICE_CATEGORY_LIST_CACHE_TTL_SECONDS = 300
+
+# Validates a whole page in one call to pydantic-core
+_SERVICE_CATEGORIES_TA = TypeAdapter(List[ServiceCategoryResponse])
+
+# Fixed-shape statements are built once at import and executed with bound
+# parameters, so each request reuses the same cached compilation
+_SEL_CATEGORY_ASSIGNMENT = select(ServiceServiceCategory).where(
+    ServiceServiceCategory.service_id == bindparam("service_id"),
+    ServiceServiceCategory.service_category_id == bindparam("target_id")
+)
+_SEL_CONTACT_ASSIGNMENT = select(ServiceContact).where(
+    ServiceContact.service_id == bindparam("service_id"),
+    ServiceContact.contact_id == bindparam("target_id")
+)
+_SEL_REFERENCES_EXIST = {
+    target: select(
+        exists().where(Service.id == bindparam("service_id")),
+        exists().where(target.id == bindparam("target_id"))
+    )
+    for target in (ServiceCategory, Contact)
+}
+
+
+async def _raise_missing_reference(
+    db: AsyncSession,
+    service_id: uuid.UUID,
+    target: Type,
+    target_id: uuid.UUID,
+    target_label: str
+) -> NoReturn:
+    """
+    Turn a rejected assignment insert into a 404 naming the missing row.
+
+    Runs only after a foreign key violation; both EXISTS tests share one
+    SELECT.
+    """
+    await db.rollback()
+    row = (await db.execute(
+        _SEL_REFERENCES_EXIST[target],
+        {"service_id": service_id, "target_id": target_id}
+    )).one()
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Service not found" if not row[0] else f"{target_label} not found"
+    )
+
+
+@cache_aside(
+    key=lambda db, skip, limit, is_active: f"service_categories:list:{skip}:{limit}:{is_active}",
+    ttl_seconds=SERVICE_CATEGORY_LIST_CACHE_TTL_SECONDS
+)
+async def _list_categories(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    is_active: Optional[bool]
+) -> List[Dict[str, Any]]:
+    """Load one page of service categories as JSON-ready dicts."""
+    repo = ServiceCategoryRepository(db)
+
+    if is_active is not None:
+        categories = await repo.get_all(skip=skip, limit=limit, is_active=is_active)
+    else:
+        categories = await repo.get_all(skip=skip, limit=limit)
+
+    return _SERVICE_CATEGORIES_TA.dump_python(
+        _SERVICE_CATEGORIES_TA.validate_python(categories, from_attributes=True), mode="json"
+    )
+
 
 @router.get("/service-categories", response_model=SuccessResponse)
 async def list_service_categories(
@@ -30,16 +107,13 @@ async def list_service_categories(
     is_active: Optional[bool] = Query(True, description="Filter by active status"),
     db: AsyncSession = Depends(get_db)
 ) -> SuccessResponse:
-    """List all service categories."""
-    repo = ServiceCategoryRepository(db)
+    """
+    List all service categories.
 
-    if is_active is not None:
-        categories = await repo.get_all(skip=skip, limit=limit, is_active=is_active)
-    else:
-        categories = await repo.get_all(skip=skip, limit=limit)
-
-    category_responses = [ServiceCategoryResponse.model_validate(cat) for cat in categories]
-    return SuccessResponse(
+    Pages are cached in Redis for SERVICE_CATEGORY_LIST_CACHE_TTL_SECONDS.
+    """
+    category_responses = await _list_categories(db, skip, limit, is_active)
+    return SuccessResponse.model_construct(
         data=category_responses,
         message=f"Found {len(category_responses)} service categories"
     )
@@ -60,7 +134,7 @@ async def get_service_category(
             detail="Service category not found"
         )
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data=ServiceCategoryResponse.model_validate(category),
         message="Service category retrieved successfully"
     )
@@ -73,52 +147,35 @@ async def assign_category_to_service(
     db: AsyncSession = Depends(get_db)
 ) -> SuccessResponse:
     """Assign a category to a service."""
-    # Verify service exists
-    service_result = await db.execute(
-        select(Service).where(Service.id == service_id)
-    )
-    service = service_result.scalar_one_or_none()
-    if not service:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Service not found"
+    # Foreign keys validate the service and category; a duplicate is
+    # skipped by ON CONFLICT and returns no row
+    stmt = (
+        pg_insert(ServiceServiceCategory)
+        .values(
+            service_id=service_id,
+            service_category_id=assignment_data.service_category_id
         )
-
-    # Verify category exists
-    category_result = await db.execute(
-        select(ServiceCategory).where(ServiceCategory.id == assignment_data.service_category_id)
+        .on_conflict_do_nothing(constraint="uq_service_service_category")
+        .returning(ServiceServiceCategory)
     )
-    category = category_result.scalar_one_or_none()
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Service category not found"
+    try:
+        assignment = (await db.execute(stmt)).scalar_one_or_none()
+    except IntegrityError as exc:
+        # Other violations are left to the global integrity error handler
+        if not is_foreign_key_violation(exc):
+            raise
+        await _raise_missing_reference(
+            db, service_id, ServiceCategory, assignment_data.service_category_id, "Service category"
         )
 
-    # Check if assignment already exists
-    existing_result = await db.execute(
-        select(ServiceServiceCategory).where(
-            ServiceServiceCategory.service_id == service_id,
-            ServiceServiceCategory.service_category_id == assignment_data.service_category_id
-        )
-    )
-    existing = existing_result.scalar_one_or_none()
-    if existing:
+    if assignment is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Category already assigned to this service"
         )
-
-    # Create assignment
-    assignment = ServiceServiceCategory(
-        service_id=service_id,
-        service_category_id=assignment_data.service_category_id
-    )
-    db.add(assignment)
     await db.commit()
-    await db.refresh(assignment)
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data=ServiceCategoryAssignmentResponse.model_validate(assignment),
         message="Category assigned to service successfully"
     )
@@ -133,10 +190,7 @@ async def remove_category_from_service(
     """Remove a category assignment from a service."""
     # Find the assignment
     result = await db.execute(
-        select(ServiceServiceCategory).where(
-            ServiceServiceCategory.service_id == service_id,
-            ServiceServiceCategory.service_category_id == category_id
-        )
+        _SEL_CATEGORY_ASSIGNMENT, {"service_id": service_id, "target_id": category_id}
     )
     assignment = result.scalar_one_or_none()
 
@@ -149,7 +203,7 @@ async def remove_category_from_service(
     await db.delete(assignment)
     await db.commit()
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data={"service_id": str(service_id), "category_id": str(category_id)},
         message="Category removed from service successfully"
     )
@@ -162,54 +216,37 @@ async def assign_contact_to_service(
     db: AsyncSession = Depends(get_db)
 ) -> SuccessResponse:
     """Assign a contact to a service."""
-    # Verify service exists
-    service_result = await db.execute(
-        select(Service).where(Service.id == service_id)
-    )
-    service = service_result.scalar_one_or_none()
-    if not service:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Service not found"
+    # Foreign keys validate the service and contact; a duplicate is
+    # skipped by ON CONFLICT and returns no row
+    stmt = (
+        pg_insert(ServiceContact)
+        .values(
+            service_id=service_id,
+            contact_id=contact_data.contact_id,
+            is_primary=contact_data.is_primary,
+            relationship_type=contact_data.relationship_type
         )
-
-    # Verify contact exists
-    contact_result = await db.execute(
-        select(Contact).where(Contact.id == contact_data.contact_id)
+        .on_conflict_do_nothing(constraint="uq_service_contact")
+        .returning(ServiceContact)
     )
-    contact = contact_result.scalar_one_or_none()
-    if not contact:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Contact not found"
+    try:
+        assignment = (await db.execute(stmt)).scalar_one_or_none()
+    except IntegrityError as exc:
+        # Other violations are left to the global integrity error handler
+        if not is_foreign_key_violation(exc):
+            raise
+        await _raise_missing_reference(
+            db, service_id, Contact, contact_data.contact_id, "Contact"
         )
 
-    # Check if assignment already exists
-    existing_result = await db.execute(
-        select(ServiceContact).where(
-            ServiceContact.service_id == service_id,
-            ServiceContact.contact_id == contact_data.contact_id
-        )
-    )
-    existing = existing_result.scalar_one_or_none()
-    if existing:
+    if assignment is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Contact already assigned to this service"
         )
-
-    # Create assignment
-    assignment = ServiceContact(
-        service_id=service_id,
-        contact_id=contact_data.contact_id,
-        is_primary=contact_data.is_primary,
-        relationship_type=contact_data.relationship_type
-    )
-    db.add(assignment)
     await db.commit()
-    await db.refresh(assignment)
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data=ServiceContactResponse.model_validate(assignment),
         message="Contact assigned to service successfully"
     )
@@ -224,10 +261,7 @@ async def remove_contact_from_service(
     """Remove a contact assignment from a service."""
     # Find the assignment
     result = await db.execute(
-        select(ServiceContact).where(
-            ServiceContact.service_id == service_id,
-            ServiceContact.contact_id == contact_id
-        )
+        _SEL_CONTACT_ASSIGNMENT, {"service_id": service_id, "target_id": contact_id}
     )
     assignment = result.scalar_one_or_none()
 
@@ -240,7 +274,7 @@ async def remove_contact_from_service(
     await db.delete(assignment)
     await db.commit()
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data={"service_id": str(service_id), "contact_id": str(contact_id)},
         message="Contact removed from service successfully"
     )
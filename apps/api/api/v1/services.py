@@ -2,11 +2,13 @@
 Service management API endpoints.
 """
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import cache_aside, cache_delete_prefix
 from core.database import get_db
 from models.schemas import (
     ServiceCreate,
@@ -19,15 +21,59 @@ from repositories.client_repository import ClientRepository
 
 router = APIRouter()
 
+# Service list pages are cached briefly to absorb bursts; service writes
+# drop every cached page
+SERVICE_LIST_CACHE_PREFIX = "services:list:"
+SERVICE_LIST_CACHE_TTL_SECONDS = 30
+
+# Validates a whole page in one call to pydantic-core
+_SERVICES_TA = TypeAdapter(List[ServiceResponse])
+
+
+def get_service_repository(db: AsyncSession = Depends(get_db)) -> ServiceRepository:
+    """Dependency to get a ServiceRepository bound to the request session."""
+    return ServiceRepository(db)
+
+
+def get_client_repository(db: AsyncSession = Depends(get_db)) -> ClientRepository:
+    """Dependency to get a ClientRepository bound to the request session."""
+    return ClientRepository(db)
+
+
+@cache_aside(
+    key=lambda service_repo, client_id, name_search, skip, limit: (
+        f"{SERVICE_LIST_CACHE_PREFIX}{client_id}:{skip}:{limit}:{name_search}"
+    ),
+    ttl_seconds=SERVICE_LIST_CACHE_TTL_SECONDS
+)
+async def _list_services(
+    service_repo: ServiceRepository,
+    client_id: Optional[uuid.UUID],
+    name_search: Optional[str],
+    skip: int,
+    limit: int
+) -> List[Dict[str, Any]]:
+    """Load one page of services as JSON-ready dicts."""
+    if client_id and name_search:
+        services = await service_repo.search_by_name_and_client(name_search, client_id, skip, limit)
+    elif client_id:
+        services = await service_repo.get_by_client_id(client_id, skip, limit)
+    else:
+        services = await service_repo.get_all(skip=skip, limit=limit)
+
+    return _SERVICES_TA.dump_python(
+        _SERVICES_TA.validate_python(services, from_attributes=True), mode="json"
+    )
+
 
 @router.post("/services", response_model=SuccessResponse, status_code=status.HTTP_201_CREATED)
 async def create_service(
     service_data: ServiceCreate,
-    db: AsyncSession = Depends(get_db)
+    service_repo: ServiceRepository = Depends(get_service_repository),
+    client_repo: ClientRepository = Depends(get_client_repository)
 ) -> SuccessResponse:
     """Create a new service."""
     # Verify client exists
-    client_repo = ClientRepository(db)
     client = await client_repo.get_by_id(service_data.client_id)
     if not client:
         raise HTTPException(
@@ -35,14 +81,14 @@ async def create_service(
             detail="Client not found"
         )
 
-    service_repo = ServiceRepository(db)
     service = await service_repo.create(
         name=service_data.name,
         description=service_data.description,
         client_id=service_data.client_id
     )
+    await cache_delete_prefix(SERVICE_LIST_CACHE_PREFIX)
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data=ServiceResponse.model_validate(service),
         message="Service created successfully"
     )
@@ -54,20 +100,15 @@ async def list_services(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     client_id: Optional[uuid.UUID] = Query(None, description="Filter by client ID"),
     name_search: Optional[str] = Query(None, description="Search services by name"),
-    db: AsyncSession = Depends(get_db)
+    service_repo: ServiceRepository = Depends(get_service_repository)
 ) -> SuccessResponse:
-    """List services with optional filtering."""
-    service_repo = ServiceRepository(db)
+    """
+    List services with optional filtering.
 
-    if client_id and name_search:
-        services = await service_repo.search_by_name_and_client(name_search, client_id, skip, limit)
-    elif client_id:
-        services = await service_repo.get_by_client_id(client_id, skip, limit)
-    else:
-        services = await service_repo.get_all(skip=skip, limit=limit)
-
-    service_responses = [ServiceResponse.model_validate(service) for service in services]
-    return SuccessResponse(
+    Pages are cached in Redis for SERVICE_LIST_CACHE_TTL_SECONDS.
+    """
+    service_responses = await _list_services(service_repo, client_id, name_search, skip, limit)
+    return SuccessResponse.model_construct(
         data=service_responses,
         message=f"Found {len(service_responses)} services"
     )
@@ -78,11 +119,11 @@ async def list_client_services(
     client_id: uuid.UUID,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    db: AsyncSession = Depends(get_db)
+    service_repo: ServiceRepository = Depends(get_service_repository),
+    client_repo: ClientRepository = Depends(get_client_repository)
 ) -> SuccessResponse:
     """List services for a specific client."""
     # Verify client exists
-    client_repo = ClientRepository(db)
     client = await client_repo.get_by_id(client_id)
     if not client:
         raise HTTPException(
@@ -90,11 +131,8 @@ async def list_client_services(
             detail="Client not found"
         )
 
-    service_repo = ServiceRepository(db)
-    services = await service_repo.get_by_client_id(client_id, skip, limit)
-
-    service_responses = [ServiceResponse.model_validate(service) for service in services]
-    return SuccessResponse(
+    service_responses = await _list_services(service_repo, client_id, None, skip, limit)
+    return SuccessResponse.model_construct(
         data=service_responses,
         message=f"Found {len(service_responses)} services for client"
     )
@@ -103,10 +141,9 @@ async def list_client_services(
 @router.get("/services/{service_id}", response_model=SuccessResponse)
 async def get_service(
     service_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db)
+    service_repo: ServiceRepository = Depends(get_service_repository)
 ) -> SuccessResponse:
     """Get a specific service by ID."""
-    service_repo = ServiceRepository(db)
     service = await service_repo.get_by_id(service_id)
 
     if not service:
@@ -115,7 +152,7 @@ async def get_service(
             detail="Service not found"
         )
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data=ServiceResponse.model_validate(service),
         message="Service retrieved successfully"
     )
@@ -124,10 +161,9 @@ async def get_service(
 @router.get("/services/{service_id}/with-projects", response_model=SuccessResponse)
 async def get_service_with_projects(
     service_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db)
+    service_repo: ServiceRepository = Depends(get_service_repository)
 ) -> SuccessResponse:
     """Get a service with all associated projects."""
-    service_repo = ServiceRepository(db)
     service = await service_repo.get_with_projects(service_id)
 
     if not service:
@@ -136,7 +172,7 @@ async def get_service_with_projects(
             detail="Service not found"
         )
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data=ServiceResponse.model_validate(service),
         message="Service with projects retrieved successfully"
     )
@@ -146,11 +182,9 @@ async def get_service_with_projects(
 async def update_service(
     service_id: uuid.UUID,
     service_data: ServiceUpdate,
-    db: AsyncSession = Depends(get_db)
+    service_repo: ServiceRepository = Depends(get_service_repository)
 ) -> SuccessResponse:
     """Update a service."""
-    service_repo = ServiceRepository(db)
-
     # Check if service exists
     existing_service = await service_repo.get_by_id(service_id)
     if not existing_service:
@@ -168,8 +202,9 @@ async def update_service(
 
     # Update service
     updated_service = await service_repo.update(service_id, **update_data)
+    await cache_delete_prefix(SERVICE_LIST_CACHE_PREFIX)
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data=ServiceResponse.model_validate(updated_service),
         message="Service updated successfully"
     )
@@ -178,11 +213,9 @@ async def update_service(
 @router.delete("/services/{service_id}", response_model=SuccessResponse)
 async def delete_service(
     service_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db)
+    service_repo: ServiceRepository = Depends(get_service_repository)
 ) -> SuccessResponse:
     """Delete a service."""
-    service_repo = ServiceRepository(db)
-
     # Check if service exists
     existing_service = await service_repo.get_by_id(service_id)
     if not existing_service:
@@ -198,8 +231,9 @@ async def delete_service(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete service"
         )
+    await cache_delete_prefix(SERVICE_LIST_CACHE_PREFIX)
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data={"id": str(service_id)},
         message="Service deleted successfully"
     )
\ No newline at end of file
@@ -6,9 +6,12 @@ import uuid
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_db
+from core.pagination import decode_cursor, encode_cursor
 from models.schemas import (
     WorkflowStateResponse,
     WorkflowEventResponse,
@@ -21,6 +24,19 @@ from core.workflow_templates import load_workflow_template
 
 router = APIRouter()
 
+# Validates a whole history page in one call to pydantic-core
+_WORKFLOW_EVENTS_TA = TypeAdapter(List[WorkflowEventResponse])
+
+
+def get_workflow_service(db: AsyncSession = Depends(get_db)) -> WorkflowService:
+    """Dependency to get a WorkflowService bound to the request session."""
+    return WorkflowService(db)
+
+
+def get_workflow_event_repository(db: AsyncSession = Depends(get_db)) -> WorkflowEventRepository:
+    """Dependency to get a WorkflowEventRepository bound to the request session."""
+    return WorkflowEventRepository(db)
+
 
 @router.get(
     "/projects/{project_id}/workflow",
@@ -29,7 +45,7 @@ router = APIRouter()
 )
 async def get_workflow_state(
     project_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db)
+    workflow_service: WorkflowService = Depends(get_workflow_service)
 ) -> WorkflowStateResponse:
     """
     Get current workflow state for a project.
@@ -45,8 +61,6 @@ async def get_workflow_state(
     Raises:
     - **404**: Project not found or workflow state not initialized
     """
-    workflow_service = WorkflowService(db)
-
     # Get workflow state
     workflow_state = await workflow_service.get_workflow_state(project_id)
     if not workflow_state:
@@ -55,17 +69,10 @@ async def get_workflow_state(
             detail=f"Project {project_id} not found or workflow state not initialized"
         )
 
-    # Get available transitions
-    template_name = workflow_state.stageData.get("template", "bmad_method")
-    available_transitions = await workflow_service.get_available_transitions(
-        project_id,
-        template_name
-    )
-
-    # Return with available transitions
+    # Return with available transitions, computed from the state already loaded
     response = WorkflowStateResponse(
         **workflow_state.model_dump(),
-        availableTransitions=available_transitions
+        availableTransitions=workflow_service.available_transitions(workflow_state)
     )
     return response
 
@@ -78,7 +85,7 @@ async def get_workflow_state(
 async def advance_workflow_stage(
     project_id: uuid.UUID,
     request: WorkflowAdvanceRequest,
-    db: AsyncSession = Depends(get_db)
+    workflow_service: WorkflowService = Depends(get_workflow_service)
 ) -> WorkflowStateResponse:
     """
     Advance workflow to next stage.
@@ -95,8 +102,6 @@ async def advance_workflow_stage(
     - **400**: Invalid transition (gate not approved, invalid toStage, etc.)
     - **404**: Project not found
     """
-    workflow_service = WorkflowService(db)
-
     # Use a placeholder user_id (in production, get from auth context)
     # For now, generate a UUID
     user_id = uuid.uuid4()
@@ -111,16 +116,10 @@ async def advance_workflow_stage(
             stage_data=request.stageData
         )
 
-        # Get available transitions for response
-        template_name = workflow_state.stageData.get("template", "bmad_method")
-        available_transitions = await workflow_service.get_available_transitions(
-            project_id,
-            template_name
-        )
-
+        # The returned state is current, so no second read is needed
         response = WorkflowStateResponse(
             **workflow_state.model_dump(),
-            availableTransitions=available_transitions
+            availableTransitions=workflow_service.available_transitions(workflow_state)
         )
         return response
 
@@ -139,7 +138,7 @@ async def advance_workflow_stage(
 async def handle_gate_approval(
     project_id: uuid.UUID,
     request: GateApprovalRequest,
-    db: AsyncSession = Depends(get_db)
+    workflow_service: WorkflowService = Depends(get_workflow_service)
 ) -> WorkflowStateResponse:
     """
     Approve or reject gate for current stage.
@@ -156,8 +155,6 @@ async def handle_gate_approval(
     - **400**: Current stage does not require gate approval
     - **404**: Project not found
     """
-    workflow_service = WorkflowService(db)
-
     try:
         if request.action == "approve":
             workflow_state = await workflow_service.approve_gate(
@@ -172,16 +169,10 @@ async def handle_gate_approval(
                 feedback=request.feedback
             )
 
-        # Get available transitions for response
-        template_name = workflow_state.stageData.get("template", "bmad_method")
-        available_transitions = await workflow_service.get_available_transitions(
-            project_id,
-            template_name
-        )
-
+        # The returned state is current, so no second read is needed
         response = WorkflowStateResponse(
             **workflow_state.model_dump(),
-            availableTransitions=available_transitions
+            availableTransitions=workflow_service.available_transitions(workflow_state)
         )
         return response
 
@@ -194,31 +185,34 @@ async def handle_gate_approval(
 
 @router.get(
     "/projects/{project_id}/workflow/history",
-    response_model=List[WorkflowEventResponse],
-    response_model_by_alias=True,
+    response_model=None,
+    responses={200: {"model": List[WorkflowEventResponse]}},
     status_code=status.HTTP_200_OK
 )
 async def get_workflow_history(
     project_id: uuid.UUID,
-    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
     limit: int = Query(50, ge=1, le=100, description="Events per page"),
-    db: AsyncSession = Depends(get_db)
-) -> List[WorkflowEventResponse]:
+    workflow_service: WorkflowService = Depends(get_workflow_service),
+    workflow_event_repo: WorkflowEventRepository = Depends(get_workflow_event_repository)
+) -> ORJSONResponse:
     """
-    Get workflow event history for a project.
+    Get workflow event history for a project with keyset pagination.
 
     Query Parameters:
-    - **page**: Page number (default: 1)
+    - **cursor**: Cursor for the next page (default: first page)
     - **limit**: Events per page (default: 50, max: 100)
 
     Returns:
-    - Array of workflow events sorted by timestamp (most recent first)
+    - Array of workflow events sorted by timestamp (most recent first);
+      when more events follow, the X-Next-Cursor response header holds
+      the cursor for the next page
 
     Raises:
+    - **400**: Invalid cursor
     - **404**: Project not found
     """
     # Verify project exists
-    workflow_service = WorkflowService(db)
     project = await workflow_service.get_project(project_id)
     if not project:
         raise HTTPException(
@@ -227,14 +221,22 @@ async def get_workflow_history(
         )
 
     # Get workflow events
-    workflow_event_repo = WorkflowEventRepository(db)
-    offset = (page - 1) * limit
-
     events = await workflow_event_repo.get_project_history(
         project_id=project_id,
-        limit=limit,
-        offset=offset
+        cursor=decode_cursor(cursor) if cursor else None,
+        # Fetch one extra row to know whether another page exists
+        limit=limit + 1
     )
 
-    # Convert to response schema
-    return [WorkflowEventResponse.model_validate(event) for event in events]
+    headers = {}
+    if len(events) > limit:
+        events = events[:limit]
+        last = events[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.timestamp, last.id)
+
+    # Validated once here; response_model=None skips FastAPI's second pass
+    items = _WORKFLOW_EVENTS_TA.validate_python(events, from_attributes=True)
+    return ORJSONResponse(
+        _WORKFLOW_EVENTS_TA.dump_python(items, mode="json", by_alias=True),
+        headers=headers
+    )
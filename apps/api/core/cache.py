@@ -0,0 +1,186 @@
+"""
+Redis cache helpers for AgentLab API.
+
+Every helper fails open: when caching is disabled or Redis is unreachable,
+reads behave as cache misses and writes are skipped, so requests fall
+through to the database.
+"""
+import functools
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, TypeVar
+
+import orjson
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """Get the shared Redis client, or None when caching is disabled."""
+    global _redis
+
+    settings = get_settings()
+    if not settings.CACHE_ENABLED:
+        return None
+
+    if _redis is None:
+        _redis = aioredis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=settings.CACHE_TIMEOUT_SECONDS,
+            socket_timeout=settings.CACHE_TIMEOUT_SECONDS,
+        )
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client."""
+    global _redis
+
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+async def cache_mget(*keys: str) -> List[Optional[bytes]]:
+    """Get several keys at once; missing keys and Redis failures yield None."""
+    client = get_redis()
+    if client is None:
+        return [None] * len(keys)
+    try:
+        return await client.mget(keys)
+    except RedisError as e:
+        logger.warning("Cache read failed: %s", e)
+        return [None] * len(keys)
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Get a single key; a miss or Redis failure yields None."""
+    return (await cache_mget(key))[0]
+
+
+async def cache_set(key: str, value: bytes, ttl_seconds: int, nx: bool = False) -> None:
+    """Set a key with an expiry, optionally only if it does not exist."""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, value, ex=ttl_seconds, nx=nx)
+    except RedisError as e:
+        logger.warning("Cache write failed: %s", e)
+
+
+async def cache_delete(*keys: str) -> None:
+    """Delete keys, ignoring Redis failures."""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.delete(*keys)
+    except RedisError as e:
+        logger.warning("Cache delete failed: %s", e)
+
+
+async def cache_delete_prefix(prefix: str) -> None:
+    """Delete every key starting with ``prefix``, ignoring Redis failures."""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        keys = [key async for key in client.scan_iter(match=f"{prefix}*", count=500)]
+        if keys:
+            await client.delete(*keys)
+    except RedisError as e:
+        logger.warning("Cache delete failed: %s", e)
+
+
+def cache_aside(
+    key: Callable[..., str],
+    ttl_seconds: int
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Cache an async function's JSON-serializable result.
+
+    Args:
+        key: Builds the cache key from the wrapped function's arguments
+        ttl_seconds: Expiry for cached results
+
+    Returns:
+        Decorator that serves hits from Redis and stores misses with orjson
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            cache_key = key(*args, **kwargs)
+            cached = await cache_get(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+
+            result = await func(*args, **kwargs)
+            await cache_set(cache_key, orjson.dumps(result), ttl_seconds)
+            return result
+        return wrapper
+    return decorator
+
+
+class EntityCache:
+    """
+    Short-lived cache of serialized entities keyed by UUID.
+
+    Besides the entity payload (``<prefix>:<id>``) it remembers IDs that
+    were looked up and not found (``<prefix>:<id>:missing``) so repeated
+    requests for bogus IDs do not reach the database.
+    """
+
+    MISSING_MARKER = b"1"
+
+    def __init__(self, prefix: str, ttl_seconds: int = 60):
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, entity_id: uuid.UUID) -> str:
+        return f"{self.prefix}:{entity_id}"
+
+    def _missing_key(self, entity_id: uuid.UUID) -> str:
+        return f"{self.prefix}:{entity_id}:missing"
+
+    async def lookup(self, entity_id: uuid.UUID) -> Tuple[bool, Optional[bytes]]:
+        """
+        Look up an entity.
+
+        Returns:
+            Tuple of (known to be missing, cached payload or None)
+        """
+        missing, payload = await cache_mget(
+            self._missing_key(entity_id), self._key(entity_id)
+        )
+        return missing is not None, payload
+
+    async def is_missing(self, entity_id: uuid.UUID) -> bool:
+        """Check whether the entity was recently found not to exist."""
+        return await cache_get(self._missing_key(entity_id)) is not None
+
+    async def mark_missing(self, entity_id: uuid.UUID) -> None:
+        """Remember that the entity does not exist."""
+        await cache_set(
+            self._missing_key(entity_id),
+            self.MISSING_MARKER,
+            self.ttl_seconds,
+            nx=True,
+        )
+
+    async def store(self, entity_id: uuid.UUID, payload: bytes) -> None:
+        """Cache the serialized entity and clear any missing marker."""
+        await cache_set(self._key(entity_id), payload, self.ttl_seconds)
+        await cache_delete(self._missing_key(entity_id))
+
+    async def invalidate(self, entity_id: uuid.UUID) -> None:
+        """Drop the cached entity and any missing marker."""
+        await cache_delete(self._key(entity_id), self._missing_key(entity_id))
@@ -1,9 +1,14 @@
 """
 Database configuration and session management for AgentLab API.
 """
+import logging
+import time
 from typing import AsyncGenerator
 
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -12,6 +17,8 @@ from sqlalchemy.orm import DeclarativeBase
 
 from core.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
@@ -19,40 +26,68 @@ class Base(DeclarativeBase):
     pass
 
 
-# Global database engine and session factory
-engine = None
-async_session_maker = None
-
-
-async def init_db() -> None:
-    """Initialize database engine and session factory."""
-    global engine, async_session_maker
-
+def _create_engine() -> AsyncEngine:
+    """Create the database engine from settings; no connection is opened yet."""
     settings = get_settings()
 
-    engine = create_async_engine(
+    db_engine = create_async_engine(
         settings.DATABASE_URL,
         echo=settings.DATABASE_ECHO,
-        pool_size=10,
-        max_overflow=20,
+        echo_pool="debug" if settings.DATABASE_ECHO else False,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        # Reuse the most recently returned connection so idle ones can be
+        # recycled and hot ones keep their prepared statements
+        pool_use_lifo=True,
         pool_pre_ping=True,
-        pool_recycle=3600,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        query_cache_size=1200,
+        connect_args={
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            # Short OLTP queries pay JIT compilation cost without benefit
+            "server_settings": {"jit": "off"},
+        },
     )
+    _install_slow_query_logging(db_engine.sync_engine, settings.SLOW_QUERY_THRESHOLD_MS)
+    return db_engine
+
+
+def _install_slow_query_logging(sync_engine: Engine, threshold_ms: int) -> None:
+    """Log statements whose execution exceeds threshold_ms."""
+    threshold = threshold_ms / 1000
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start_time"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("query_start_time", None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        if elapsed >= threshold:
+            logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+
+# Global database engine and session factory, created at import so the
+# request path never checks whether they exist
+engine = _create_engine()
+async_session_maker = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
 
-    async_session_maker = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+
+async def init_db() -> None:
+    """Startup hook; the engine and session factory already exist at import."""
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting database session."""
+    """Dependency for getting database session; ``async with`` closes it."""
     async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 async def close_db() -> None:
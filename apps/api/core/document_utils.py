@@ -2,16 +2,49 @@
 Document utility functions for hashing and content management.
 """
 import hashlib
+from typing import Iterable
+
+# Characters encoded per step when hashing large content, so only one
+# chunk's UTF-8 copy exists at a time instead of a copy of the document
+HASH_CHUNK_CHARS = 64 * 1024
 
 
 def generate_content_hash(content: str) -> str:
     """
     Generate SHA-256 hash for document content.
 
+    Content longer than HASH_CHUNK_CHARS is encoded and hashed in chunks;
+    the digest is identical to hashing the whole UTF-8 encoding.
+
     Args:
         content: The document content to hash
 
     Returns:
         SHA-256 hash as hexadecimal string (64 characters)
     """
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    if len(content) <= HASH_CHUNK_CHARS:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    digest = hashlib.sha256()
+    for start in range(0, len(content), HASH_CHUNK_CHARS):
+        digest.update(content[start:start + HASH_CHUNK_CHARS].encode('utf-8'))
+    return digest.hexdigest()
+
+
+def generate_content_hash_stream(chunks: Iterable[bytes]) -> str:
+    """
+    Generate SHA-256 hash for content that is already UTF-8 bytes.
+
+    Callers holding bytes (uploads, files) should use this instead of
+    decoding to str first.
+
+    Args:
+        chunks: UTF-8 encoded content, in order
+
+    Returns:
+        SHA-256 hash as hexadecimal string (64 characters)
+    """
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
@@ -1,13 +1,18 @@
 """
 Custom exceptions and error handlers for AgentLab API.
 """
+import logging
 from typing import Any, Dict, Optional
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
+logger = logging.getLogger(__name__)
+
 
 class AgentLabException(Exception):
     """Base exception for AgentLab."""
@@ -76,9 +81,13 @@ class BusinessRuleViolationError(AgentLabException):
 
 # Exception handlers
 
-async def agentlab_exception_handler(request: Request, exc: AgentLabException) -> JSONResponse:
+# Joins a validation error location into a dotted field name
+_join_field = ".".join
+
+
+async def agentlab_exception_handler(request: Request, exc: AgentLabException) -> ORJSONResponse:
     """Handle AgentLab custom exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -90,18 +99,21 @@ async def agentlab_exception_handler(request: Request, exc: AgentLabException) -
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
-    errors = []
-    for error in exc.errors():
-        field = ".".join(str(loc) for loc in error["loc"] if loc != "body")
-        errors.append({
-            "field": field,
+    errors = [
+        {
+            "field": _join_field([
+                loc if type(loc) is str else str(loc)
+                for loc in error["loc"] if loc != "body"
+            ]),
             "message": error["msg"],
             "type": error["type"]
-        })
+        }
+        for error in exc.errors()
+    ]
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
@@ -113,89 +125,66 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+def _error_body(code: str, message: str, details: Dict[str, Any]) -> bytes:
+    """Encode a static error payload once, at import."""
+    return orjson.dumps({"error": {"code": code, "message": message, "details": details}})
+
+
+def _static_error_response(status_code: int, body: bytes) -> Response:
+    """Build a response around a precomputed JSON error body."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+# Integrity error message phrases mapped to their responses, checked in order
+_INTEGRITY_ERROR_RESPONSES = (
+    ("unique constraint", status.HTTP_409_CONFLICT, _error_body(
+        "DUPLICATE_RESOURCE", "Resource already exists", {"constraint": "unique_constraint"}
+    )),
+    ("foreign key constraint", status.HTTP_400_BAD_REQUEST, _error_body(
+        "INVALID_REFERENCE", "Referenced resource does not exist", {"constraint": "foreign_key_constraint"}
+    )),
+    ("check constraint", status.HTTP_422_UNPROCESSABLE_ENTITY, _error_body(
+        "VALIDATION_ERROR", "Data violates database constraints", {"constraint": "check_constraint"}
+    )),
+)
+_INTEGRITY_ERROR_BYTES = _error_body("INTEGRITY_ERROR", "Database integrity constraint violated", {})
+_NOT_FOUND_BYTES = _error_body("RESOURCE_NOT_FOUND", "Requested resource not found", {})
+_INTERNAL_ERROR_BYTES = _error_body("INTERNAL_ERROR", "An unexpected error occurred", {})
+
+
+# SQLSTATE PostgreSQL reports when a referenced row does not exist
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def is_foreign_key_violation(exc: IntegrityError) -> bool:
+    """Return True when an integrity error is a foreign key violation."""
+    return getattr(exc.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION
+
+
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> Response:
     """Handle SQLAlchemy integrity errors."""
-    error_message = str(exc.orig) if hasattr(exc, 'orig') else str(exc)
+    error_message = str(getattr(exc, 'orig', exc)).lower()
 
     # Check for specific constraint violations
-    if "unique constraint" in error_message.lower():
-        return JSONResponse(
-            status_code=status.HTTP_409_CONFLICT,
-            content={
-                "error": {
-                    "code": "DUPLICATE_RESOURCE",
-                    "message": "Resource already exists",
-                    "details": {"constraint": "unique_constraint"}
-                }
-            }
-        )
-    elif "foreign key constraint" in error_message.lower():
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "error": {
-                    "code": "INVALID_REFERENCE",
-                    "message": "Referenced resource does not exist",
-                    "details": {"constraint": "foreign_key_constraint"}
-                }
-            }
-        )
-    elif "check constraint" in error_message.lower():
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": "Data violates database constraints",
-                    "details": {"constraint": "check_constraint"}
-                }
-            }
-        )
+    for phrase, status_code, body in _INTEGRITY_ERROR_RESPONSES:
+        if phrase in error_message:
+            return _static_error_response(status_code, body)
 
     # Generic integrity error
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content={
-            "error": {
-                "code": "INTEGRITY_ERROR",
-                "message": "Database integrity constraint violated",
-                "details": {}
-            }
-        }
-    )
+    return _static_error_response(status.HTTP_400_BAD_REQUEST, _INTEGRITY_ERROR_BYTES)
 
 
-async def not_found_handler(request: Request, exc: NoResultFound) -> JSONResponse:
+async def not_found_handler(request: Request, exc: NoResultFound) -> Response:
     """Handle SQLAlchemy NoResultFound errors."""
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content={
-            "error": {
-                "code": "RESOURCE_NOT_FOUND",
-                "message": "Requested resource not found",
-                "details": {}
-            }
-        }
-    )
+    return _static_error_response(status.HTTP_404_NOT_FOUND, _NOT_FOUND_BYTES)
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions."""
-    # Log the error for debugging
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.error(f"Unexpected error: {exc}", exc_info=True)
+    # Log the error with its traceback for debugging
+    logger.exception("Unexpected error: %s", exc)
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": {
-                "code": "INTERNAL_ERROR",
-                "message": "An unexpected error occurred",
-                "details": {}
-            }
-        }
-    )
+    return _static_error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, _INTERNAL_ERROR_BYTES)
 
 
 def register_exception_handlers(app):
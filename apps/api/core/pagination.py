@@ -0,0 +1,32 @@
+"""
+Keyset pagination cursors.
+
+A cursor is the opaque, URL-safe encoding of the (timestamp, id) position
+of the last row on a page. The next page selects rows strictly after that
+position in (timestamp DESC, id DESC) order.
+"""
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(row_timestamp: datetime, row_id: uuid.UUID) -> str:
+    """Encode the (timestamp, id) position of the last row on a page."""
+    raw = f"{row_timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        ts_part, id_part = raw.split("|", 1)
+        return datetime.fromisoformat(ts_part), uuid.UUID(id_part)
+    except (ValueError, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
@@ -0,0 +1,14 @@
+"""
+Custom response classes for AgentLab API.
+"""
+from typing import Any
+
+import msgspec
+from fastapi.responses import JSONResponse
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response encoded with msgspec, for msgspec.Struct payloads."""
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
@@ -1,18 +1,59 @@
 """
 Input sanitization utilities for security.
 """
+import html
 import re
+from functools import lru_cache
 from typing import Optional
 
+try:
+    import nh3
+except ImportError:
+    nh3 = None
+
 try:
     import bleach
 except ImportError:
     bleach = None
 
 
-ALLOWED_TAGS: list = []  # No HTML tags allowed in text fields
+ALLOWED_TAGS: frozenset = frozenset()  # No HTML tags allowed in text fields
 ALLOWED_ATTRIBUTES: dict = {}
 
+# Safe markdown HTML tags
+MARKDOWN_ALLOWED_TAGS: frozenset = frozenset({
+    'p', 'br', 'strong', 'em', 'code', 'pre', 'ul', 'ol', 'li',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'a', 'hr'
+})
+MARKDOWN_ALLOWED_ATTRIBUTES: dict = {
+    'a': frozenset({'href', 'title'}),
+    'code': frozenset({'class'})
+}
+
+# Compiled once at import for the regex fallback and path sanitizer
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_SCRIPT_RE = re.compile(r'<script.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style.*?</style>', re.DOTALL | re.IGNORECASE)
+_IFRAME_RE = re.compile(r'<iframe.*?</iframe>', re.DOTALL | re.IGNORECASE)
+_JS_URI_RE = re.compile(r'javascript:', re.IGNORECASE)
+_TRAVERSAL_RE = re.compile(r'\.\.[/\\]')
+
+# Inputs shorter than this (names, codes, paths) recur across requests and
+# are memoized; longer ones such as document bodies always run uncached
+SANITIZE_CACHE_MAX_LENGTH = 256
+SANITIZE_CACHE_SIZE = 4096
+
+# Characters an HTML cleaner rewrites even in tag-free text: both escape '<',
+# '>' and '&'; nh3 also escapes no-break spaces and drops a leading BOM, and
+# every C0 control except tab and newline is normalized ('\r'), dropped
+# ('\x00') or replaced with '?' (bleach)
+_CLEANER_REWRITTEN_RE = re.compile(r'[<>&\xa0\ufeff\x00-\x08\x0b-\x1f]')
+
+
+def _clean_is_noop(text: str) -> bool:
+    """Return True when nh3.clean or bleach.clean would return text unchanged."""
+    return _CLEANER_REWRITTEN_RE.search(text) is None
+
 
 def sanitize_html(text: str) -> str:
     """
@@ -27,16 +68,41 @@ def sanitize_html(text: str) -> str:
     if not text:
         return text
 
-    if bleach is None:
-        # Fallback: Remove basic HTML tags using regex
-        text = re.sub(r'<[^>]+>', '', text)
-        # Remove script content
-        text = re.sub(r'<script.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        # Remove style content
-        text = re.sub(r'<style.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    if len(text) < SANITIZE_CACHE_MAX_LENGTH:
+        return _sanitize_html_cached(text)
+    return _sanitize_html(text)
+
+
+def _sanitize_html(text: str) -> str:
+    """Sanitize text that is known to be non-empty."""
+    # Fast path: skip the cleaner or regex pass when it cannot change the text
+    if nh3 is None and bleach is None:
+        if '<' not in text:
+            return text.strip()
+    elif _clean_is_noop(text):
         return text.strip()
 
-    return bleach.clean(text, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, strip=True)
+    # Cleaners serialize their output as HTML; decode the entities they add
+    # so values such as "R&D" and "a < b" are stored as typed
+    if nh3 is not None:
+        text = html.unescape(nh3.clean(text, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES))
+    elif bleach is not None:
+        text = html.unescape(
+            bleach.clean(text, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, strip=True)
+        )
+
+    # Regex pass: the fallback without a cleaner, and after one it drops tags
+    # that were only entity-encoded in the input
+    # Remove basic HTML tags using regex
+    text = _HTML_TAG_RE.sub('', text)
+    # Remove script content
+    text = _SCRIPT_RE.sub('', text)
+    # Remove style content
+    text = _STYLE_RE.sub('', text)
+    return text.strip()
+
+
+_sanitize_html_cached = lru_cache(maxsize=SANITIZE_CACHE_SIZE)(_sanitize_html)
 
 
 def sanitize_path(path: str) -> str:
@@ -52,8 +118,19 @@ def sanitize_path(path: str) -> str:
     if not path:
         return path
 
+    if len(path) < SANITIZE_CACHE_MAX_LENGTH:
+        return _sanitize_path_cached(path)
+    return _sanitize_path(path)
+
+
+def _sanitize_path(path: str) -> str:
+    """Sanitize a path that is known to be non-empty."""
+    # Fast path: nothing below would change the path
+    if '..' not in path and '\x00' not in path and not path.startswith('/'):
+        return path
+
     # Remove ../ and ..\ patterns (path traversal)
-    path = re.sub(r'\.\.[/\\]', '', path)
+    path = _TRAVERSAL_RE.sub('', path)
     # Remove leading slashes for relative paths
     path = path.lstrip('/')
     # Remove null bytes
@@ -62,6 +139,9 @@ def sanitize_path(path: str) -> str:
     return path
 
 
+_sanitize_path_cached = lru_cache(maxsize=SANITIZE_CACHE_SIZE)(_sanitize_path)
+
+
 def sanitize_markdown(content: str) -> str:
     """
     Sanitize markdown content for safe rendering.
@@ -75,21 +155,45 @@ def sanitize_markdown(content: str) -> str:
     if not content:
         return content
 
-    if bleach is None:
-        # Fallback: Remove basic dangerous content
-        content = re.sub(r'<script.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<iframe.*?</iframe>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'javascript:', '', content, flags=re.IGNORECASE)
-        return content
-
-    # Allow safe markdown HTML tags
-    allowed_tags = [
-        'p', 'br', 'strong', 'em', 'code', 'pre', 'ul', 'ol', 'li',
-        'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'a', 'hr'
-    ]
-    allowed_attributes = {
-        'a': ['href', 'title'],
-        'code': ['class']
-    }
-
-    return bleach.clean(content, tags=allowed_tags, attributes=allowed_attributes, strip=True)
+    if len(content) < SANITIZE_CACHE_MAX_LENGTH:
+        return _sanitize_markdown_cached(content)
+    return _sanitize_markdown(content)
+
+
+def _sanitize_markdown(content: str) -> str:
+    """Sanitize markdown that is known to be non-empty."""
+    if nh3 is None and bleach is None:
+        # Fast path: the tag patterns need '<'; search for the URI scheme
+        # case-insensitively without building a lowercased copy
+        if '<' not in content and not _JS_URI_RE.search(content):
+            return content
+    else:
+        # Markdown link targets are plain text to an HTML cleaner, so the
+        # javascript: scheme is stripped here as in the regex pass
+        content = _JS_URI_RE.sub('', content)
+
+        # Fast path: plain markdown passes through the cleaner unchanged
+        if _clean_is_noop(content):
+            return content
+
+        # Decode the entities the cleaner adds so "a < b", "R&D" and "> quote"
+        # keep their markdown meaning
+        if nh3 is not None:
+            content = html.unescape(nh3.clean(
+                content, tags=MARKDOWN_ALLOWED_TAGS, attributes=MARKDOWN_ALLOWED_ATTRIBUTES
+            ))
+        else:
+            content = html.unescape(bleach.clean(
+                content, tags=MARKDOWN_ALLOWED_TAGS, attributes=MARKDOWN_ALLOWED_ATTRIBUTES,
+                strip=True
+            ))
+
+    # Regex pass: the fallback without a cleaner, and after one it drops
+    # dangerous content that was only entity-encoded in the input
+    content = _SCRIPT_RE.sub('', content)
+    content = _IFRAME_RE.sub('', content)
+    content = _JS_URI_RE.sub('', content)
+    return content
+
+
+_sanitize_markdown_cached = lru_cache(maxsize=SANITIZE_CACHE_SIZE)(_sanitize_markdown)
@@ -0,0 +1,37 @@
+"""
+Helpers for streaming large JSON responses.
+"""
+from typing import Any, AsyncIterable, AsyncIterator, Callable, List
+
+import orjson
+
+
+async def iter_json_array(
+    rows: AsyncIterable[Any],
+    batch_size: int = 100,
+    encode: Callable[[List[Any]], bytes] = orjson.dumps
+) -> AsyncIterator[bytes]:
+    """
+    Encode rows as a JSON array, yielding one chunk per batch.
+
+    Args:
+        rows: Async iterable of items accepted by ``encode``
+        batch_size: Number of rows encoded per chunk
+        encode: Encoder turning a list of rows into a JSON array
+
+    Yields:
+        Byte chunks that concatenate to a valid JSON array
+    """
+    yield b"["
+    separator = b""
+    batch: List[Any] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            # Strip the surrounding brackets the encoder adds to the batch list
+            yield separator + encode(batch)[1:-1]
+            separator = b","
+            batch = []
+    if batch:
+        yield separator + encode(batch)[1:-1]
+    yield b"]"
@@ -2,25 +2,25 @@
 Workflow template configuration for BMAD Method and other workflow templates.
 """
 from dataclasses import dataclass
-from functools import lru_cache
-from typing import Dict, List, Set, Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowStage:
     """Represents a single stage in a workflow template."""
     stage_id: str
     stage_name: str
     gate_required: bool
-    next_stages: List[str]
+    next_stages: Tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowTemplate:
     """Represents a complete workflow template with multiple stages."""
     template_id: str
     template_name: str
-    stages: Dict[str, WorkflowStage]
+    stages: Mapping[str, WorkflowStage]
 
 
 def detect_cycles(template: WorkflowTemplate) -> bool:
@@ -33,30 +33,32 @@ def detect_cycles(template: WorkflowTemplate) -> bool:
     Returns:
         True if circular dependencies detected, False otherwise
     """
-    def has_cycle_dfs(stage_id: str, visited: Set[str], rec_stack: Set[str]) -> bool:
-        """DFS-based cycle detection."""
-        visited.add(stage_id)
-        rec_stack.add(stage_id)
-
-        stage = template.stages.get(stage_id)
-        if stage:
-            for next_stage in stage.next_stages:
-                if next_stage not in visited:
-                    if has_cycle_dfs(next_stage, visited, rec_stack):
-                        return True
-                elif next_stage in rec_stack:
-                    return True
-
-        rec_stack.remove(stage_id)
-        return False
-
-    visited: Set[str] = set()
-    rec_stack: Set[str] = set()
-
-    for stage_id in template.stages:
-        if stage_id not in visited:
-            if has_cycle_dfs(stage_id, visited, rec_stack):
+    # Iterative three-color DFS: 0 = unvisited, 1 = on the current path,
+    # 2 = fully explored. Unknown next stages count as explored.
+    stages = template.stages
+    color = dict.fromkeys(stages, 0)
+    stack = []
+
+    for start in stages:
+        if color[start]:
+            continue
+        color[start] = 1
+        stack.append((start, iter(stages[start].next_stages)))
+
+        while stack:
+            stage_id, next_ids = stack[-1]
+            next_id = next(next_ids, None)
+            if next_id is None:
+                color[stage_id] = 2
+                stack.pop()
+                continue
+
+            state = color.get(next_id, 2)
+            if state == 1:
                 return True
+            if state == 0:
+                color[next_id] = 1
+                stack.append((next_id, iter(stages[next_id].next_stages)))
 
     return False
 
@@ -88,10 +90,79 @@ def validate_template(template: WorkflowTemplate) -> tuple[bool, Optional[str]]:
     return True, None
 
 
-@lru_cache(maxsize=10)
+# Built and validated once at import; every caller shares this instance,
+# so its stage mapping is read-only
+_BMAD_TEMPLATE = WorkflowTemplate(
+    template_id="bmad_method",
+    template_name="BMAD Method Workflow",
+    stages=MappingProxyType({
+        "discovery": WorkflowStage(
+            stage_id="discovery",
+            stage_name="Discovery",
+            gate_required=False,
+            next_stages=("market_research",)
+        ),
+        "market_research": WorkflowStage(
+            stage_id="market_research",
+            stage_name="Market Research",
+            gate_required=False,
+            next_stages=("prd_creation",)
+        ),
+        "prd_creation": WorkflowStage(
+            stage_id="prd_creation",
+            stage_name="PRD Creation",
+            gate_required=True,
+            next_stages=("architecture",)
+        ),
+        "architecture": WorkflowStage(
+            stage_id="architecture",
+            stage_name="Architecture Design",
+            gate_required=True,
+            next_stages=("development",)
+        ),
+        "development": WorkflowStage(
+            stage_id="development",
+            stage_name="Development",
+            gate_required=True,
+            next_stages=("qa_review",)
+        ),
+        "qa_review": WorkflowStage(
+            stage_id="qa_review",
+            stage_name="QA Review",
+            gate_required=True,
+            next_stages=("deployment",)
+        ),
+        "deployment": WorkflowStage(
+            stage_id="deployment",
+            stage_name="Deployment",
+            gate_required=False,
+            next_stages=("production_monitoring",)
+        ),
+        "production_monitoring": WorkflowStage(
+            stage_id="production_monitoring",
+            stage_name="Production Monitoring",
+            gate_required=False,
+            next_stages=()
+        )
+    })
+)
+
+_is_valid, _error_msg = validate_template(_BMAD_TEMPLATE)
+if not _is_valid:
+    raise ValueError(f"Invalid BMAD template: {_error_msg}")
+del _is_valid, _error_msg
+
+_TEMPLATE_REGISTRY: Mapping[str, WorkflowTemplate] = MappingProxyType({
+    "bmad_method": _BMAD_TEMPLATE,
+})
+
+
 def load_workflow_template(template_name: str = "bmad_method") -> WorkflowTemplate:
     """
-    Load workflow template by name. Cached for performance.
+    Load workflow template by name.
+
+    Templates are built and validated at import, so this is a dictionary
+    lookup that returns the same shared instance on every call.
 
     Args:
         template_name: Name of the template to load (default: "bmad_method")
@@ -102,70 +173,10 @@ def load_workflow_template(template_name: str = "bmad_method") -> WorkflowTempla
     Raises:
         ValueError: If template name is unknown
     """
-    if template_name == "bmad_method":
-        template = WorkflowTemplate(
-            template_id="bmad_method",
-            template_name="BMAD Method Workflow",
-            stages={
-                "discovery": WorkflowStage(
-                    stage_id="discovery",
-                    stage_name="Discovery",
-                    gate_required=False,
-                    next_stages=["market_research"]
-                ),
-                "market_research": WorkflowStage(
-                    stage_id="market_research",
-                    stage_name="Market Research",
-                    gate_required=False,
-                    next_stages=["prd_creation"]
-                ),
-                "prd_creation": WorkflowStage(
-                    stage_id="prd_creation",
-                    stage_name="PRD Creation",
-                    gate_required=True,
-                    next_stages=["architecture"]
-                ),
-                "architecture": WorkflowStage(
-                    stage_id="architecture",
-                    stage_name="Architecture Design",
-                    gate_required=True,
-                    next_stages=["development"]
-                ),
-                "development": WorkflowStage(
-                    stage_id="development",
-                    stage_name="Development",
-                    gate_required=True,
-                    next_stages=["qa_review"]
-                ),
-                "qa_review": WorkflowStage(
-                    stage_id="qa_review",
-                    stage_name="QA Review",
-                    gate_required=True,
-                    next_stages=["deployment"]
-                ),
-                "deployment": WorkflowStage(
-                    stage_id="deployment",
-                    stage_name="Deployment",
-                    gate_required=False,
-                    next_stages=["production_monitoring"]
-                ),
-                "production_monitoring": WorkflowStage(
-                    stage_id="production_monitoring",
-                    stage_name="Production Monitoring",
-                    gate_required=False,
-                    next_stages=[]
-                )
-            }
-        )
-
-        # Validate template on load
-        is_valid, error_msg = validate_template(template)
-        if not is_valid:
-            raise ValueError(f"Invalid BMAD template: {error_msg}")
-
-        return template
-
-    raise ValueError(f"Unknown workflow template: {template_name}")
+    try:
+        return _TEMPLATE_REGISTRY[template_name]
+    except KeyError:
+        raise ValueError(f"Unknown workflow template: {template_name}") from None
 
 
 def get_stage(template: WorkflowTemplate, stage_id: str) -> Optional[WorkflowStage]:
@@ -1,11 +1,14 @@
 """
 FastAPI application entry point for AgentLab API.
 """
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from core.config import get_settings
 from core.database import init_db
@@ -16,8 +19,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for startup and shutdown events."""
     # Startup
     await init_db()
+    from services.audit_rollup_service import run_audit_rollup_refresher
+    rollup_task = asyncio.create_task(
+        run_audit_rollup_refresher(get_settings().AUDIT_ROLLUP_REFRESH_SECONDS)
+    )
     yield
-    # Shutdown - cleanup if needed
+    # Shutdown
+    rollup_task.cancel()
+    try:
+        await rollup_task
+    except asyncio.CancelledError:
+        pass
+    from core.cache import close_redis
+    await close_redis()
 
 
 def create_app() -> FastAPI:
@@ -32,6 +46,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware for frontend integration
@@ -41,8 +56,14 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
+    # Compress larger JSON payloads (list and audit endpoints) for clients
+    # that send Accept-Encoding: gzip. Level 5 keeps nearly all of level 9's
+    # ratio on JSON at a fraction of the CPU per response.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Register exception handlers
     from core.exceptions import register_exception_handlers
     register_exception_handlers(app)
@@ -78,4 +99,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
     )
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""audit_log_keyset_indexes
+
+Revision ID: a1c4e8f2b7d3
+Revises: 3c0d9b26a0a0
+Create Date: 2025-10-06 09:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e8f2b7d3'
+down_revision: Union[str, Sequence[str], None] = '3c0d9b26a0a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add indexes backing keyset pagination of audit_log."""
+    op.create_index(
+        'idx_audit_log_timestamp_id',
+        'audit_log',
+        [sa.text('timestamp DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'idx_audit_log_table_name_timestamp_id',
+        'audit_log',
+        ['table_name', sa.text('timestamp DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'idx_audit_log_user_id_timestamp_id',
+        'audit_log',
+        ['user_id', sa.text('timestamp DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('user_id IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    """Remove audit_log keyset pagination indexes."""
+    op.drop_index('idx_audit_log_user_id_timestamp_id', table_name='audit_log')
+    op.drop_index('idx_audit_log_table_name_timestamp_id', table_name='audit_log')
+    op.drop_index('idx_audit_log_timestamp_id', table_name='audit_log')
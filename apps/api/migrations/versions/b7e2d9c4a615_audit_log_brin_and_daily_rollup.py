@@ -0,0 +1,53 @@
+"""audit_log_brin_and_daily_rollup
+
+Revision ID: b7e2d9c4a615
+Revises: a1c4e8f2b7d3
+Create Date: 2025-10-06 10:47:03.551829
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d9c4a615'
+down_revision: Union[str, Sequence[str], None] = 'a1c4e8f2b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add BRIN index on audit_log.timestamp and the audit_log_daily rollup."""
+    op.execute(
+        "CREATE INDEX idx_audit_log_ts_brin ON audit_log "
+        "USING BRIN (timestamp) WITH (pages_per_range = 128)"
+    )
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW audit_log_daily AS
+        SELECT
+            date_trunc('day', timestamp) AS day,
+            action,
+            table_name,
+            user_id,
+            count(*) AS entry_count
+        FROM audit_log
+        GROUP BY 1, 2, 3, 4
+    """)
+
+    # REFRESH ... CONCURRENTLY requires a unique index on the view
+    op.create_index(
+        'uq_audit_log_daily_bucket',
+        'audit_log_daily',
+        ['day', 'action', 'table_name', 'user_id'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Remove audit_log_daily rollup and BRIN index."""
+    op.drop_index('uq_audit_log_daily_bucket', table_name='audit_log_daily')
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS audit_log_daily")
+    op.drop_index('idx_audit_log_ts_brin', table_name='audit_log')
@@ -0,0 +1,41 @@
+"""audit_log_action_partial_indexes
+
+Revision ID: c3f8a1d6e924
+Revises: b7e2d9c4a615
+Create Date: 2025-10-06 14:05:38.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a1d6e924'
+down_revision: Union[str, Sequence[str], None] = 'b7e2d9c4a615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-action partial timestamp indexes on audit_log."""
+    op.create_index(
+        'idx_audit_log_ts_insert', 'audit_log', ['timestamp'],
+        postgresql_where=sa.text("action = 'INSERT'")
+    )
+    op.create_index(
+        'idx_audit_log_ts_update', 'audit_log', ['timestamp'],
+        postgresql_where=sa.text("action = 'UPDATE'")
+    )
+    op.create_index(
+        'idx_audit_log_ts_delete', 'audit_log', ['timestamp'],
+        postgresql_where=sa.text("action = 'DELETE'")
+    )
+
+
+def downgrade() -> None:
+    """Remove per-action partial timestamp indexes."""
+    op.drop_index('idx_audit_log_ts_delete', table_name='audit_log')
+    op.drop_index('idx_audit_log_ts_update', table_name='audit_log')
+    op.drop_index('idx_audit_log_ts_insert', table_name='audit_log')
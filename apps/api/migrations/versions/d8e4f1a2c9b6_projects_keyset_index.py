@@ -0,0 +1,32 @@
+"""projects_keyset_index
+
+Revision ID: d8e4f1a2c9b6
+Revises: c3f8a1d6e924
+Create Date: 2025-10-07 09:41:27.615304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e4f1a2c9b6'
+down_revision: Union[str, Sequence[str], None] = 'c3f8a1d6e924'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add index backing keyset pagination of projects."""
+    op.create_index(
+        'idx_projects_created_at_id',
+        'projects',
+        [sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Remove projects keyset pagination index."""
+    op.drop_index('idx_projects_created_at_id', table_name='projects')
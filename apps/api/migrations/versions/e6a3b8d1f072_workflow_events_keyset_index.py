@@ -0,0 +1,32 @@
+"""workflow_events_keyset_index
+
+Revision ID: e6a3b8d1f072
+Revises: d8e4f1a2c9b6
+Create Date: 2025-10-08 10:12:54.208733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a3b8d1f072'
+down_revision: Union[str, Sequence[str], None] = 'd8e4f1a2c9b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add index backing keyset pagination of workflow history."""
+    op.create_index(
+        'idx_workflow_events_project_timestamp_id',
+        'workflow_events',
+        ['project_id', sa.text('timestamp DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Remove workflow history keyset pagination index."""
+    op.drop_index('idx_workflow_events_project_timestamp_id', table_name='workflow_events')
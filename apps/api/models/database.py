@@ -17,9 +17,11 @@ from sqlalchemy import (
     Integer,
     UniqueConstraint,
     Index,
+    CheckConstraint,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from pgvector.sqlalchemy import Vector
 
@@ -184,6 +186,11 @@ class Project(Base):
         "Document", back_populates="project", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Backs keyset pagination of the project list
+        Index('idx_projects_created_at_id', text('created_at DESC'), text('id DESC')),
+    )
+
 
 class ImplementationType(Base):
     """Reference table for implementation types."""
@@ -409,6 +416,14 @@ class WorkflowEvent(Base):
     # Relationships
     project: Mapped["Project"] = relationship("Project", back_populates="workflow_events")
 
+    __table_args__ = (
+        # Backs keyset pagination of a project's workflow history
+        Index(
+            'idx_workflow_events_project_timestamp_id',
+            'project_id', text('timestamp DESC'), text('id DESC')
+        ),
+    )
+
 
 class Document(Base):
     """Document model with version tracking and semantic search."""
@@ -667,3 +682,47 @@ class GateReviewer(Base):
         "WorkflowGate", back_populates="reviewers"
     )
     contact: Mapped["Contact"] = relationship("Contact")
+
+
+class AuditLog(Base):
+    """Row-level audit trail populated by database triggers."""
+
+    __tablename__ = "audit_log"
+
+    __table_args__ = (
+        CheckConstraint("action IN ('INSERT', 'UPDATE', 'DELETE')", name='ck_audit_log_action'),
+        Index('idx_audit_log_table_name', 'table_name'),
+        Index('idx_audit_log_record_id', 'record_id'),
+        Index('idx_audit_log_action', 'action'),
+        Index('idx_audit_log_timestamp', 'timestamp', postgresql_ops={'timestamp': 'DESC'}),
+        Index('idx_audit_log_user_id', 'user_id'),
+        Index('idx_audit_log_timestamp_id', text('timestamp DESC'), text('id DESC')),
+        Index(
+            'idx_audit_log_table_name_timestamp_id',
+            'table_name', text('timestamp DESC'), text('id DESC')
+        ),
+        Index(
+            'idx_audit_log_user_id_timestamp_id',
+            'user_id', text('timestamp DESC'), text('id DESC'),
+            postgresql_where=text('user_id IS NOT NULL')
+        ),
+        Index('idx_audit_log_ts_insert', 'timestamp', postgresql_where=text("action = 'INSERT'")),
+        Index('idx_audit_log_ts_update', 'timestamp', postgresql_where=text("action = 'UPDATE'")),
+        Index('idx_audit_log_ts_delete', 'timestamp', postgresql_where=text("action = 'DELETE'")),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    table_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    record_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    action: Mapped[str] = mapped_column(String(20), nullable=False)
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    old_values: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    new_values: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    changed_fields: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String), nullable=True)
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
+    user_agent: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
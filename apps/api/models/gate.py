@@ -1,10 +1,12 @@
 """Gate management Pydantic models."""
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from models.schemas import ORMFastMixin
+
 
 class GateApprovalRequest(BaseModel):
     """Request model for gate approval."""
@@ -49,7 +51,7 @@ class GateReviewer(BaseModel):
         from_attributes = True
 
 
-class Gate(BaseModel):
+class Gate(ORMFastMixin, BaseModel):
     """Gate model with workflow information."""
     id: UUID
     template_id: UUID
@@ -65,6 +67,14 @@ class Gate(BaseModel):
         from_attributes = True
 
 
+class GateDetail(BaseModel):
+    """Gate with its history, reviewers and metrics."""
+    gate: Gate
+    history: List[Dict[str, Any]]
+    reviewers: List[GateReviewer]
+    metrics: Dict[str, Any]
+
+
 class GateResetRequest(BaseModel):
     """Request model for resetting a gate."""
     pass  # No body required for reset
@@ -4,11 +4,12 @@ Pydantic models for request/response schemas.
 import uuid
 import re
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, Callable, Tuple
 from enum import Enum
 
 from pydantic import BaseModel, Field, ConfigDict, field_validator, EmailStr
 
+from core.config import get_settings
 from core.sanitization import sanitize_html, sanitize_path, sanitize_markdown
 
 
@@ -69,6 +70,49 @@ class DocumentType(str, Enum):
     OTHER = "other"
 
 
+# Per-model (field name, ORM attribute, converter) tuples for from_orm_fast
+_orm_projections: Dict[type, Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]] = {}
+
+
+class ORMFastMixin:
+    """
+    Build response models from trusted ORM rows without validation.
+
+    Rows loaded from our own database already satisfy the schema, so
+    ``from_orm_fast`` copies the attributes straight into
+    ``model_construct``. Set ``TRUST_DB_ROWS=false`` to fall back to
+    ``model_validate``.
+    """
+
+    @classmethod
+    def _orm_projection(cls) -> Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]:
+        projection = _orm_projections.get(cls)
+        if projection is None:
+            fields = []
+            for name, field in cls.model_fields.items():
+                attr = field.validation_alias if isinstance(field.validation_alias, str) else field.alias
+                annotation = field.annotation
+                # ORM enums are separate classes; coerce to the schema's enum
+                converter = annotation if isinstance(annotation, type) and issubclass(annotation, Enum) else None
+                fields.append((name, attr or name, converter))
+            projection = _orm_projections[cls] = tuple(fields)
+        return projection
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """Build the model from an ORM instance, skipping validation when trusted."""
+        if not get_settings().TRUST_DB_ROWS:
+            return cls.model_validate(obj)
+
+        values = {}
+        for name, attr, converter in cls._orm_projection():
+            value = getattr(obj, attr)
+            if converter is not None and value is not None:
+                value = converter(value)
+            values[name] = value
+        return cls.model_construct(**values)
+
+
 # Client schemas
 class ClientBase(BaseModel):
     """Base client schema."""
@@ -93,6 +137,14 @@ class ClientUpdate(BaseModel):
     business_domain: Optional[BusinessDomain] = None
 
 
+class ClientListParams(BaseModel):
+    """Query parameters for listing clients."""
+    skip: int = Field(0, ge=0, description="Number of records to skip")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum number of records to return")
+    business_domain: Optional[BusinessDomain] = Field(None, description="Filter by business domain")
+    name_search: Optional[str] = Field(None, description="Search clients by name")
+
+
 class ClientResponse(ClientBase):
     """Client response schema."""
     id: uuid.UUID
@@ -188,6 +240,9 @@ class ProjectCreate(ProjectBase):
     service_id: uuid.UUID
     implementation_type_id: Optional[uuid.UUID] = None
 
+    # Store enum values so model_dump() yields column-ready strings
+    model_config = ConfigDict(use_enum_values=True)
+
 
 class ProjectUpdate(BaseModel):
     """Project update schema."""
@@ -197,6 +252,9 @@ class ProjectUpdate(BaseModel):
     implementation_type_id: Optional[uuid.UUID] = None
     claude_code_path: Optional[str] = Field(None, max_length=500)
 
+    # Store enum values so model_dump() yields column-ready strings
+    model_config = ConfigDict(use_enum_values=True)
+
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: Optional[str]) -> Optional[str]:
@@ -392,6 +450,14 @@ class ContactUpdate(BaseModel):
         return v
 
 
+class ContactListParams(BaseModel):
+    """Query parameters for listing contacts."""
+    skip: int = Field(0, ge=0, description="Number of records to skip")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum number of records to return")
+    is_active: Optional[bool] = Field(None, description="Filter by active status")
+    name_search: Optional[str] = Field(None, description="Search contacts by name")
+
+
 class ContactResponse(ContactBase):
     """Contact response schema."""
     id: uuid.UUID
@@ -615,9 +681,10 @@ class UpdateDocumentRequest(BaseModel):
         return sanitize_html(v)
 
 
-class DocumentResponse(DocumentBase):
+class DocumentResponse(ORMFastMixin, DocumentBase):
     """Document response schema."""
     id: uuid.UUID
+    documentType: DocumentType = Field(validation_alias="document_type")
     projectId: uuid.UUID = Field(alias="project_id")
     content: str
     contentHash: str = Field(alias="content_hash")
@@ -629,7 +696,7 @@ class DocumentResponse(DocumentBase):
 
 
 # DocumentVersion schemas
-class DocumentVersionResponse(BaseModel):
+class DocumentVersionResponse(ORMFastMixin, BaseModel):
     """Document version response schema."""
     id: uuid.UUID
     documentId: uuid.UUID = Field(alias="document_id")
@@ -665,7 +732,7 @@ class CreateCommentRequest(BaseModel):
         return v
 
 
-class CommentResponse(BaseModel):
+class CommentResponse(ORMFastMixin, BaseModel):
     """Comment response schema."""
     id: uuid.UUID
     documentId: uuid.UUID = Field(alias="document_id")
@@ -0,0 +1,102 @@
+"""
+msgspec response structs for hot list endpoints.
+
+These mirror the serialized form of the matching Pydantic response
+schemas (same keys, same order) but skip Pydantic entirely. Field names
+follow the ORM attributes so structs can be built from rows directly;
+``msgspec.field(name=...)`` sets the output key where the two differ.
+"""
+import uuid
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar
+
+import msgspec
+
+from core.config import get_settings
+from models.schemas import DocumentType, Language
+
+S = TypeVar("S", bound=msgspec.Struct)
+
+# Per-struct row projectors, built once on first use
+_projectors: Dict[type, Callable[[Any], Any]] = {}
+
+
+class DocumentStruct(msgspec.Struct):
+    """Serialized form of DocumentResponse."""
+    name: str
+    language: Language
+    document_type: DocumentType = msgspec.field(name="documentType")
+    id: uuid.UUID
+    project_id: uuid.UUID
+    content: str
+    content_hash: str
+    version: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class DocumentVersionStruct(msgspec.Struct):
+    """Serialized form of DocumentVersionResponse."""
+    id: uuid.UUID
+    document_id: uuid.UUID
+    version: int
+    content: str
+    content_hash: str
+    change_summary: Optional[str]
+    created_by: uuid.UUID
+    created_at: datetime
+
+
+class CommentStruct(msgspec.Struct):
+    """Serialized form of CommentResponse."""
+    id: uuid.UUID
+    document_id: uuid.UUID
+    user_id: uuid.UUID
+    content: str
+    line_number: Optional[int]
+    resolved: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+def struct_projector(struct_type: Type[S]) -> Callable[[Any], S]:
+    """
+    Get a function building ``struct_type`` positionally from one row.
+
+    A single attrgetter over the struct's fields reads every attribute in
+    one C call; the tuple is passed straight to the struct constructor
+    without validation.
+
+    Args:
+        struct_type: Target struct type
+
+    Returns:
+        Projector for trusted rows
+    """
+    project = _projectors.get(struct_type)
+    if project is None:
+        read_fields = attrgetter(*struct_type.__struct_fields__)
+
+        def project(row: Any) -> S:
+            return struct_type(*read_fields(row))
+
+        _projectors[struct_type] = project
+    return project
+
+
+def to_structs(struct_type: Type[S], rows: Iterable[Any]) -> List[S]:
+    """
+    Convert ORM rows to structs.
+
+    Args:
+        struct_type: Target struct type
+        rows: ORM instances
+
+    Returns:
+        List of structs; validated with msgspec.convert when TRUST_DB_ROWS is off
+    """
+    if get_settings().TRUST_DB_ROWS:
+        project = struct_projector(struct_type)
+        return [project(row) for row in rows]
+    return [msgspec.convert(row, struct_type, from_attributes=True) for row in rows]
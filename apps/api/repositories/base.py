@@ -2,11 +2,11 @@
 Base repository pattern for data access.
 """
 import uuid
-from typing import Generic, TypeVar, Type, Optional, List, Any
+from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import Select, bindparam, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, raiseload
 
 ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 
@@ -14,10 +14,19 @@ ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 class BaseRepository(Generic[ModelType]):
     """Base repository with common CRUD operations."""
 
+    # Lookup-by-id statements built once per model and shared by all instances
+    _get_by_id_statements: Dict[type, Select] = {}
+
     def __init__(self, model: Type[ModelType], db: AsyncSession):
         self.model = model
         self.db = db
 
+        stmt = self._get_by_id_statements.get(model)
+        if stmt is None:
+            stmt = select(model).where(model.id == bindparam("id"))
+            self._get_by_id_statements[model] = stmt
+        self._get_by_id_stmt = stmt
+
     async def create(self, **kwargs) -> ModelType:
         """Create a new record."""
         obj = self.model(**kwargs)
@@ -28,9 +37,7 @@ class BaseRepository(Generic[ModelType]):
 
     async def get_by_id(self, id: uuid.UUID) -> Optional[ModelType]:
         """Get record by ID."""
-        result = await self.db.execute(
-            select(self.model).where(self.model.id == id)
-        )
+        result = await self.db.execute(self._get_by_id_stmt, {"id": id})
         return result.scalar_one_or_none()
 
     async def get_all(
@@ -40,7 +47,8 @@ class BaseRepository(Generic[ModelType]):
         **filters
     ) -> List[ModelType]:
         """Get all records with optional filtering."""
-        query = select(self.model)
+        # List responses only read columns; fail loudly on any relationship access
+        query = select(self.model).options(raiseload("*"))
 
         # Apply filters
         for key, value in filters.items():
@@ -52,28 +60,34 @@ class BaseRepository(Generic[ModelType]):
         return list(result.scalars().all())
 
     async def update(self, id: uuid.UUID, **kwargs) -> Optional[ModelType]:
-        """Update record by ID."""
+        """Update record by ID, returning None if it does not exist."""
         # Remove None values
         update_data = {k: v for k, v in kwargs.items() if v is not None}
 
         if not update_data:
             return await self.get_by_id(id)
 
-        await self.db.execute(
+        result = await self.db.execute(
             update(self.model)
             .where(self.model.id == id)
             .values(**update_data)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
         )
+        obj = result.scalar_one_or_none()
         await self.db.commit()
-        return await self.get_by_id(id)
+        return obj
 
     async def delete(self, id: uuid.UUID) -> bool:
-        """Delete record by ID."""
+        """Delete record by ID, returning False if it does not exist."""
         result = await self.db.execute(
-            delete(self.model).where(self.model.id == id)
+            delete(self.model)
+            .where(self.model.id == id)
+            .returning(self.model.id)
         )
+        deleted_id = result.scalar_one_or_none()
         await self.db.commit()
-        return result.rowcount > 0
+        return deleted_id is not None
 
     async def count(self, **filters) -> int:
         """Count records with optional filtering."""
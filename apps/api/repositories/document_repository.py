@@ -2,8 +2,8 @@
 Document repository for database operations.
 """
 import uuid
-from typing import List, Optional
-from sqlalchemy import select, func
+from typing import AsyncIterator, List, Optional
+from sqlalchemy import Select, select, func, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -85,6 +85,21 @@ class DocumentRepository:
         )
         return result.scalar_one_or_none()
 
+    async def exists(self, document_id: uuid.UUID) -> bool:
+        """
+        Check whether a document exists without loading it.
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            True if the document exists
+        """
+        result = await self.db.execute(
+            select(exists().where(Document.id == document_id))
+        )
+        return result.scalar_one()
+
     async def get_by_project_id(
         self,
         project_id: uuid.UUID,
@@ -106,6 +121,55 @@ class DocumentRepository:
         Returns:
             List of documents
         """
+        query = self._project_documents_query(project_id, document_type, language, limit, offset)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def stream_by_project_id(
+        self,
+        project_id: uuid.UUID,
+        document_type: Optional[DocumentType] = None,
+        language: Optional[Language] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> AsyncIterator[Document]:
+        """
+        Stream documents by project ID with optional filters.
+
+        The query is started before returning so database errors surface
+        to the caller rather than midway through a streamed response.
+
+        Args:
+            project_id: Project ID
+            document_type: Optional document type filter
+            language: Optional language filter
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            Async iterator over documents, newest first
+        """
+        query = self._project_documents_query(project_id, document_type, language, limit, offset)
+        documents = await self.db.stream_scalars(query)
+
+        async def rows() -> AsyncIterator[Document]:
+            try:
+                async for document in documents:
+                    yield document
+            finally:
+                await documents.close()
+
+        return rows()
+
+    @staticmethod
+    def _project_documents_query(
+        project_id: uuid.UUID,
+        document_type: Optional[DocumentType],
+        language: Optional[Language],
+        limit: int,
+        offset: int
+    ) -> Select:
+        """Build the filtered, newest-first page query for a project's documents."""
         query = select(Document).where(Document.project_id == project_id)
 
         if document_type:
@@ -114,10 +178,7 @@ class DocumentRepository:
         if language:
             query = query.where(Document.language == language)
 
-        query = query.order_by(Document.created_at.desc()).limit(limit).offset(offset)
-
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return query.order_by(Document.created_at.desc()).limit(limit).offset(offset)
 
     async def update_document(
         self,
@@ -1,12 +1,27 @@
 """Repository for ImplementationType model."""
+import time
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from models.database import ImplementationType
 
+# Implementation types are seeded reference data, so a whole-table snapshot
+# is reused across requests for this long before reloading
+IMPLEMENTATION_TYPE_CACHE_TTL_SECONDS = 300.0
+
+# (monotonic time of load, detached rows ordered by name)
+_snapshot: Optional[Tuple[float, Tuple[ImplementationType, ...]]] = None
+
+
+def clear_implementation_type_cache() -> None:
+    """Drop the cached snapshot so the next lookup reloads the table."""
+    global _snapshot
+    _snapshot = None
+
 
 class ImplementationTypeRepository:
     """Repository for managing implementation types."""
@@ -15,6 +30,34 @@ class ImplementationTypeRepository:
         """Initialize repository with database session."""
         self.db = db
 
+    async def _all_implementation_types(self) -> Tuple[ImplementationType, ...]:
+        """
+        Get every implementation type, from the snapshot when it is fresh.
+
+        Rows are expunged after loading so they stay readable once this
+        session is gone; raiseload keeps relationship access from trying
+        to lazy load on a detached instance.
+        """
+        global _snapshot
+
+        if _snapshot is not None:
+            loaded_at, rows = _snapshot
+            if time.monotonic() - loaded_at < IMPLEMENTATION_TYPE_CACHE_TTL_SECONDS:
+                return rows
+
+        query = (
+            select(ImplementationType)
+            .options(raiseload("*"))
+            .order_by(ImplementationType.name)
+        )
+        result = await self.db.execute(query)
+        rows = tuple(result.scalars().all())
+        for row in rows:
+            self.db.expunge(row)
+
+        _snapshot = (time.monotonic(), rows)
+        return rows
+
     async def list_implementation_types(
         self, is_active: Optional[bool] = True
     ) -> List[ImplementationType]:
@@ -25,17 +68,12 @@ class ImplementationTypeRepository:
             is_active: Filter by active status (default: True)
 
         Returns:
-            List of ImplementationType objects
+            List of ImplementationType objects ordered by name
         """
-        query = select(ImplementationType)
-
-        if is_active is not None:
-            query = query.where(ImplementationType.is_active == is_active)
-
-        query = query.order_by(ImplementationType.name)
-
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        rows = await self._all_implementation_types()
+        if is_active is None:
+            return list(rows)
+        return [row for row in rows if row.is_active == is_active]
 
     async def get_implementation_type_by_id(
         self, impl_type_id: uuid.UUID
@@ -49,9 +87,10 @@ class ImplementationTypeRepository:
         Returns:
             ImplementationType object or None if not found
         """
-        query = select(ImplementationType).where(ImplementationType.id == impl_type_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        for row in await self._all_implementation_types():
+            if row.id == impl_type_id:
+                return row
+        return None
 
     async def get_implementation_type_by_code(
         self, code: str
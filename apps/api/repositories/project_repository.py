@@ -1,10 +1,12 @@
 """Repository for Project model and related operations."""
 import uuid
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, delete, exists, lambda_stmt, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from models.database import (
     Project,
@@ -58,27 +60,25 @@ class ProjectRepository:
         status: Optional[str] = None,
         project_type: Optional[str] = None,
         implementation_type_id: Optional[uuid.UUID] = None,
-        page: int = 1,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
         limit: int = 50,
     ) -> List[Project]:
         """
-        List projects with optional filtering and pagination.
+        List projects with optional filtering and keyset pagination.
 
         Args:
             service_id: Filter by service ID
             status: Filter by project status
             project_type: Filter by project type
             implementation_type_id: Filter by implementation type ID
-            page: Page number (1-indexed)
+            cursor: (created_at, id) of the last project on the previous page
             limit: Number of results per page
 
         Returns:
-            List of Project objects
+            List of Project objects, newest first
         """
-        query = select(Project).options(
-            selectinload(Project.service),
-            selectinload(Project.implementation_type),
-        )
+        # ProjectResponse only reads columns; fail loudly on any relationship access
+        query = select(Project).options(raiseload("*"))
 
         # Apply filters
         filters = []
@@ -90,16 +90,15 @@ class ProjectRepository:
             filters.append(Project.project_type == project_type)
         if implementation_type_id:
             filters.append(Project.implementation_type_id == implementation_type_id)
+        if cursor:
+            # Seek past the previous page instead of scanning and skipping it
+            filters.append(tuple_(Project.created_at, Project.id) < tuple_(*cursor))
 
         if filters:
             query = query.where(and_(*filters))
 
-        # Apply pagination
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
-
-        # Order by most recent first
-        query = query.order_by(Project.created_at.desc())
+        # Order by most recent first; id breaks ties between equal timestamps
+        query = query.order_by(Project.created_at.desc(), Project.id.desc()).limit(limit)
 
         result = await self.db.execute(query)
         return list(result.scalars().all())
@@ -117,14 +116,18 @@ class ProjectRepository:
         Returns:
             Project object or None if not found
         """
-        query = select(Project).where(Project.id == project_id)
+        # lambda_stmt caches the constructed statement per code path, so
+        # repeat lookups skip rebuilding the select and its loader options
+        query = lambda_stmt(lambda: select(Project).where(Project.id == project_id))
 
         if include_relations:
-            query = query.options(
-                selectinload(Project.service),
-                selectinload(Project.implementation_type),
-                selectinload(Project.project_contacts).selectinload(ProjectContact.contact),
-                selectinload(Project.user_category_assignments).selectinload(
+            # Many-to-one relationships join into the project row; the two
+            # collections each take one extra SELECT with their target joined in
+            query += lambda s: s.options(
+                joinedload(Project.service),
+                joinedload(Project.implementation_type),
+                selectinload(Project.project_contacts).joinedload(ProjectContact.contact),
+                selectinload(Project.user_category_assignments).joinedload(
                     ProjectServiceCategory.service_category
                 ),
             )
@@ -132,6 +135,21 @@ class ProjectRepository:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def exists(self, project_id: uuid.UUID) -> bool:
+        """
+        Check whether a project exists without loading it.
+
+        Args:
+            project_id: UUID of the project
+
+        Returns:
+            True if the project exists
+        """
+        result = await self.db.execute(
+            select(exists().where(Project.id == project_id))
+        )
+        return result.scalar_one()
+
     async def update_project(
         self, project_id: uuid.UUID, data: Dict[str, Any]
     ) -> Optional[Project]:
@@ -143,18 +161,31 @@ class ProjectRepository:
             data: Dictionary of fields to update
 
         Returns:
-            Updated Project object or None if not found
-        """
-        project = await self.get_project_by_id(project_id, include_relations=False)
+            Updated Project object, or None if the project was not found or
+            the given implementation_type_id does not exist
+        """
+        values = {key: value for key, value in data.items() if value is not None}
+        conditions = [Project.id == project_id]
+        if "implementation_type_id" in values:
+            # Checked inside the UPDATE so the type cannot vanish between
+            # a separate lookup and the write
+            conditions.append(
+                exists().where(ImplementationType.id == values["implementation_type_id"])
+            )
+
+        # One UPDATE ... RETURNING both checks existence and reloads the row
+        stmt = (
+            update(Project)
+            .where(*conditions)
+            .values(**values)
+            .returning(Project)
+            .execution_options(populate_existing=True)
+        )
+        project = (await self.db.execute(stmt)).scalar_one_or_none()
         if not project:
             return None
 
-        for key, value in data.items():
-            if hasattr(project, key) and value is not None:
-                setattr(project, key, value)
-
         await self.db.commit()
-        await self.db.refresh(project)
         return project
 
     async def delete_project(self, project_id: uuid.UUID) -> bool:
@@ -167,18 +198,19 @@ class ProjectRepository:
         Returns:
             True if deleted, False if not found
         """
-        project = await self.get_project_by_id(project_id, include_relations=False)
-        if not project:
+        # Associations are removed by the database's ON DELETE CASCADE
+        stmt = delete(Project).where(Project.id == project_id).returning(Project.id)
+        deleted_id = (await self.db.execute(stmt)).scalar_one_or_none()
+        if deleted_id is None:
             return False
 
-        await self.db.delete(project)
         await self.db.commit()
         return True
 
     # Project Contact methods
     async def assign_contact_to_project(
         self, project_id: uuid.UUID, contact_id: uuid.UUID, data: Dict[str, Any]
-    ) -> ProjectContact:
+    ) -> Optional[ProjectContact]:
         """
         Assign a contact to a project.
 
@@ -188,14 +220,21 @@ class ProjectRepository:
             data: Additional data (contact_type, is_active)
 
         Returns:
-            Created ProjectContact association
-        """
-        project_contact = ProjectContact(
-            project_id=project_id, contact_id=contact_id, **data
+            Created ProjectContact association with its contact loaded, or
+            None if the contact is already assigned with this contact_type
+        """
+        stmt = (
+            pg_insert(ProjectContact)
+            .values(project_id=project_id, contact_id=contact_id, **data)
+            .on_conflict_do_nothing(constraint="uq_project_contact")
+            .returning(ProjectContact)
+            .options(selectinload(ProjectContact.contact))
         )
-        self.db.add(project_contact)
+        project_contact = (await self.db.execute(stmt)).scalar_one_or_none()
+        if project_contact is None:
+            return None
+
         await self.db.commit()
-        await self.db.refresh(project_contact)
         return project_contact
 
     async def list_project_contacts(self, project_id: uuid.UUID) -> List[ProjectContact]:
@@ -208,8 +247,8 @@ class ProjectRepository:
         Returns:
             List of ProjectContact associations with contact data
         """
-        query = (
-            select(ProjectContact)
+        query = lambda_stmt(
+            lambda: select(ProjectContact)
             .where(ProjectContact.project_id == project_id)
             .options(selectinload(ProjectContact.contact))
         )
@@ -290,7 +329,7 @@ class ProjectRepository:
     # Project User Category methods
     async def assign_user_category_to_project(
         self, project_id: uuid.UUID, category_id: uuid.UUID
-    ) -> ProjectServiceCategory:
+    ) -> Optional[ProjectServiceCategory]:
         """
         Assign a user category to a project.
 
@@ -299,14 +338,21 @@ class ProjectRepository:
             category_id: UUID of the service category
 
         Returns:
-            Created ProjectServiceCategory association
-        """
-        assignment = ProjectServiceCategory(
-            project_id=project_id, service_category_id=category_id
+            Created ProjectServiceCategory association with its category
+            loaded, or None if the category is already assigned
+        """
+        stmt = (
+            pg_insert(ProjectServiceCategory)
+            .values(project_id=project_id, service_category_id=category_id)
+            .on_conflict_do_nothing(constraint="uq_project_service_category")
+            .returning(ProjectServiceCategory)
+            .options(selectinload(ProjectServiceCategory.service_category))
         )
-        self.db.add(assignment)
+        assignment = (await self.db.execute(stmt)).scalar_one_or_none()
+        if assignment is None:
+            return None
+
         await self.db.commit()
-        await self.db.refresh(assignment)
         return assignment
 
     async def list_project_user_categories(
@@ -321,8 +367,8 @@ class ProjectRepository:
         Returns:
             List of ProjectServiceCategory associations with category data
         """
-        query = (
-            select(ProjectServiceCategory)
+        query = lambda_stmt(
+            lambda: select(ProjectServiceCategory)
             .where(ProjectServiceCategory.project_id == project_id)
             .options(selectinload(ProjectServiceCategory.service_category))
         )
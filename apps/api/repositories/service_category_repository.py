@@ -6,6 +6,7 @@ from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from models.database import ServiceCategory
 from repositories.base import BaseRepository
@@ -32,6 +33,7 @@ class ServiceCategoryRepository(BaseRepository[ServiceCategory]):
         """Get all active service categories."""
         query = (
             select(ServiceCategory)
+            .options(raiseload("*"))
             .where(ServiceCategory.is_active == True)
             .offset(skip)
             .limit(limit)
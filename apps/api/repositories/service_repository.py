@@ -6,11 +6,23 @@ from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from models.database import Service, Client, Project
 from repositories.base import BaseRepository
 
+# Project columns loaded alongside a service; the workflow_state JSONB and
+# description text are left out since service views only list projects.
+REQUIRED_PROJECT_COLS = (
+    Project.id,
+    Project.service_id,
+    Project.name,
+    Project.project_type,
+    Project.status,
+    Project.created_at,
+    Project.updated_at,
+)
+
 
 class ServiceRepository(BaseRepository[Service]):
     """Repository for Service operations."""
@@ -22,10 +34,10 @@ class ServiceRepository(BaseRepository[Service]):
         """Get service with all associated projects."""
         result = await self.db.execute(
             select(Service)
-            .options(selectinload(Service.projects))
+            .options(selectinload(Service.projects).load_only(*REQUIRED_PROJECT_COLS))
             .where(Service.id == service_id)
         )
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
     async def get_by_client_id(
         self,
@@ -36,6 +48,7 @@ class ServiceRepository(BaseRepository[Service]):
         """Get services by client ID."""
         result = await self.db.execute(
             select(Service)
+            .options(raiseload("*"))
             .where(Service.client_id == client_id)
             .offset(skip)
             .limit(limit)
@@ -52,6 +65,7 @@ class ServiceRepository(BaseRepository[Service]):
         """Search services by name pattern within a specific client."""
         result = await self.db.execute(
             select(Service)
+            .options(raiseload("*"))
             .where(
                 Service.client_id == client_id,
                 Service.name.ilike(f"%{name_pattern}%")
@@ -2,11 +2,12 @@
 Repository for workflow event data access.
 """
 import uuid
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 
-from sqlalchemy import select, desc
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from models.database import WorkflowEvent, WorkflowEventType
 from repositories.base import BaseRepository
@@ -61,26 +62,40 @@ class WorkflowEventRepository(BaseRepository[WorkflowEvent]):
         project_id: uuid.UUID,
         event_type: Optional[WorkflowEventType] = None,
         limit: int = 100,
-        offset: int = 0
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None
     ) -> List[WorkflowEvent]:
         """
-        Get workflow event history for a project.
+        Get workflow event history for a project with keyset pagination.
 
         Args:
             project_id: Project UUID
             event_type: Optional filter by event type
             limit: Maximum number of events to return
-            offset: Number of events to skip
+            cursor: (timestamp, id) of the last event on the previous page
 
         Returns:
             List of WorkflowEvents sorted by timestamp DESC
         """
-        query = select(WorkflowEvent).where(WorkflowEvent.project_id == project_id)
+        # WorkflowEventResponse only reads columns; fail loudly on any relationship access
+        query = (
+            select(WorkflowEvent)
+            .options(raiseload("*"))
+            .where(WorkflowEvent.project_id == project_id)
+        )
 
         if event_type:
             query = query.where(WorkflowEvent.event_type == event_type)
 
-        query = query.order_by(desc(WorkflowEvent.timestamp)).offset(offset).limit(limit)
+        if cursor:
+            # Seek past the previous page instead of scanning and skipping it
+            query = query.where(
+                tuple_(WorkflowEvent.timestamp, WorkflowEvent.id) < tuple_(*cursor)
+            )
+
+        # id breaks ties between events recorded in the same transaction
+        query = query.order_by(
+            WorkflowEvent.timestamp.desc(), WorkflowEvent.id.desc()
+        ).limit(limit)
 
         result = await self.db.execute(query)
         return list(result.scalars().all())
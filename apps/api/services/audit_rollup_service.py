@@ -0,0 +1,73 @@
+"""
+Background refresh of the audit_log_daily materialized view.
+"""
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Session-level advisory lock held by the single process that refreshes the rollup
+AUDIT_ROLLUP_LOCK_KEY = 6_410_201
+
+_TRY_LOCK = text("SELECT pg_try_advisory_lock(:key)")
+_REFRESH = text("REFRESH MATERIALIZED VIEW CONCURRENTLY audit_log_daily")
+
+
+def _create_lock_engine() -> AsyncEngine:
+    """Engine for the refresher's own connection, kept out of the request pool."""
+    return create_async_engine(get_settings().DATABASE_URL, poolclass=NullPool)
+
+
+async def _refresh_while_leader(engine: AsyncEngine, interval_seconds: int) -> None:
+    """
+    Refresh the rollup every interval for as long as this process holds the lock.
+
+    Returns immediately when another process already holds it. The engine
+    does not pool, so closing the connection releases the lock.
+
+    Args:
+        engine: Unpooled engine dedicated to the refresher
+        interval_seconds: Delay between refreshes
+    """
+    async with engine.connect() as conn:
+        acquired = await conn.scalar(_TRY_LOCK, {"key": AUDIT_ROLLUP_LOCK_KEY})
+        await conn.commit()
+        if not acquired:
+            return
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await conn.execute(_REFRESH)
+            await conn.commit()
+
+
+async def run_audit_rollup_refresher(interval_seconds: int) -> None:
+    """
+    Periodically refresh the audit_log_daily rollup from a single process.
+
+    Every worker runs this loop, but only the one holding the advisory lock
+    refreshes; the others retry the lock each interval so one of them takes
+    over if the leader exits. The first refresh happens one interval after
+    startup rather than on every worker boot. The lock is held on a
+    dedicated connection so it never takes a slot from the request pool.
+
+    Args:
+        interval_seconds: Delay between refreshes
+    """
+    engine = _create_lock_engine()
+    try:
+        while True:
+            try:
+                await _refresh_while_leader(engine, interval_seconds)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Failed to refresh audit_log_daily")
+            await asyncio.sleep(interval_seconds)
+    finally:
+        await engine.dispose()
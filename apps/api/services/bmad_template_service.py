@@ -1,6 +1,9 @@
 """BMAD Template Service for importing and managing workflow templates."""
 
+import copy
 import json
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 import uuid
@@ -54,6 +57,14 @@ class BMAdTemplateService:
         "production_monitoring",
     ]
 
+    # Maximum number of distinct template files kept parsed in memory
+    PARSE_CACHE_SIZE = 32
+
+    def __init__(self) -> None:
+        # Resolved path -> ((mtime_ns, size), parsed template), least recently
+        # used first; a changed file replaces its own entry
+        self._parse_cache: OrderedDict[str, tuple[tuple[int, int], dict]] = OrderedDict()
+
     def parse_template(self, file_path: Path) -> dict:
         """Parse YAML or JSON template file.
 
@@ -91,6 +102,41 @@ class BMAdTemplateService:
                 f"Failed to parse JSON template: {str(e)}", e.doc, e.pos
             )
 
+    def parse_template_cached(self, file_path: Path) -> dict:
+        """Parse template file, reusing the previous result if it is unchanged.
+
+        One entry is kept per resolved path and replaced when the file's
+        mtime or size changes, so edits on disk are picked up on the next
+        call. At most PARSE_CACHE_SIZE files are kept, evicting the least
+        recently used. A deep copy is returned so callers cannot mutate the
+        cached entry.
+
+        Args:
+            file_path: Path to template file (.yml, .yaml, or .json)
+
+        Returns:
+            Parsed template as dictionary
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # Let parse_template raise its usual errors
+            return self.parse_template(file_path)
+
+        path = str(file_path.resolve())
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._parse_cache.get(path)
+        if entry is not None and entry[0] == version:
+            self._parse_cache.move_to_end(path)
+            template = entry[1]
+        else:
+            template = self.parse_template(file_path)
+            self._parse_cache[path] = (version, template)
+            self._parse_cache.move_to_end(path)
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return copy.deepcopy(template)
+
     def validate_template_structure(self, template: dict) -> Tuple[bool, list[str]]:
         """Validate template has required structure.
 
@@ -264,7 +310,7 @@ class BMAdTemplateService:
 
         try:
             # Step 1: Parse template
-            template = self.parse_template(file_path)
+            template = self.parse_template_cached(file_path)
 
             # Step 2: Validate structure
             is_valid, errors = self.validate_template_structure(template)
@@ -285,3 +331,9 @@ class BMAdTemplateService:
         except (FileNotFoundError, yaml.YAMLError, json.JSONDecodeError, ValueError) as e:
             all_errors.append(str(e))
             return (None, all_errors)
+
+
+@lru_cache()
+def get_template_service() -> BMAdTemplateService:
+    """Dependency for getting the shared BMAD template service."""
+    return BMAdTemplateService()
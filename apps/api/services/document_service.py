@@ -2,12 +2,13 @@
 Document service for business logic and orchestration.
 """
 import uuid
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.database import Document, DocumentType, Language
 from repositories.document_repository import DocumentRepository
 from repositories.document_version_repository import DocumentVersionRepository
+from repositories.comment_repository import CommentRepository
 from services.embedding_service import get_embedding_service
 from core.document_utils import generate_content_hash
 
@@ -25,8 +26,21 @@ class DocumentService:
         self.db = db
         self.document_repo = DocumentRepository(db)
         self.version_repo = DocumentVersionRepository(db)
+        self._comment_repo: Optional[CommentRepository] = None
         self.embedding_service = get_embedding_service()
 
+    @property
+    def versions(self) -> DocumentVersionRepository:
+        """Document version repository bound to this service's session."""
+        return self.version_repo
+
+    @property
+    def comments(self) -> CommentRepository:
+        """Comment repository bound to this service's session, built on first use."""
+        if self._comment_repo is None:
+            self._comment_repo = CommentRepository(self.db)
+        return self._comment_repo
+
     async def create_document_with_version(
         self,
         project_id: uuid.UUID,
@@ -160,6 +174,18 @@ class DocumentService:
         """
         return await self.document_repo.get_by_id(document_id)
 
+    async def document_exists(self, document_id: uuid.UUID) -> bool:
+        """
+        Check whether a document exists.
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            True if the document exists
+        """
+        return await self.document_repo.exists(document_id)
+
     async def get_project_documents(
         self,
         project_id: uuid.UUID,
@@ -189,6 +215,35 @@ class DocumentService:
             offset=offset
         )
 
+    async def iter_project_documents(
+        self,
+        project_id: uuid.UUID,
+        document_type: Optional[DocumentType] = None,
+        language: Optional[Language] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> AsyncIterator[Document]:
+        """
+        Stream documents for a project with optional filters.
+
+        Args:
+            project_id: Project ID
+            document_type: Optional document type filter
+            language: Optional language filter
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            Async iterator over documents, newest first
+        """
+        return await self.document_repo.stream_by_project_id(
+            project_id=project_id,
+            document_type=document_type,
+            language=language,
+            limit=limit,
+            offset=offset
+        )
+
     async def search_similar_documents(
         self,
         query_text: str,
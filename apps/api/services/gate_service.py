@@ -4,10 +4,13 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, and_, or_, func, text
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID as PG_UUID
+from sqlalchemy.types import DateTime, String
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from core.cache import cache_aside
 from models.database import (
     WorkflowGate,
     GateReviewer,
@@ -25,6 +28,93 @@ from services.interfaces.workflow_progression_interface import IWorkflowProgress
 
 logger = logging.getLogger(__name__)
 
+# Gate row plus its history, active reviewers and project-wide status
+# counts, aggregated to JSON so the detail view is a single round trip.
+_GATE_DETAIL_QUERY = text("""
+    SELECT
+        g.id, g.template_id, g.gate_id, g.name, g.stage_id,
+        g.criteria, g.status, g.created_at,
+        (
+            SELECT COALESCE(json_agg(json_build_object(
+                'id', e.id,
+                'event_type', e.event_type,
+                'user_id', e.user_id,
+                'timestamp', e.timestamp,
+                'metadata', e.event_metadata
+            ) ORDER BY e.timestamp DESC), '[]'::json)
+            FROM workflow_events e
+            WHERE e.event_metadata ->> 'gate_id' = CAST(g.id AS text)
+        ) AS history,
+        (
+            SELECT COALESCE(json_agg(json_build_object(
+                'id', r.id,
+                'gate_id', r.gate_id,
+                'contact_id', r.contact_id,
+                'reviewer_role', r.reviewer_role,
+                'assigned_at', r.assigned_at,
+                'contact', json_build_object(
+                    'id', c.id,
+                    'name', c.name,
+                    'email', c.email,
+                    'role', c.role,
+                    'is_active', c.is_active
+                )
+            )), '[]'::json)
+            FROM gate_reviewer r
+            JOIN contacts c ON c.id = r.contact_id
+            WHERE r.gate_id = g.id AND c.is_active
+        ) AS reviewers,
+        (
+            SELECT COALESCE(json_object_agg(counts.status, counts.total), '{}'::json)
+            FROM (
+                SELECT status, count(*) AS total
+                FROM workflow_gate
+                GROUP BY status
+            ) AS counts
+        ) AS status_counts
+    FROM workflow_gate g
+    WHERE g.id = :gate_id
+""").columns(
+    id=PG_UUID(as_uuid=True),
+    template_id=PG_UUID(as_uuid=True),
+    gate_id=String,
+    name=String,
+    stage_id=String,
+    criteria=JSONB,
+    status=String,
+    created_at=DateTime,
+    history=JSON,
+    reviewers=JSON,
+    status_counts=JSON,
+)
+
+GATE_METRICS_CACHE_TTL_SECONDS = 30
+
+
+# Gates are not yet scoped to projects, so every project shares one entry
+GATE_METRICS_CACHE_KEY = "gate_metrics"
+
+
+# Stored enum labels mapped to the values the history endpoints return
+_EVENT_TYPE_VALUES = {event_type.name: event_type.value for event_type in WorkflowEventType}
+
+
+def _metrics_from_counts(counts: Dict[str, int]) -> Dict[str, Any]:
+    """Build the gate metrics payload from per-status gate counts."""
+    # Calculate average approval time
+    # This requires joining with workflow_events
+    # Simplified for now
+    avg_approval_time = 0  # TODO: Calculate from events
+
+    return {
+        'total_gates': sum(counts.values()),
+        'approved_count': counts.get('approved', 0),
+        'rejected_count': counts.get('rejected', 0),
+        'pending_count': counts.get('pending', 0),
+        'blocked_count': counts.get('blocked', 0),
+        'average_approval_time_hours': avg_approval_time
+    }
+
 
 class GateService:
     """Service for managing workflow gates, approvals, and reviewers."""
@@ -75,7 +165,7 @@ class GateService:
         result = await self.session.execute(query)
         gates = result.scalars().all()
 
-        return [Gate.model_validate(gate) for gate in gates]
+        return [Gate.from_orm_fast(gate) for gate in gates]
 
     async def validate_gate_dependencies(
         self,
@@ -469,69 +559,19 @@ class GateService:
             for event in events
         ]
 
-    async def get_workflow_history(
-        self,
-        project_id: UUID,
-        filters: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
-        """Get workflow history for a project.
-
-        Args:
-            project_id: Project UUID
-            filters: Optional filters (event_type, date_range, gate_id)
-
-        Returns:
-            List of workflow events with pagination
-        """
-        filters = filters or {}
-
-        query = select(WorkflowEvent).where(
-            WorkflowEvent.project_id == project_id
-        )
-
-        # Apply filters
-        if 'event_type' in filters:
-            query = query.where(WorkflowEvent.event_type == filters['event_type'])
-
-        if 'gate_id' in filters:
-            query = query.where(
-                WorkflowEvent.event_metadata['gate_id'].astext == filters['gate_id']
-            )
-
-        if 'date_from' in filters:
-            query = query.where(WorkflowEvent.timestamp >= filters['date_from'])
-
-        if 'date_to' in filters:
-            query = query.where(WorkflowEvent.timestamp <= filters['date_to'])
-
-        # Apply pagination
-        offset = filters.get('offset', 0)
-        limit = min(filters.get('limit', 50), 200)  # Max 200
-
-        query = query.order_by(WorkflowEvent.timestamp.desc()).offset(offset).limit(limit)
-
-        result = await self.session.execute(query)
-        events = result.scalars().all()
-
-        return [
-            {
-                'id': str(event.id),
-                'event_type': event.event_type.value,
-                'user_id': str(event.user_id),
-                'timestamp': event.timestamp.isoformat(),
-                'from_stage': event.from_stage,
-                'to_stage': event.to_stage,
-                'metadata': event.event_metadata
-            }
-            for event in events
-        ]
-
+    @cache_aside(
+        key=lambda self, project_id: GATE_METRICS_CACHE_KEY,
+        ttl_seconds=GATE_METRICS_CACHE_TTL_SECONDS
+    )
     async def get_gate_metrics(
         self,
         project_id: UUID
     ) -> Dict[str, Any]:
         """Get gate metrics for a project.
 
+        Results are cached in Redis for GATE_METRICS_CACHE_TTL_SECONDS and
+        invalidated by the approve, reject and reset endpoints.
+
         Args:
             project_id: Project UUID
 
@@ -550,18 +590,45 @@ class GateService:
 
         counts = {status: count for status, count in status_counts}
 
-        # Calculate average approval time
-        # This requires joining with workflow_events
-        # Simplified for now
-        avg_approval_time = 0  # TODO: Calculate from events
+        return _metrics_from_counts(counts)
+
+    async def get_gate_detail(
+        self,
+        gate_id: UUID
+    ) -> Optional[Dict[str, Any]]:
+        """Get a gate with its history, reviewers and metrics in one query.
+
+        Args:
+            gate_id: Gate UUID
+
+        Returns:
+            Dict with gate, history, reviewers and metrics, or None if the
+            gate does not exist
+        """
+        result = await self.session.execute(_GATE_DETAIL_QUERY, {"gate_id": gate_id})
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        history = row.history
+        for event in history:
+            event['event_type'] = _EVENT_TYPE_VALUES.get(event['event_type'], event['event_type'])
 
         return {
-            'total_gates': sum(counts.values()),
-            'approved_count': counts.get('approved', 0),
-            'rejected_count': counts.get('rejected', 0),
-            'pending_count': counts.get('pending', 0),
-            'blocked_count': counts.get('blocked', 0),
-            'average_approval_time_hours': avg_approval_time
+            'gate': {
+                'id': row.id,
+                'template_id': row.template_id,
+                'gate_id': row.gate_id,
+                'name': row.name,
+                'stage_id': row.stage_id,
+                'criteria': row.criteria,
+                'status': row.status,
+                'sequence_number': None,
+                'created_at': row.created_at
+            },
+            'history': history,
+            'reviewers': row.reviewers,
+            'metrics': _metrics_from_counts(row.status_counts)
         }
 
     async def reset_gate(
@@ -56,13 +56,42 @@ class WorkflowService:
         if not project:
             return None
 
-        # Parse workflow_state JSONB to WorkflowState model
+        return self._parse_workflow_state(project)
+
+    @staticmethod
+    def _parse_workflow_state(project: Project) -> Optional[WorkflowState]:
+        """Parse a loaded project's workflow_state JSONB, None if uninitialized."""
         workflow_data = project.workflow_state or {}
         if not workflow_data:
             return None
 
         return WorkflowState(**workflow_data)
 
+    def available_transitions(self, workflow_state: WorkflowState) -> List[str]:
+        """
+        Get available next stages for a workflow state already in hand.
+
+        Args:
+            workflow_state: Current workflow state
+
+        Returns:
+            List of available stage IDs
+        """
+        template_name = workflow_state.stageData.get("template", self._default_template_name)
+        return self._next_stages(template_name, workflow_state.currentStage)
+
+    @staticmethod
+    def _next_stages(template_name: str, current_stage: str) -> List[str]:
+        """Look up the next stages of one stage in a workflow template."""
+        template = load_workflow_template(template_name)
+        stage = get_stage(template, current_stage)
+
+        if not stage:
+            return []
+
+        # Copy so callers cannot modify the cached template
+        return list(stage.next_stages)
+
     async def get_available_transitions(
         self,
         project_id: uuid.UUID,
@@ -82,13 +111,7 @@ class WorkflowService:
         if not workflow_state:
             return []
 
-        template = load_workflow_template(template_name)
-        stage = get_stage(template, workflow_state.currentStage)
-
-        if not stage:
-            return []
-
-        return stage.next_stages
+        return self._next_stages(template_name, workflow_state.currentStage)
 
     async def initialize_workflow(
         self,
@@ -157,7 +180,7 @@ class WorkflowService:
         if not project:
             raise ValueError(f"Project {project_id} not found")
 
-        workflow_state = await self.get_workflow_state(project_id)
+        workflow_state = self._parse_workflow_state(project)
         if not workflow_state:
             raise ValueError(f"Workflow state not initialized for project {project_id}")
 
@@ -214,7 +237,6 @@ class WorkflowService:
         self.db.add(event)
 
         await self.db.commit()
-        await self.db.refresh(project)
 
         return workflow_state
 
@@ -243,7 +265,7 @@ class WorkflowService:
         if not project:
             raise ValueError(f"Project {project_id} not found")
 
-        workflow_state = await self.get_workflow_state(project_id)
+        workflow_state = self._parse_workflow_state(project)
         if not workflow_state:
             raise ValueError(f"Workflow state not initialized for project {project_id}")
 
@@ -284,7 +306,6 @@ class WorkflowService:
         self.db.add(event)
 
         await self.db.commit()
-        await self.db.refresh(project)
 
         return workflow_state
 
@@ -313,7 +334,7 @@ class WorkflowService:
         if not project:
             raise ValueError(f"Project {project_id} not found")
 
-        workflow_state = await self.get_workflow_state(project_id)
+        workflow_state = self._parse_workflow_state(project)
         if not workflow_state:
             raise ValueError(f"Workflow state not initialized for project {project_id}")
 
@@ -354,6 +375,5 @@ class WorkflowService:
         self.db.add(event)
 
         await self.db.commit()
-        await self.db.refresh(project)
 
         return workflow_state
@@ -2,6 +2,7 @@
 Pytest configuration and fixtures for AgentLab API tests.
 """
 import asyncio
+import os
 import pytest
 from typing import AsyncGenerator, Generator
 from httpx import AsyncClient
@@ -9,9 +10,13 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 
+# Keep tests independent of any shared Redis instance
+os.environ.setdefault("CACHE_ENABLED", "false")
+
 from main import app
 from core.database import Base, get_db
 from core.config import get_settings
+from repositories.implementation_type_repository import clear_implementation_type_cache
 
 
 # Test database URL - using port 5434 from docker-compose configuration
@@ -59,6 +64,22 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture
+def sql_statements(test_engine):
+    """Record SQL statements executed on the test engine.
+
+    Use to assert query counts and catch N+1 regressions.
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+
 @pytest.fixture
 async def test_session(db_session: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
     """Alias for db_session for backward compatibility with Story 2.4 tests."""
@@ -90,6 +111,14 @@ async def test_client(override_get_db) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_reference_caches():
+    """Keep in-process reference data snapshots from leaking between tests."""
+    clear_implementation_type_cache()
+    yield
+    clear_implementation_type_cache()
+
+
 @pytest.fixture
 def test_settings():
     """Override settings for testing."""
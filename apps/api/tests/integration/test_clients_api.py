@@ -6,7 +6,8 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from tests.fixtures.factories import ClientFactory
+from repositories.client_repository import ClientRepository
+from tests.fixtures.factories import ClientFactory, ServiceFactory
 
 
 @pytest.mark.asyncio
@@ -257,4 +258,34 @@ async def test_cascade_delete_client_to_services(test_client: AsyncClient, db_se
     assert service1_after.status_code == 404
 
     service2_after = await test_client.get(f"/api/v1/services/{service2.id}")
-    assert service2_after.status_code == 404
\ No newline at end of file
+    assert service2_after.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_with_services_uses_single_eager_load(db_session: AsyncSession, sql_statements):
+    """Test that loading a client's services does not issue a query per service."""
+    client = await ClientFactory.create_async(db_session)
+    for _ in range(3):
+        await ServiceFactory.create_async(db_session, client_id=client.id)
+    db_session.expunge_all()
+    sql_statements.clear()
+
+    loaded = await ClientRepository(db_session).get_with_services(client.id)
+    assert len(loaded.services) == 3
+
+    # One SELECT for the client plus one selectinload for all its services
+    assert len(sql_statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_list_clients_single_query(test_client: AsyncClient, db_session: AsyncSession, sql_statements):
+    """Test that listing clients issues a single query regardless of row count."""
+    for _ in range(5):
+        await ClientFactory.create_async(db_session)
+    sql_statements.clear()
+
+    response = await test_client.get("/api/v1/clients")
+
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 5
+    assert len(sql_statements) == 1
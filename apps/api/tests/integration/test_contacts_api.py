@@ -261,3 +261,17 @@ async def test_pagination_contacts(test_client: AsyncClient, db_session: AsyncSe
     assert response.status_code == 200
     data = response.json()
     assert len(data["data"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_contacts_single_query(test_client: AsyncClient, db_session: AsyncSession, sql_statements):
+    """Test that listing contacts issues a single query regardless of row count."""
+    for i in range(5):
+        await ContactFactory.create_async(db_session, email=f"bulk{i}@example.com")
+    sql_statements.clear()
+
+    response = await test_client.get("/api/v1/contacts")
+
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 5
+    assert len(sql_statements) == 1
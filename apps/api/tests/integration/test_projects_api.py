@@ -428,7 +428,7 @@ async def test_assign_contact_duplicate(test_client: AsyncClient, db_session: As
         f"/api/v1/projects/{project.id}/contacts",
         json=assignment_data
     )
-    assert response.status_code == 400  # Should reject duplicate
+    assert response.status_code == 409  # Should reject duplicate
 
 
 @pytest.mark.asyncio
@@ -556,7 +556,7 @@ async def test_assign_user_category_duplicate(test_client: AsyncClient, db_sessi
         f"/api/v1/projects/{project.id}/user-categories",
         json=assignment_data
     )
-    assert response.status_code == 400  # Should reject duplicate
+    assert response.status_code == 409  # Should reject duplicate
 
 
 @pytest.mark.asyncio
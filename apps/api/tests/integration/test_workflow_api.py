@@ -427,13 +427,25 @@ class TestWorkflowHistoryAPI:
 
         # Get first page with limit 1
         response = await test_client.get(
-            f"/api/v1/projects/{test_project_data.id}/workflow/history?page=1&limit=1"
+            f"/api/v1/projects/{test_project_data.id}/workflow/history?limit=1"
         )
 
         assert response.status_code == 200
         events = response.json()
         assert len(events) == 1
 
+        # Follow the cursor to the next, older event
+        next_cursor = response.headers["X-Next-Cursor"]
+        response = await test_client.get(
+            f"/api/v1/projects/{test_project_data.id}/workflow/history",
+            params={"limit": 1, "cursor": next_cursor}
+        )
+
+        assert response.status_code == 200
+        next_events = response.json()
+        assert len(next_events) == 1
+        assert next_events[0]["id"] != events[0]["id"]
+
     async def test_get_workflow_history_project_not_found(
         self,
         test_client: AsyncClient
@@ -51,6 +51,51 @@ def temp_template_file(tmp_path, valid_template):
     return template_file
 
 
+class TestParseTemplateCached:
+    """Tests for parse_template_cached method."""
+
+    def test_unchanged_file_parsed_once(self, service, temp_template_file):
+        """Test that an unchanged file is only parsed once."""
+        with patch.object(service, "parse_template", wraps=service.parse_template) as parse:
+            first = service.parse_template_cached(temp_template_file)
+            second = service.parse_template_cached(temp_template_file)
+
+        assert parse.call_count == 1
+        assert first == second
+
+    def test_returns_independent_copies(self, service, temp_template_file):
+        """Test that mutating a result does not affect the cache."""
+        first = service.parse_template_cached(temp_template_file)
+        first["stages"].clear()
+
+        second = service.parse_template_cached(temp_template_file)
+        assert len(second["stages"]) == 8
+
+    def test_modified_file_reparsed(self, service, temp_template_file, valid_template):
+        """Test that edits on disk invalidate the cached entry."""
+        service.parse_template_cached(temp_template_file)
+
+        valid_template["version"] = "2.0.0"
+        with open(temp_template_file, "w") as f:
+            yaml.dump(valid_template, f)
+
+        assert service.parse_template_cached(temp_template_file)["version"] == "2.0.0"
+        assert len(service._parse_cache) == 1
+
+    def test_cache_size_is_bounded(self, service, tmp_path, valid_template):
+        """Test that the least recently used file is evicted past the limit."""
+        service.PARSE_CACHE_SIZE = 2
+        paths = []
+        for index in range(3):
+            path = tmp_path / f"template_{index}.yml"
+            with open(path, "w") as f:
+                yaml.dump(valid_template, f)
+            paths.append(path)
+            service.parse_template_cached(path)
+
+        assert list(service._parse_cache) == [str(p.resolve()) for p in paths[1:]]
+
+
 class TestParseTemplate:
     """Tests for parse_template method."""
 
@@ -5,9 +5,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.gate_service import GateService
+from core import cache
+from services.gate_service import GATE_METRICS_CACHE_KEY, GateService
 from models.database import WorkflowGate, GateReviewer, Contact, WorkflowEvent
 from tests.mocks.workflow.progression_engine_mock import MockWorkflowProgressionEngine
+from tests.unit.test_cache import FakeRedis
 
 
 @pytest.fixture
@@ -401,3 +403,63 @@ class TestGetGateMetrics:
         assert metrics['rejected_count'] == 1
         assert metrics['pending_count'] == 5
         assert metrics['blocked_count'] == 2
+
+    @pytest.mark.asyncio
+    async def test_metrics_share_one_cache_entry(self, gate_service, mock_session, monkeypatch):
+        """Test that metrics are cached under a single key for all projects."""
+        redis = FakeRedis()
+        monkeypatch.setattr(cache, "get_redis", lambda: redis)
+        mock_result = MagicMock()
+        mock_result.__iter__.return_value = [('approved', 2)]
+        mock_session.execute.return_value = mock_result
+
+        first = await gate_service.get_gate_metrics(uuid4())
+        second = await gate_service.get_gate_metrics(uuid4())
+
+        assert first == second
+        assert mock_session.execute.await_count == 1
+        assert list(redis.store) == [GATE_METRICS_CACHE_KEY]
+
+
+class TestGetGateDetail:
+    """Test get_gate_detail method."""
+
+    @pytest.mark.asyncio
+    async def test_gate_not_found(self, gate_service, mock_session):
+        """Test missing gate returns None."""
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        assert await gate_service.get_gate_detail(uuid4()) is None
+        mock_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_detail_from_single_row(self, gate_service, mock_session):
+        """Test the aggregated row is shaped into gate, history, reviewers and metrics."""
+        gate_id = uuid4()
+        row = MagicMock(
+            id=gate_id,
+            template_id=uuid4(),
+            gate_id="gate_1",
+            name="Gate 1",
+            stage_id="discovery",
+            criteria={},
+            status="approved",
+            created_at=None,
+            history=[{"id": "e1", "event_type": "GATE_APPROVED", "metadata": {}}],
+            reviewers=[{"id": "r1", "reviewer_role": "lead"}],
+            status_counts={"approved": 2, "pending": 1}
+        )
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = row
+        mock_session.execute.return_value = mock_result
+
+        detail = await gate_service.get_gate_detail(gate_id)
+
+        mock_session.execute.assert_awaited_once()
+        assert detail['gate']['id'] == gate_id
+        assert detail['history'][0]['event_type'] == 'gate_approved'
+        assert detail['reviewers'] == [{"id": "r1", "reviewer_role": "lead"}]
+        assert detail['metrics']['total_gates'] == 3
+        assert detail['metrics']['approved_count'] == 2
@@ -0,0 +1,16 @@
+"""
+Unit tests for audit log endpoint metadata.
+"""
+from typing import List
+
+from api.v1.audit import AuditLogEntry, AuditLogResponse, router
+
+
+def _route(path: str):
+    return next(route for route in router.routes if route.path == path)
+
+
+def test_streamed_endpoints_document_their_schema():
+    """Test that the streamed bodies keep their OpenAPI response models."""
+    assert _route("/audit-logs").responses[200]["model"] is AuditLogResponse
+    assert _route("/audit-logs/record/{record_id}").responses[200]["model"] == List[AuditLogEntry]
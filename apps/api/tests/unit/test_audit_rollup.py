@@ -0,0 +1,60 @@
+"""
+Unit tests for the audit_log_daily refresher.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.pool import NullPool
+
+from services import audit_rollup_service
+from services.audit_rollup_service import _create_lock_engine, _refresh_while_leader
+
+
+class FakeEngine:
+    """Engine whose connect() yields a single mocked connection."""
+
+    def __init__(self, acquired: bool):
+        self.conn = AsyncMock()
+        self.conn.scalar.return_value = acquired
+
+    def connect(self):
+        engine = self
+
+        class _Context:
+            async def __aenter__(self):
+                return engine.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Context()
+
+
+@pytest.mark.asyncio
+async def test_follower_skips_refresh():
+    """Test that a process without the advisory lock never refreshes."""
+    engine = FakeEngine(acquired=False)
+
+    await _refresh_while_leader(engine, 3600)
+
+    engine.conn.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_leader_waits_before_refreshing(monkeypatch):
+    """Test that the leader sleeps one interval before each refresh."""
+    engine = FakeEngine(acquired=True)
+    sleep = AsyncMock(side_effect=[None, asyncio.CancelledError()])
+    monkeypatch.setattr(audit_rollup_service.asyncio, "sleep", sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        await _refresh_while_leader(engine, 3600)
+
+    assert engine.conn.execute.await_count == 1
+    sleep.assert_awaited_with(3600)
+
+
+def test_lock_engine_does_not_pool():
+    """Test that the lock connection is not taken from a shared pool."""
+    assert isinstance(_create_lock_engine().pool, NullPool)
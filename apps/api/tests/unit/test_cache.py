@@ -0,0 +1,177 @@
+"""
+Unit tests for Redis cache helpers.
+"""
+import uuid
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from core import cache
+from core.cache import EntityCache
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio client."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def scan_iter(self, match, count=None):
+        for key in list(self.store):
+            if key.startswith(match.rstrip("*")):
+                yield key
+
+
+class BrokenRedis:
+    """Client whose every call fails as if Redis were down."""
+
+    async def mget(self, keys):
+        raise RedisConnectionError("down")
+
+    async def set(self, *args, **kwargs):
+        raise RedisConnectionError("down")
+
+    async def delete(self, *keys):
+        raise RedisConnectionError("down")
+
+    async def scan_iter(self, match, count=None):
+        raise RedisConnectionError("down")
+        yield
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "get_redis", lambda: client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_lookup_miss(fake_redis):
+    """Test that an unknown entity is neither missing nor cached."""
+    entity_cache = EntityCache("client")
+
+    assert await entity_cache.lookup(uuid.uuid4()) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_mark_missing(fake_redis):
+    """Test that a not-found ID is remembered."""
+    entity_cache = EntityCache("client")
+    entity_id = uuid.uuid4()
+
+    await entity_cache.mark_missing(entity_id)
+
+    assert await entity_cache.is_missing(entity_id)
+    assert fake_redis.store == {f"client:{entity_id}:missing": EntityCache.MISSING_MARKER}
+
+
+@pytest.mark.asyncio
+async def test_store_clears_missing_marker(fake_redis):
+    """Test that caching an entity replaces a stale missing marker."""
+    entity_cache = EntityCache("client")
+    entity_id = uuid.uuid4()
+
+    await entity_cache.mark_missing(entity_id)
+    await entity_cache.store(entity_id, b'{"name":"Acme"}')
+
+    assert await entity_cache.lookup(entity_id) == (False, b'{"name":"Acme"}')
+
+
+@pytest.mark.asyncio
+async def test_invalidate(fake_redis):
+    """Test that invalidation drops both the payload and the marker."""
+    entity_cache = EntityCache("contact")
+    entity_id = uuid.uuid4()
+
+    await entity_cache.store(entity_id, b"{}")
+    await entity_cache.invalidate(entity_id)
+
+    assert fake_redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_fails_open_when_redis_down(monkeypatch):
+    """Test that Redis errors behave like cache misses."""
+    monkeypatch.setattr(cache, "get_redis", lambda: BrokenRedis())
+    entity_cache = EntityCache("client")
+    entity_id = uuid.uuid4()
+
+    await entity_cache.mark_missing(entity_id)
+    await entity_cache.store(entity_id, b"{}")
+    await entity_cache.invalidate(entity_id)
+
+    assert await entity_cache.lookup(entity_id) == (False, None)
+    assert not await entity_cache.is_missing(entity_id)
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_is_noop(monkeypatch):
+    """Test that helpers do nothing when caching is disabled."""
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+
+    assert await cache.cache_mget("a", "b") == [None, None]
+    await cache.cache_set("a", b"1", 60)
+    await cache.cache_delete("a")
+
+
+@pytest.mark.asyncio
+async def test_cache_aside_serves_hits_from_redis(fake_redis):
+    """Test that a cached result is returned without calling the function."""
+    calls = []
+
+    @cache.cache_aside(key=lambda project_id: f"metrics:{project_id}", ttl_seconds=30)
+    async def compute(project_id):
+        calls.append(project_id)
+        return {"total": 3}
+
+    assert await compute("p1") == {"total": 3}
+    assert await compute("p1") == {"total": 3}
+    assert calls == ["p1"]
+    assert fake_redis.store == {"metrics:p1": b'{"total":3}'}
+
+
+@pytest.mark.asyncio
+async def test_cache_aside_recomputes_after_invalidation(fake_redis):
+    """Test that deleting the key forces a fresh computation."""
+    calls = []
+
+    @cache.cache_aside(key=lambda project_id: f"metrics:{project_id}", ttl_seconds=30)
+    async def compute(project_id):
+        calls.append(project_id)
+        return len(calls)
+
+    assert await compute("p1") == 1
+    await cache.cache_delete("metrics:p1")
+    assert await compute("p1") == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix_only_drops_matching_keys(fake_redis):
+    """Test that prefix invalidation leaves unrelated keys alone."""
+    fake_redis.store.update({"services:list:a": b"1", "services:list:b": b"2", "services:x": b"3"})
+
+    await cache.cache_delete_prefix("services:list:")
+
+    assert fake_redis.store == {"services:x": b"3"}
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix_fails_open(monkeypatch):
+    """Test that prefix invalidation ignores Redis failures."""
+    monkeypatch.setattr(cache, "get_redis", lambda: BrokenRedis())
+
+    await cache.cache_delete_prefix("services:list:")
@@ -0,0 +1,111 @@
+"""
+Unit tests for document list endpoints.
+"""
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from api.v1.documents import get_document_versions, list_project_documents
+from models.database import Document, DocumentVersion
+
+
+@pytest.fixture
+def mock_service():
+    """Document service with mocked version repository."""
+    service = Mock()
+    service.versions.get_by_document_id = AsyncMock()
+    service.document_exists = AsyncMock()
+    return service
+
+
+def _version(document_id):
+    now = datetime.now(timezone.utc)
+    return DocumentVersion(
+        id=uuid.uuid4(),
+        document_id=document_id,
+        version=1,
+        content="content",
+        content_hash="0" * 64,
+        change_summary=None,
+        created_by=uuid.uuid4(),
+        created_at=now
+    )
+
+
+def _document(project_id):
+    now = datetime.now(timezone.utc)
+    return Document(
+        id=uuid.uuid4(),
+        project_id=project_id,
+        name="PRD",
+        content="content",
+        content_hash="0" * 64,
+        language="en",
+        document_type="prd",
+        version=1,
+        created_at=now,
+        updated_at=now
+    )
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+class TestListProjectDocuments:
+    """Documents are streamed as a JSON array in the response schema shape."""
+
+    @pytest.mark.asyncio
+    async def test_streams_documents(self):
+        project_id = uuid.uuid4()
+        documents = [_document(project_id), _document(project_id)]
+        service = Mock()
+        service.iter_project_documents = AsyncMock(return_value=_aiter(documents))
+
+        response = await list_project_documents(project_id, None, None, 1, 100, service)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+
+        items = orjson.loads(body)
+        assert [item["id"] for item in items] == [str(d.id) for d in documents]
+        assert items[0]["documentType"] == "prd"
+        service.iter_project_documents.assert_awaited_once_with(
+            project_id=project_id, document_type=None, language=None, limit=100, offset=0
+        )
+
+
+class TestGetDocumentVersions:
+    """Existence is only checked when the version page comes back empty."""
+
+    @pytest.mark.asyncio
+    async def test_non_empty_page_skips_existence_check(self, mock_service):
+        document_id = uuid.uuid4()
+        mock_service.versions.get_by_document_id.return_value = [_version(document_id)]
+
+        response = await get_document_versions(document_id, 1, 100, mock_service)
+
+        assert response.status_code == 200
+        mock_service.document_exists.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_page_for_missing_document_is_404(self, mock_service):
+        mock_service.versions.get_by_document_id.return_value = []
+        mock_service.document_exists.return_value = False
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_document_versions(uuid.uuid4(), 1, 100, mock_service)
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_empty_page_for_existing_document(self, mock_service):
+        mock_service.versions.get_by_document_id.return_value = []
+        mock_service.document_exists.return_value = True
+
+        response = await get_document_versions(uuid.uuid4(), 1, 100, mock_service)
+
+        assert response.body == b"[]"
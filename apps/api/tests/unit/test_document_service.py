@@ -61,6 +61,19 @@ class TestContentHashGeneration:
         assert hash1 != hash2
 
 
+class TestRepositoryAccessors:
+    """Tests for the repositories exposed by the service."""
+
+    def test_repositories_share_service_session(self, document_service, mock_db):
+        """Test that version and comment repositories reuse the service's session."""
+        assert document_service.versions.db is mock_db
+        assert document_service.comments.db is mock_db
+
+    def test_comment_repository_built_once(self, document_service):
+        """Test that the comment repository is created lazily and reused."""
+        assert document_service.comments is document_service.comments
+
+
 class TestCreateDocumentWithVersion:
     """Tests for create_document_with_version method."""
 
@@ -1,8 +1,14 @@
 """
 Unit tests for document utility functions.
 """
+import hashlib
+
 import pytest
-from core.document_utils import generate_content_hash
+from core.document_utils import (
+    HASH_CHUNK_CHARS,
+    generate_content_hash,
+    generate_content_hash_stream
+)
 
 
 def test_generate_content_hash_returns_sha256():
@@ -64,3 +70,18 @@ def test_generate_content_hash_multiline():
 
     assert isinstance(hash_value, str)
     assert len(hash_value) == 64
+
+
+def test_generate_content_hash_large_content_matches_single_pass():
+    """Test that chunked hashing of large multibyte content matches a plain SHA-256."""
+    content = "é文🙂a" * HASH_CHUNK_CHARS
+
+    assert generate_content_hash(content) == hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def test_generate_content_hash_stream_matches_str_hash():
+    """Test that hashing byte chunks gives the same hash as the str version."""
+    content = "Streamed content é"
+    data = content.encode("utf-8")
+
+    assert generate_content_hash_stream([data[:5], data[5:]]) == generate_content_hash(content)
@@ -0,0 +1,100 @@
+"""
+Unit tests for cached client and contact detail endpoints.
+"""
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+
+from api.v1 import clients, contacts
+from api.v1.clients import get_client
+from api.v1.contacts import get_contact
+from core import cache
+from models.database import Client, Contact
+from models.schemas import SuccessResponse
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio client."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "get_redis", lambda: client)
+    return client
+
+
+def _body(response) -> bytes:
+    """Serialize a handler result the way the app's default response class does."""
+    return ORJSONResponse(jsonable_encoder(response)).body
+
+
+@pytest.mark.asyncio
+async def test_client_cache_hit_matches_miss(fake_redis):
+    """A cached client renders byte-for-byte like the freshly loaded one."""
+    now = datetime.now(timezone.utc)
+    client = Client(
+        id=uuid.uuid4(), name="Acme", business_domain="finance",
+        created_at=now, updated_at=now
+    )
+    repo = AsyncMock()
+    repo.get_by_id = AsyncMock(return_value=client)
+
+    miss = await get_client(client.id, repo)
+    hit = await get_client(client.id, repo)
+
+    repo.get_by_id.assert_awaited_once()
+    assert _body(hit) == _body(miss)
+
+
+@pytest.mark.asyncio
+async def test_contact_cache_hit_matches_miss(fake_redis):
+    """A cached contact renders byte-for-byte like the freshly loaded one."""
+    now = datetime.now(timezone.utc)
+    contact = Contact(
+        id=uuid.uuid4(), name="Ada", email="ada@example.com", is_active=True,
+        created_at=now, updated_at=now
+    )
+    repo = AsyncMock()
+    repo.get_by_id = AsyncMock(return_value=contact)
+
+    miss = await get_contact(contact.id, repo)
+    hit = await get_contact(contact.id, repo)
+
+    repo.get_by_id.assert_awaited_once()
+    assert _body(hit) == _body(miss)
+
+
+@pytest.mark.parametrize("router", [clients.router, contacts.router])
+def test_detail_endpoints_document_success_response(router):
+    """Endpoints returning SuccessResponse keep it as their response model."""
+    detail_routes = [route for route in router.routes if "{" in route.path]
+
+    assert detail_routes
+    assert all(route.response_model is SuccessResponse for route in detail_routes)
+
+
+@pytest.mark.parametrize("router", [clients.router, contacts.router])
+def test_list_endpoints_document_response_shape(router):
+    """List endpoints returning ORJSONResponse still document their schema."""
+    list_route = next(route for route in router.routes if "GET" in route.methods and "{" not in route.path)
+
+    assert list_route.responses[200]["model"] is SuccessResponse
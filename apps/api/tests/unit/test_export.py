@@ -0,0 +1,38 @@
+"""
+Unit tests for CSV export row formatting.
+"""
+import csv
+import io
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from api.v1.export import CLIENT_FIELDS, _format_client_csv_row
+
+
+def _client_row(name):
+    created = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    return (uuid.uuid4(), name, "finance", created, created)
+
+
+@pytest.mark.parametrize("name", [
+    "Acme",
+    "Acme, Inc.",
+    'The "Best" Co',
+    "Multi\nline",
+])
+def test_client_row_parses_like_csv_writer(name):
+    row = _client_row(name)
+    line = _format_client_csv_row(row)
+
+    parsed = next(csv.reader(io.StringIO(line)))
+
+    assert parsed == [str(row[0]), name, "finance", row[3].isoformat(), row[4].isoformat()]
+
+
+def test_client_row_ends_with_csv_line_terminator():
+    line = _format_client_csv_row(_client_row("Acme"))
+
+    assert line.endswith("\r\n")
+    assert len(next(csv.reader(io.StringIO(line)))) == len(CLIENT_FIELDS)
@@ -0,0 +1,72 @@
+"""
+Unit tests for the health check probe cache.
+"""
+import asyncio
+
+import pytest
+
+from api.v1 import health
+
+
+class CountingSession:
+    """Session stand-in that counts SELECT 1 probes."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    async def execute(self, statement):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ConnectionError("database down")
+        return self
+
+    def scalar(self):
+        return 1
+
+
+@pytest.fixture(autouse=True)
+def reset_probe_cache(monkeypatch):
+    monkeypatch.setattr(health, "_last_check", (0.0, "unknown"))
+    monkeypatch.setattr(health, "_check_lock", asyncio.Lock())
+
+
+async def test_probe_result_reused_within_ttl():
+    """Test repeated checks within the TTL hit the database once."""
+    db = CountingSession()
+
+    first = await health.health_check(db)
+    second = await health.health_check(db)
+
+    assert first["database"] == second["database"] == "healthy"
+    assert db.calls == 1
+
+
+async def test_concurrent_checks_share_one_probe():
+    """Test a burst of concurrent checks collapses into one query."""
+    db = CountingSession()
+
+    results = await asyncio.gather(*(health.health_check(db) for _ in range(10)))
+
+    assert all(r["status"] == "healthy" for r in results)
+    assert db.calls == 1
+
+
+async def test_probe_repeated_after_ttl(monkeypatch):
+    """Test an expired result triggers a fresh probe."""
+    monkeypatch.setattr(health, "HEALTH_CHECK_TTL_SECONDS", 0.0)
+    db = CountingSession()
+
+    await health.health_check(db)
+    await health.health_check(db)
+
+    assert db.calls == 2
+
+
+async def test_failed_probe_reports_unhealthy():
+    """Test database errors are reported rather than raised."""
+    result = await health.health_check(CountingSession(fail=True))
+
+    assert result["status"] == "unhealthy"
+    assert result["database"] == "unhealthy"
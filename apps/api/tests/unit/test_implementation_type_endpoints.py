@@ -0,0 +1,63 @@
+"""
+Unit tests for implementation type endpoints.
+"""
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.implementation_types import list_implementation_types
+from models.database import ImplementationType
+
+
+def _impl_type(code):
+    now = datetime.now(timezone.utc)
+    return ImplementationType(
+        id=uuid.uuid4(), code=code, name=code.title(), description=None,
+        is_active=True, created_at=now, updated_at=now
+    )
+
+
+@pytest.fixture
+def rows():
+    return [_impl_type("RAG"), _impl_type("CHATBOT")]
+
+
+async def _list(rows, is_active=True, if_none_match=None):
+    with patch("api.v1.implementation_types.ImplementationTypeRepository") as repo_cls:
+        repo_cls.return_value.list_implementation_types = AsyncMock(return_value=rows)
+        return await list_implementation_types(
+            is_active=is_active, if_none_match=if_none_match, db=AsyncMock(spec=AsyncSession)
+        )
+
+
+class TestListImplementationTypesCaching:
+    """Test ETag revalidation of the implementation type list."""
+
+    @pytest.mark.asyncio
+    async def test_response_carries_cache_headers(self, rows):
+        response = await _list(rows)
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == "public, max-age=300, stale-while-revalidate=60"
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304(self, rows):
+        etag = (await _list(rows)).headers["etag"]
+
+        response = await _list(rows, if_none_match=f'W/"other", {etag}')
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_etag_changes_with_rows_and_filter(self, rows):
+        etag = (await _list(rows)).headers["etag"]
+
+        assert (await _list(rows[:1])).headers["etag"] != etag
+        assert (await _list(rows, is_active=None)).headers["etag"] != etag
+        assert (await _list(rows, if_none_match='W/"stale"')).status_code == 200
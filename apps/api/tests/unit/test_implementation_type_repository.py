@@ -0,0 +1,66 @@
+"""
+Unit tests for the implementation type reference data snapshot.
+"""
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import repositories.implementation_type_repository as impl_repo_module
+from models.database import ImplementationType
+from repositories.implementation_type_repository import ImplementationTypeRepository
+
+
+def _impl_type(code, is_active=True):
+    return ImplementationType(id=uuid.uuid4(), code=code, name=code.title(), is_active=is_active)
+
+
+@pytest.fixture
+def rows():
+    return [_impl_type("RAG"), _impl_type("LEGACY", is_active=False)]
+
+
+@pytest.fixture
+def mock_db(rows):
+    """Session returning the given implementation types."""
+    db = AsyncMock(spec=AsyncSession)
+    db.expunge = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    db.execute.return_value = result
+    return db
+
+
+class TestImplementationTypeSnapshot:
+    """Test lookups are served from a whole-table snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_share_one_query(self, mock_db, rows):
+        repo = ImplementationTypeRepository(mock_db)
+
+        assert await repo.list_implementation_types() == [rows[0]]
+        assert await repo.list_implementation_types(is_active=None) == rows
+        assert await repo.get_implementation_type_by_id(rows[1].id) is rows[1]
+        assert await repo.get_implementation_type_by_id(uuid.uuid4()) is None
+
+        mock_db.execute.assert_awaited_once()
+        assert mock_db.expunge.call_count == len(rows)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_by_other_sessions(self, mock_db, rows):
+        await ImplementationTypeRepository(mock_db).list_implementation_types()
+
+        other_db = AsyncMock(spec=AsyncSession)
+        assert await ImplementationTypeRepository(other_db).get_implementation_type_by_id(rows[0].id) is rows[0]
+        other_db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reloads_after_ttl(self, mock_db, monkeypatch):
+        repo = ImplementationTypeRepository(mock_db)
+        await repo.list_implementation_types()
+
+        monkeypatch.setattr(impl_repo_module, "IMPLEMENTATION_TYPE_CACHE_TTL_SECONDS", 0)
+        await repo.list_implementation_types()
+
+        assert mock_db.execute.await_count == 2
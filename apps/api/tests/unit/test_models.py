@@ -5,8 +5,34 @@ import uuid
 import pytest
 from datetime import datetime
 
-from models.database import Client, Service, Project, ImplementationType
-from models.schemas import BusinessDomain, ProjectType, ProjectStatus
+import msgspec
+from pydantic import ValidationError
+
+from core.config import get_settings
+from models.database import (
+    Client,
+    Service,
+    Project,
+    ImplementationType,
+    Document,
+    Language as DBLanguage,
+    DocumentType as DBDocumentType
+)
+from models.schemas import (
+    BusinessDomain,
+    ProjectType,
+    ProjectStatus,
+    DocumentResponse,
+    DocumentType,
+    Language
+)
+from models.structs import (
+    CommentStruct,
+    DocumentStruct,
+    DocumentVersionStruct,
+    struct_projector,
+    to_structs
+)
 
 
 class TestClientModel:
@@ -188,4 +214,84 @@ class TestImplementationTypeModel:
             description=None
         )
 
-        assert impl_type.description is None
\ No newline at end of file
+        assert impl_type.description is None
+
+class TestFromORMFast:
+    """Test building response schemas from trusted ORM rows."""
+
+    @pytest.fixture
+    def document(self):
+        now = datetime.utcnow()
+        return Document(
+            id=uuid.uuid4(),
+            project_id=uuid.uuid4(),
+            name="Spec",
+            content="# Spec",
+            content_hash="abc123",
+            version=2,
+            language=DBLanguage.FRENCH,
+            document_type=DBDocumentType.PRD,
+            created_at=now,
+            updated_at=now
+        )
+
+    def test_matches_model_validate(self, document):
+        """Test fast path produces the same model as full validation."""
+        fast = DocumentResponse.from_orm_fast(document)
+
+        assert fast == DocumentResponse.model_validate(document)
+        assert fast.language is Language.FRENCH
+        assert fast.documentType is DocumentType.PRD
+
+    def test_validates_when_rows_not_trusted(self, document, monkeypatch):
+        """Test TRUST_DB_ROWS=false falls back to model_validate."""
+        monkeypatch.setattr(get_settings(), "TRUST_DB_ROWS", False)
+        document.version = "not a number"
+
+        with pytest.raises(ValidationError):
+            DocumentResponse.from_orm_fast(document)
+
+
+class TestResponseStructs:
+    """Test msgspec structs match the Pydantic response wire format."""
+
+    @pytest.fixture
+    def document(self):
+        now = datetime.utcnow()
+        return Document(
+            id=uuid.uuid4(),
+            project_id=uuid.uuid4(),
+            name="Spec",
+            content="# Spec",
+            content_hash="abc123",
+            version=2,
+            language=DBLanguage.FRENCH,
+            document_type=DBDocumentType.PRD,
+            created_at=now,
+            updated_at=now
+        )
+
+    def test_struct_encodes_like_response_model(self, document):
+        """Test struct JSON equals the response model's by-alias dump."""
+        expected = DocumentResponse.model_validate(document).model_dump(mode="json", by_alias=True)
+
+        encoded = msgspec.json.encode(struct_projector(DocumentStruct)(document))
+
+        assert msgspec.json.decode(encoded) == expected
+        assert list(msgspec.json.decode(encoded)) == list(expected)
+
+    def test_untrusted_rows_are_converted(self, document, monkeypatch):
+        """Test TRUST_DB_ROWS=false validates rows with msgspec.convert."""
+        monkeypatch.setattr(get_settings(), "TRUST_DB_ROWS", False)
+
+        structs = to_structs(DocumentStruct, [document])
+        assert structs == [struct_projector(DocumentStruct)(document)]
+
+        document.version = "not a number"
+        with pytest.raises(msgspec.ValidationError):
+            to_structs(DocumentStruct, [document])
+
+    @pytest.mark.parametrize("struct_type", [DocumentStruct, DocumentVersionStruct, CommentStruct])
+    def test_projector_built_once_per_struct(self, struct_type):
+        """Test projectors are memoized per struct type."""
+        assert struct_projector(struct_type) is struct_projector(struct_type)
@@ -0,0 +1,37 @@
+"""
+Unit tests for keyset pagination cursors.
+"""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from core.pagination import encode_cursor, decode_cursor
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes back to the original position."""
+    ts = datetime(2025, 10, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    entry_id = uuid.uuid4()
+
+    decoded_ts, decoded_id = decode_cursor(encode_cursor(ts, entry_id))
+
+    assert decoded_ts == ts
+    assert decoded_id == entry_id
+
+
+def test_cursor_is_url_safe():
+    """Test that encoded cursors can be passed as query parameters."""
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+
+    assert all(c.isalnum() or c in "-_=" for c in cursor)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "Zm9vfGJhcg=="])
+def test_invalid_cursor_rejected(cursor):
+    """Test that malformed cursors raise a 400 error."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
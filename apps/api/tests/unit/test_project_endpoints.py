@@ -0,0 +1,142 @@
+"""
+Unit tests for project endpoints.
+"""
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.projects import get_project, list_project_contacts, update_project
+from models.database import Contact, Project, ProjectContact
+from models.schemas import ProjectUpdate
+
+
+def _project():
+    now = datetime.now(timezone.utc)
+    project = Project(
+        id=uuid.uuid4(),
+        name="Project",
+        description="Description",
+        service_id=uuid.uuid4(),
+        project_type="new",
+        status="draft",
+        workflow_state={},
+        created_at=now,
+        updated_at=now
+    )
+    contact = Contact(
+        id=uuid.uuid4(), name="Ada", email="ada@example.com", is_active=True,
+        created_at=now, updated_at=now
+    )
+    project.project_contacts = [ProjectContact(
+        id=uuid.uuid4(), project_id=project.id, contact_id=contact.id,
+        contact_type="stakeholder", is_active=True, created_at=now, contact=contact
+    )]
+    project.user_category_assignments = []
+    return project
+
+
+class TestGetProject:
+    """Project detail is built from the single eager-loading query."""
+
+    @pytest.mark.asyncio
+    async def test_relationships_come_from_loaded_project(self):
+        project = _project()
+
+        with patch("api.v1.projects.ProjectRepository") as repo_cls:
+            repo = repo_cls.return_value
+            repo.get_project_by_id = AsyncMock(return_value=project)
+            repo.list_project_contacts = AsyncMock()
+            repo.list_project_user_categories = AsyncMock()
+
+            response = await get_project(project.id, AsyncMock(spec=AsyncSession))
+
+        repo.get_project_by_id.assert_awaited_once_with(project.id, include_relations=True)
+        repo.list_project_contacts.assert_not_awaited()
+        repo.list_project_user_categories.assert_not_awaited()
+        assert [c.contact.email for c in response.contacts] == ["ada@example.com"]
+        assert response.user_categories == []
+
+
+class TestListProjectContacts:
+    """The project is only looked up when no contacts come back."""
+
+    @pytest.mark.asyncio
+    async def test_non_empty_list_skips_existence_check(self):
+        project = _project()
+
+        with patch("api.v1.projects.ProjectRepository") as repo_cls:
+            repo = repo_cls.return_value
+            repo.list_project_contacts = AsyncMock(return_value=project.project_contacts)
+            repo.exists = AsyncMock()
+
+            response = await list_project_contacts(project.id, AsyncMock(spec=AsyncSession))
+
+        repo.exists.assert_not_awaited()
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_empty_list_for_missing_project_is_404(self):
+        with patch("api.v1.projects.ProjectRepository") as repo_cls:
+            repo = repo_cls.return_value
+            repo.list_project_contacts = AsyncMock(return_value=[])
+            repo.exists = AsyncMock(return_value=False)
+
+            with pytest.raises(HTTPException) as exc_info:
+                await list_project_contacts(uuid.uuid4(), AsyncMock(spec=AsyncSession))
+
+        assert exc_info.value.status_code == 404
+
+
+class TestUpdateProject:
+    """A failed update is disambiguated only after the single UPDATE."""
+
+    @pytest.mark.asyncio
+    async def test_success_skips_existence_check(self):
+        project = _project()
+
+        with patch("api.v1.projects.ProjectRepository") as repo_cls:
+            repo = repo_cls.return_value
+            repo.update_project = AsyncMock(return_value=project)
+            repo.exists = AsyncMock()
+
+            response = await update_project(
+                project.id, ProjectUpdate(name="Renamed"), AsyncMock(spec=AsyncSession)
+            )
+
+        repo.update_project.assert_awaited_once_with(project.id, {"name": "Renamed"})
+        repo.exists.assert_not_awaited()
+        assert response.id == project.id
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("project_exists, expected", [(True, 400), (False, 404)])
+    async def test_missing_row_with_type_change(self, project_exists, expected):
+        with patch("api.v1.projects.ProjectRepository") as repo_cls:
+            repo = repo_cls.return_value
+            repo.update_project = AsyncMock(return_value=None)
+            repo.exists = AsyncMock(return_value=project_exists)
+
+            with pytest.raises(HTTPException) as exc_info:
+                await update_project(
+                    uuid.uuid4(),
+                    ProjectUpdate(implementation_type_id=uuid.uuid4()),
+                    AsyncMock(spec=AsyncSession)
+                )
+
+        assert exc_info.value.status_code == expected
+
+    @pytest.mark.asyncio
+    async def test_missing_row_without_type_change_is_404(self):
+        with patch("api.v1.projects.ProjectRepository") as repo_cls:
+            repo = repo_cls.return_value
+            repo.update_project = AsyncMock(return_value=None)
+            repo.exists = AsyncMock()
+
+            with pytest.raises(HTTPException) as exc_info:
+                await update_project(uuid.uuid4(), ProjectUpdate(name="x"), AsyncMock(spec=AsyncSession))
+
+        assert exc_info.value.status_code == 404
+        repo.exists.assert_not_awaited()
@@ -2,7 +2,17 @@
 Unit tests for input sanitization utilities.
 """
 import pytest
-from core.sanitization import sanitize_html, sanitize_path, sanitize_markdown
+from core import sanitization
+from core.sanitization import (
+    SANITIZE_CACHE_MAX_LENGTH,
+    _clean_is_noop,
+    _sanitize_html,
+    _sanitize_html_cached,
+    _sanitize_markdown,
+    sanitize_html,
+    sanitize_markdown,
+    sanitize_path,
+)
 
 
 class TestHTMLSanitization:
@@ -43,6 +53,23 @@ class TestHTMLSanitization:
         result = sanitize_html(input_text)
         assert result == input_text
 
+    def test_short_input_is_memoized(self):
+        """Test that repeated short inputs are served from the cache."""
+        input_text = "<b>Cached</b> name"
+        first = sanitize_html(input_text)
+        hits = _sanitize_html_cached.cache_info().hits
+
+        assert sanitize_html(input_text) == first
+        assert _sanitize_html_cached.cache_info().hits == hits + 1
+
+    def test_long_input_bypasses_cache(self):
+        """Test that long inputs are sanitized without filling the cache."""
+        input_text = "<i>x</i>" * SANITIZE_CACHE_MAX_LENGTH
+        size = _sanitize_html_cached.cache_info().currsize
+
+        assert "<i>" not in sanitize_html(input_text)
+        assert _sanitize_html_cached.cache_info().currsize == size
+
 
 class TestPathSanitization:
     """Test path traversal sanitization."""
@@ -85,6 +112,10 @@ class TestPathSanitization:
         # Should only remove leading slash if any
         assert "safe/relative/path/file.txt" in result
 
+    def test_sanitize_dotted_name_kept(self):
+        """Test that dots not followed by a separator are kept."""
+        assert sanitize_path("docs/v1..2/notes.md") == "docs/v1..2/notes.md"
+
 
 class TestMarkdownSanitization:
     """Test markdown content sanitization."""
@@ -110,6 +141,12 @@ class TestMarkdownSanitization:
         result = sanitize_markdown(input_md)
         assert "javascript:" not in result.lower()
 
+    def test_sanitize_markdown_javascript_protocol_mixed_case(self):
+        """Test removal of javascript: protocol regardless of case."""
+        input_md = "[Click here](JavaScript:alert('xss'))"
+        result = sanitize_markdown(input_md)
+        assert "javascript:" not in result.lower()
+
     def test_sanitize_markdown_preserve_safe_tags(self):
         """Test that safe markdown HTML tags are preserved."""
         input_md = "# Header\n\n**Bold** and *italic* text.\n\n```code```"
@@ -128,3 +165,59 @@ class TestMarkdownSanitization:
         result = sanitize_markdown(input_md)
         # Should contain the markdown content
         assert "Title" in result or "markdown" in result
+
+
+class TestNh3Backend:
+    """Test that the nh3 backend stores text as the regex fallback does."""
+
+    @pytest.fixture(autouse=True)
+    def nh3_only(self, monkeypatch):
+        monkeypatch.setattr(sanitization, "nh3", pytest.importorskip("nh3"))
+        monkeypatch.setattr(sanitization, "bleach", None)
+
+    @pytest.mark.parametrize("text", ["R&D", "a < b", "a > b", "caf\xe9\xa0cr\xe8me", "Q&A <3"])
+    def test_plain_text_round_trips(self, text):
+        """Test that entities the cleaner adds are decoded again."""
+        assert _sanitize_html(text) == text
+
+    def test_surrounding_whitespace_stripped(self):
+        """Test that the value is stripped as on the regex path."""
+        assert _sanitize_html("  R&D  ") == "R&D"
+        assert _sanitize_html("  plain  ") == "plain"
+
+    def test_tags_removed(self):
+        """Test that markup is still removed."""
+        assert _sanitize_html("<b>R&D</b> <script>alert(1)</script>team") == "R&D team"
+
+    def test_entity_encoded_tags_not_decoded_into_markup(self):
+        """Test that decoding the cleaner output cannot produce tags."""
+        assert "<script>" not in _sanitize_html("&lt;script&gt;alert(1)&lt;/script&gt;")
+        assert "<script" not in _sanitize_markdown("&lt;script&gt;alert(1)&lt;/script&gt;")
+
+    def test_markdown_round_trips(self):
+        """Test that markdown syntax the cleaner escapes is restored."""
+        content = "> quote\n\nR&D: `a < b` and **bold**"
+        assert _sanitize_markdown(content) == content
+
+
+class TestCleanerFastPath:
+    """Test that the cleaner fast path only skips text the cleaner keeps."""
+
+    @pytest.mark.parametrize("char", ['\ufeff', '\x00', '\x01', '\x0b', '\x0c', '\r', '\x1f', '\xa0', '&'])
+    def test_rewritten_chars_disable_fast_path(self, char):
+        """Test that characters a cleaner rewrites are sent to the cleaner."""
+        assert not _clean_is_noop(f"{char}text")
+
+    def test_fast_path_matches_cleaner(self):
+        """Test that text accepted by the fast path is returned unchanged by the cleaner."""
+        if sanitization.nh3 is not None:
+            clean = sanitization.nh3.clean
+        elif sanitization.bleach is not None:
+            clean = sanitization.bleach.clean
+        else:
+            pytest.skip("no HTML cleaner installed")
+
+        for code in [*range(0x3000), 0xfeff]:
+            text = f"{chr(code)}a{chr(code)}"
+            if _clean_is_noop(text):
+                assert clean(text) == text, repr(text)
@@ -0,0 +1,50 @@
+"""
+Unit tests for service category and contact assignment endpoints.
+"""
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.service_categories import assign_category_to_service, assign_contact_to_service
+from models.schemas import ServiceCategoryAssignmentCreate, ServiceContactCreate
+
+
+def _db_raising(sqlstate: str) -> AsyncMock:
+    """Session whose assignment insert fails with the given SQLSTATE."""
+    db = AsyncMock(spec=AsyncSession)
+    error = IntegrityError("INSERT", {}, SimpleNamespace(sqlstate=sqlstate))
+    exists_result = MagicMock()
+    exists_result.one.return_value = (True, False)
+    db.execute.side_effect = [error, exists_result]
+    return db
+
+
+@pytest.mark.asyncio
+async def test_foreign_key_violation_is_not_found():
+    """Test that a missing referenced row becomes a 404."""
+    db = _db_raising("23503")
+    data = ServiceCategoryAssignmentCreate(service_category_id=uuid.uuid4())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await assign_category_to_service(uuid.uuid4(), data, db)
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "Service category not found"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sqlstate", ["23502", "23514"])
+async def test_other_violations_reach_global_handler(sqlstate):
+    """Test that NOT NULL and CHECK violations are re-raised unchanged."""
+    db = _db_raising(sqlstate)
+    data = ServiceContactCreate(contact_id=uuid.uuid4())
+
+    with pytest.raises(IntegrityError):
+        await assign_contact_to_service(uuid.uuid4(), data, db)
+
+    db.rollback.assert_not_awaited()
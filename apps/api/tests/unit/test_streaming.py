@@ -0,0 +1,62 @@
+"""
+Unit tests for streaming JSON helpers.
+"""
+import uuid
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+
+from core.streaming import iter_json_array
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(rows, batch_size=100):
+    return b"".join([chunk async for chunk in iter_json_array(_aiter(rows), batch_size)])
+
+
+@pytest.mark.asyncio
+async def test_empty_rows_produce_empty_array():
+    """Test that no rows yields an empty JSON array."""
+    assert await _collect([]) == b"[]"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 7])
+async def test_batches_join_into_valid_array(count):
+    """Test that chunk boundaries always produce a valid JSON array."""
+    rows = [{"n": i} for i in range(count)]
+
+    body = await _collect(rows, batch_size=2)
+
+    assert orjson.loads(body) == rows
+
+
+@pytest.mark.asyncio
+async def test_uuid_and_datetime_serialized():
+    """Test that database-native types are encoded without conversion."""
+    row_id = uuid.uuid4()
+    ts = datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+    body = await _collect([{"id": row_id, "timestamp": ts}])
+
+    assert orjson.loads(body) == [{"id": str(row_id), "timestamp": "2025-10-01T12:00:00+00:00"}]
+
+
+@pytest.mark.asyncio
+async def test_custom_encoder_used_per_batch():
+    """Test that batches go through the supplied array encoder."""
+    batches = []
+
+    def encode(batch):
+        batches.append(list(batch))
+        return orjson.dumps([item * 10 for item in batch])
+
+    chunks = [chunk async for chunk in iter_json_array(_aiter([1, 2, 3]), 2, encode=encode)]
+
+    assert orjson.loads(b"".join(chunks)) == [10, 20, 30]
+    assert batches == [[1, 2], [3]]
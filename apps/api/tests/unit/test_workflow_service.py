@@ -127,6 +127,18 @@ class TestWorkflowService:
         assert "discovery" in workflow_state.completedStages
         assert mock_db.add.called
         assert mock_db.commit.called
+        # The project is read once and not re-read after the commit
+        mock_db.execute.assert_awaited_once()
+        mock_db.refresh.assert_not_awaited()
+
+    def test_available_transitions_from_loaded_state(self, workflow_service, mock_db, mock_project):
+        """Test next stages come from the state in hand without a query."""
+        workflow_state = WorkflowState(**mock_project.workflow_state)
+
+        transitions = workflow_service.available_transitions(workflow_state)
+
+        assert "market_research" in transitions
+        mock_db.execute.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_advance_stage_invalid_transition(self, workflow_service, mock_db, mock_project):
@@ -1,6 +1,8 @@
 """
 Unit tests for workflow template configuration.
 """
+from dataclasses import FrozenInstanceError
+
 import pytest
 from core.workflow_templates import (
     load_workflow_template,
@@ -51,7 +53,7 @@ class TestWorkflowTemplates:
         assert "production_monitoring" in template.stages["deployment"].next_stages
 
         # Production monitoring is final stage
-        assert template.stages["production_monitoring"].next_stages == []
+        assert template.stages["production_monitoring"].next_stages == ()
 
     def test_template_gate_requirements(self):
         """Test gate requirements per stage."""
@@ -144,10 +146,46 @@ class TestWorkflowTemplates:
         has_cycle = detect_cycles(template)
         assert has_cycle is True
 
+    def test_detect_cycles_self_loop(self):
+        """Test cycle detection with a stage pointing at itself."""
+        template = WorkflowTemplate(
+            template_id="self_loop",
+            template_name="Self Loop Template",
+            stages={"stage1": WorkflowStage("stage1", "Stage 1", False, ["stage1"])}
+        )
+
+        assert detect_cycles(template) is True
+
+    def test_detect_cycles_deep_chain(self):
+        """Test cycle detection on a chain deeper than the recursion limit."""
+        depth = 5000
+        stages = {
+            f"s{i}": WorkflowStage(f"s{i}", f"Stage {i}", False, [f"s{i + 1}"] if i + 1 < depth else [])
+            for i in range(depth)
+        }
+        template = WorkflowTemplate(template_id="deep", template_name="Deep Template", stages=stages)
+
+        assert detect_cycles(template) is False
+
     def test_template_caching(self):
-        """Test that template loading is cached."""
+        """Test that template loading returns the shared instance."""
         template1 = load_workflow_template("bmad_method")
         template2 = load_workflow_template("bmad_method")
 
-        # Should return same object due to lru_cache
+        # Should return the same object built at import
         assert template1 is template2
+
+    def test_cached_template_stages_read_only(self):
+        """Test that the shared template's stage mapping cannot be modified."""
+        template = load_workflow_template("bmad_method")
+
+        with pytest.raises(TypeError):
+            template.stages["extra"] = template.stages["discovery"]
+
+    def test_template_stages_are_frozen(self):
+        """Test that shared stages cannot be modified and are hashable."""
+        stage = load_workflow_template("bmad_method").stages["discovery"]
+
+        with pytest.raises(FrozenInstanceError):
+            stage.gate_required = True
+        assert stage in {stage}